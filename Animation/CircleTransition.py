@@ -0,0 +1,155 @@
+import math
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPointF, QRect, QTimer, QVariantAnimation, QEasingCurve
+from PyQt6.QtGui import QPainter, QColor, QPixmap, QRegion
+
+
+class CircleTransition(QWidget):
+    """
+    The full-screen circle wipe used between pages, in one reusable overlay.
+
+    Every page used to carry its own copies of the same overlay widgets
+    (white, blue, yellow; expanding or shrinking), create fresh ones on each
+    visit and repaint the whole screen every frame. This single overlay is
+    owned by the main window and shared by all pages: expand() grows a disc
+    of any colour from the centre, shrink() closes one down, both driven by
+    a QVariantAnimation. Each frame only the ring between the old and new
+    radius is marked dirty.
+
+    The pages underneath are not repainted at all while a transition runs:
+    when it starts, the window is grabbed into a pixmap once, and the
+    overlay (opaque from then on) composites that snapshot and the disc.
+    A busy page such as the AFM plot costs the same as an empty one, and
+    the live widgets come back when the overlay is taken down.
+
+    After an expand the screen stays covered until the next shrink (or
+    stop()), so a page can hand over to the next one behind a solid colour.
+    """
+
+    WHITE = QColor(255, 255, 255)
+    BLUE = QColor(0, 36, 84)      # #002454
+    YELLOW = QColor(250, 192, 26)  # #FAC01A
+
+    FULL_RADIUS = 933  # Comfortably covers the 800x480 screen from its centre
+    EDGE_PAD = 2       # Antialiased edge pixels outside the geometric circle
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)  # Snapshot + disc cover every pixel
+        self.setGeometry(0, 0, 800, 480)  # Full screen size
+
+        self.center = QPointF(400, 240)
+        self.color = self.WHITE
+        self.radius = 0.0
+        self.hide_when_done = False
+        self.on_finished = None
+        self.snapshot = QPixmap()  # The page(s) underneath, grabbed when a transition starts
+
+        self.animation = QVariantAnimation(self)
+        self.animation.setEasingCurve(QEasingCurve.Type.Linear)
+        self.animation.valueChanged.connect(self._set_radius)
+        self.animation.finished.connect(self._on_finished)
+
+        self.delay_timer = QTimer(self)
+        self.delay_timer.setSingleShot(True)
+        self.delay_timer.timeout.connect(self.animation.start)
+        self.hide()
+
+    def expand(self, color, duration_ms, end_radius=FULL_RADIUS, on_finished=None):
+        """Grow a disc of color from nothing until it covers the screen (it stays up afterwards)"""
+        self._start(color, 0, end_radius, duration_ms, 0, False, on_finished)
+
+    def shrink(self, color, duration_ms, start_radius=FULL_RADIUS, end_radius=0, delay_ms=0, on_finished=None):
+        """Start fully covered in color and close the disc down to end_radius, then disappear"""
+        self._start(color, start_radius, end_radius, duration_ms, delay_ms, True, on_finished)
+
+    def stop(self):
+        """Cancel any running transition and take the overlay down"""
+        self.delay_timer.stop()
+        self.animation.stop()
+        self.on_finished = None
+        self.hide()
+        self.snapshot = QPixmap()
+
+    def is_running(self):
+        return self.delay_timer.isActive() or self.animation.state() == QVariantAnimation.State.Running
+
+    def _start(self, color, start, end, duration_ms, delay_ms, hide_when_done, on_finished):
+        self.delay_timer.stop()
+        self.animation.stop()
+        self.color = QColor(color)
+        self.hide_when_done = hide_when_done
+        self.on_finished = on_finished
+
+        self.radius = float(start)
+        self.snapshot = QPixmap()
+        if start <= 0:
+            self._grab_snapshot()  # Expanding: the page is all still visible, take it now
+        self.animation.setStartValue(float(start))
+        self.animation.setEndValue(float(end))
+        self.animation.setDuration(int(duration_ms))
+
+        self.raise_()
+        self.show()
+        self.update()  # New colour / starting radius: one full repaint
+        if delay_ms > 0:
+            self.delay_timer.start(int(delay_ms))
+        else:
+            self.animation.start()
+
+    def _grab_snapshot(self):
+        """Render whatever is under the overlay (once per transition)"""
+        visible = self.isVisible()
+        self.hide()  # Never capture the overlay itself
+        parent = self.parentWidget()
+        self.snapshot = parent.grab(self.geometry()) if parent is not None else QPixmap()
+        self.setVisible(visible)
+
+    def _set_radius(self, radius):
+        if self.animation.state() != QVariantAnimation.State.Running:
+            return  # Stale value emitted while the animation is being set up
+        if self.snapshot.isNull() and not self._covers_screen(radius):
+            # Shrinking: the page switched to under the cover has been laid
+            # out and painted by now, and this is the first frame showing it
+            self._grab_snapshot()
+        old, self.radius = self.radius, float(radius)
+        self.update(self._ring(old, self.radius))
+
+    def _covers_screen(self, radius):
+        corner = math.hypot(self.center.x(), self.center.y())
+        return radius >= corner + self.EDGE_PAD
+
+    def _ring(self, r1, r2):
+        """Region between two radii (padded for the antialiased edge), clipped to the screen"""
+        outer = max(r1, r2) + self.EDGE_PAD
+        inner = min(r1, r2) - self.EDGE_PAD
+        region = QRegion(self._circle_rect(outer), QRegion.RegionType.Ellipse)
+        if inner > 0:
+            region = region.subtracted(QRegion(self._circle_rect(inner), QRegion.RegionType.Ellipse))
+        return region.intersected(QRegion(self.rect()))
+
+    def _circle_rect(self, r):
+        r = int(r + 0.5)
+        return QRect(int(self.center.x()) - r, int(self.center.y()) - r, 2 * r, 2 * r)
+
+    def _on_finished(self):
+        callback, self.on_finished = self.on_finished, None
+        if self.hide_when_done:
+            self.hide()
+            self.snapshot = QPixmap()  # Back to the live page
+        if callback is not None:
+            callback()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if not self.snapshot.isNull():
+            painter.drawPixmap(0, 0, self.snapshot)
+        else:
+            painter.fillRect(self.rect(), self.color)  # Still fully covered
+        if self.radius <= 0:
+            return
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.color)
+        painter.drawEllipse(self.center, self.radius, self.radius)
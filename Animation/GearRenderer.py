@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from pathlib import Path
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import QPixmap, QPainter
+
+
+class GearRenderer(QWidget):
+    """
+    A spinning gear sprite, used by the startup animation and the main menu.
+
+    Rotating used to mean re-scaling the full-size PNG and smooth-rotating
+    it into a new pixmap on every tick. Here the sprite is scaled once per
+    widget size, and each frame just draws that pixmap under a QPainter
+    rotation about the centre (several times cheaper per frame). Scaled
+    pixmaps are kept in one cache shared by every gear, least recently used
+    first out once it passes CACHE_BYTES.
+    """
+
+    CACHE_BYTES = 16 * 1024 * 1024
+
+    _sources = {}           # Path -> full-size QPixmap
+    _scaled = OrderedDict() # (path, size) -> scaled QPixmap
+    _scaled_bytes = 0
+
+    def __init__(self, sprite_path, parent=None):
+        super().__init__(parent)
+        self.path = str(sprite_path)
+        self.angle = 0.0
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+
+        if self.path not in self._sources:
+            self._sources[self.path] = QPixmap(self.path) if Path(self.path).exists() else QPixmap()
+        self.source = self._sources[self.path]
+
+    def set_angle(self, angle):
+        """Rotate to angle (degrees, clockwise) and repaint"""
+        self.angle = angle % 360
+        self.update()
+
+    def _scaled_pixmap(self, size):
+        cls = GearRenderer
+        key = (self.path, size)
+        pixmap = cls._scaled.get(key)
+        if pixmap is not None:
+            cls._scaled.move_to_end(key)
+            return pixmap
+
+        pixmap = self.source.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                    Qt.TransformationMode.SmoothTransformation)
+        cls._scaled[key] = pixmap
+        cls._scaled_bytes += pixmap.width() * pixmap.height() * 4
+        while cls._scaled_bytes > cls.CACHE_BYTES and len(cls._scaled) > 1:
+            _, old = cls._scaled.popitem(last=False)
+            cls._scaled_bytes -= old.width() * old.height() * 4
+        return pixmap
+
+    def paintEvent(self, event):
+        size = min(self.width(), self.height())
+        if self.source.isNull() or size <= 0:
+            return
+        pixmap = self._scaled_pixmap(size)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.rotate(self.angle)
+        painter.drawPixmap(QPointF(-pixmap.width() / 2, -pixmap.height() / 2), pixmap)
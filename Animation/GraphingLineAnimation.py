@@ -1,17 +1,27 @@
 import random
 import math
+from collections import deque
+from pathlib import Path
+import numpy as np
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve, QPointF
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt6.QtGui import QPainter, QPen, QColor, QPainterPath
+from PyQt6.QtGui import QPainter, QPen, QColor, QPainterPath, QPixmap, QPolygonF
 
 
 class GraphingLineAnimation(QWidget):
     """
     Animation that shows a smooth white line moving from left to right across the screen,
     This is just a loading line to show the user the device is setting up (ensuring not states being crossed in arduino)
+
+    The geometry is built up front so a frame is cheap to paint: the wave
+    (a little over the screen plus a period, made with NumPy) is one path,
+    rendered once and slid left by wave_offset, the probe is scaled once,
+    and the line is a bounded deque.
     """
     
     animation_complete = pyqtSignal()
+
+    _probe_pixmap = None  # Probe sprite scaled to probe_scale, shared by every run
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -19,6 +29,7 @@ class GraphingLineAnimation(QWidget):
         # Set up the widget
         self.setFixedSize(800, 480)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)  # Paints every pixel, so the page underneath is left alone
         self.setStyleSheet("background-color: #002454;")
         
         # Create layout for any text content
@@ -50,10 +61,10 @@ class GraphingLineAnimation(QWidget):
         self.animation_timer.setInterval(50)  # 50 FPS for smooth animation
         
         # Line drawing properties
-        self.line_points = []
         self.current_x = 0
         self.line_speed = 15 
         self.max_points = 800 // self.line_speed
+        self.line_points = deque(maxlen=self.max_points)
         
         # Line style
         self.line_pen = QPen(QColor(255, 255, 255), 6, Qt.PenStyle.SolidLine)
@@ -89,6 +100,9 @@ class GraphingLineAnimation(QWidget):
         self.wave_frequency = 0.02
         self.wave_bottom_y = 450
         self.wave_color = QColor(255, 255, 255)
+        self.wave_pen = QPen(self.wave_color, 3, Qt.PenStyle.SolidLine)
+        self.wave_path = self.build_wave_path()
+        self.wave_pixmap, self.wave_top = self.render_wave_pixmap(self.wave_path)
         
         # Probe animation properties
         self.probe_image = None
@@ -116,7 +130,7 @@ class GraphingLineAnimation(QWidget):
         """Start the graphing line animation"""
         # Initialize line starting point in the lower line drawing area
         start_y = random.randint(self.line_area_top, self.line_area_bottom)
-        self.line_points = [QPointF(0, start_y)]
+        self.line_points = deque([QPointF(0, start_y)], maxlen=self.max_points)
         self.current_x = 0
         self.elapsed_time = 0
         
@@ -182,13 +196,9 @@ class GraphingLineAnimation(QWidget):
             # Keep Y within the line drawing area bounds
             new_y = max(self.line_area_top, min(self.line_area_bottom, new_y))
             
-            # Add new point
+            # Add new point (the deque drops the oldest beyond max_points)
             new_point = QPointF(self.current_x, new_y)
             self.line_points.append(new_point)
-            
-            # Remove old points to keep memory usage low
-            if len(self.line_points) > self.max_points:
-                self.line_points.pop(0)
         
         # Trigger redraw
         self.update()
@@ -199,19 +209,35 @@ class GraphingLineAnimation(QWidget):
         # Update probe rotation
         self.update_probe_rotation()
         
-    def generate_wave_points(self):
-        """Generate points for the moving wave at the bottom of the screen"""
-        wave_points = []
-        
-        # Generate wave points across the entire width of the screen
-        for x in range(0, 801, 2):  # Step by 2 pixels for smooth wave
-            # Calculate wave Y position using sine function
-            wave_y = self.wave_bottom_y + self.wave_amplitude * math.sin(
-                self.wave_frequency * (x + self.wave_offset)
-            )
-            wave_points.append(QPointF(x, wave_y))
-        
-        return wave_points
+    def build_wave_path(self):
+        """Build the filled wave once, long enough to slide by up to a period (plus a frame) of wave_offset"""
+        period = 2 * math.pi / self.wave_frequency
+        x = np.arange(0, 800 + period + self.wave_speed + 2, 2, dtype=float)  # Step by 2 pixels for smooth wave
+        y = self.wave_bottom_y + self.wave_amplitude * np.sin(self.wave_frequency * x)
+
+        path = QPainterPath()
+        path.addPolygon(QPolygonF([QPointF(px, py) for px, py in zip(x.tolist(), y.tolist())]))
+        # Complete the wave shape with the bottom corners and close it
+        path.lineTo(x[-1], 480)
+        path.lineTo(0, 480)
+        path.closeSubpath()
+        return path
+
+    def render_wave_pixmap(self, path):
+        """Rasterise the wave path once (antialiased); returns the strip and the y it starts at"""
+        bounds = path.boundingRect().adjusted(0, -self.wave_pen.widthF(), 0, 0).toAlignedRect()
+        top = bounds.top()
+        pixmap = QPixmap(bounds.right() + 1, 480 - top)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.wave_pen)  # Solid white fill with a white outline
+        painter.setBrush(self.wave_color)
+        painter.translate(0, -top)
+        painter.drawPath(path)
+        painter.end()
+        return pixmap, top
         
     def update_wave_animation(self):
         """Update the wave animation by moving the wave offset"""
@@ -280,6 +306,7 @@ class GraphingLineAnimation(QWidget):
     def paintEvent(self, event):
         """Custom paint event to draw the animated line, expanding circle, and moving wave"""
         painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 36, 84))  # #002454 (opaque, so no styled background is drawn)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw the moving wave at the bottom (always visible)
@@ -292,15 +319,7 @@ class GraphingLineAnimation(QWidget):
         if len(self.line_points) > 1 and not self.expanding_circle:
             # Set the line pen
             painter.setPen(self.line_pen)
-            
-            # Create a path for smooth line drawing
-            path = QPainterPath()
-            path.moveTo(self.line_points[0])
-            
-            for point in self.line_points[1:]:
-                path.lineTo(point)
-            
-            painter.drawPath(path)
+            painter.drawPolyline(QPolygonF(self.line_points))
             
             # Draw a circle at the current end point for visual effect
             if self.line_points:
@@ -316,38 +335,8 @@ class GraphingLineAnimation(QWidget):
     
     def draw_wave(self, painter):
         """Draw the moving wave at the bottom of the screen"""
-        # Set wave pen and brush
-        wave_pen = QPen(self.wave_color, 3, Qt.PenStyle.SolidLine)
-        painter.setPen(wave_pen)
-        painter.setBrush(self.wave_color)
-        
-        # Generate wave points
-        wave_points = self.generate_wave_points()
-        
-        # Create a path for the wave
-        if wave_points:
-            path = QPainterPath()
-            path.moveTo(wave_points[0])
-            
-            # Draw the wave line
-            for point in wave_points[1:]:
-                path.lineTo(point)
-            
-            # Complete the wave shape by adding bottom corners and closing the path
-            # Add bottom-right corner
-            path.lineTo(800, 480)
-            # Add bottom-left corner
-            path.lineTo(0, 480)
-            # Close the path back to the first wave point
-            path.lineTo(wave_points[0])
-            
-            # Fill the wave area with a solid white color
-            painter.setBrush(QColor(255, 255, 255))  # Solid white fill
-            painter.drawPath(path)
-            
-            # Draw the wave outline
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawPath(path)
+        # Slide the prerendered wave left by the offset: sin(f * (x + offset))
+        painter.drawPixmap(QPointF(-self.wave_offset, self.wave_top), self.wave_pixmap)
     
     def draw_probe(self, painter):
         """Draw the rotating probe with needle tip positioned on the wave surface"""
@@ -369,19 +358,11 @@ class GraphingLineAnimation(QWidget):
         painter.translate(gimbal_hole_x, gimbal_hole_y)
         painter.rotate(self.probe_rotation_angle)
         
-        # Scale the probe image
-        scaled_probe = self.probe_image.scaled(
-            int(self.probe_image.width() * self.probe_scale),
-            int(self.probe_image.height() * self.probe_scale),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
         # Draw the probe with offset so gimbal hole is at rotation center
         painter.drawPixmap(
-            -scaled_probe.width() // 2 - self.gimbal_hole_offset_x,
-            -scaled_probe.height() // 2 - self.gimbal_hole_offset_y,
-            scaled_probe
+            -self.probe_image.width() // 2 - self.gimbal_hole_offset_x,
+            -self.probe_image.height() // 2 - self.gimbal_hole_offset_y,
+            self.probe_image
         )
         
         # Restore the painter state
@@ -389,7 +370,7 @@ class GraphingLineAnimation(QWidget):
     
     def get_wave_y_at_x(self, x):
         """Get the wave Y position at a specific X coordinate"""
-        # Use the same wave calculation as generate_wave_points
+        # Use the same wave calculation as build_wave_path
         wave_y = self.wave_bottom_y + self.wave_amplitude * math.sin(
             self.wave_frequency * (x + self.wave_offset)
         )
@@ -407,19 +388,20 @@ class GraphingLineAnimation(QWidget):
             self.expand_animation_timer.stop()
     
     def load_probe_image(self):
-        """Load the probe image from the sprites folder"""
-        try:
-            from pathlib import Path
-            base_dir = Path(__file__).resolve().parent
+        """Load the probe image from the sprites folder, scaled once to probe_scale"""
+        cls = GraphingLineAnimation
+        if cls._probe_pixmap is None:
             probe_path = Path("Animation/Sprites/probe.png")
-            
-            if probe_path.exists():
-                from PyQt6.QtGui import QPixmap
-                self.probe_image = QPixmap(str(probe_path))
-            else:
-                self.probe_image = None
-        except Exception:
-            self.probe_image = None
+            probe = QPixmap(str(probe_path)) if probe_path.exists() else QPixmap()
+            if not probe.isNull():
+                probe = probe.scaled(
+                    int(probe.width() * self.probe_scale),
+                    int(probe.height() * self.probe_scale),
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            cls._probe_pixmap = probe
+        self.probe_image = cls._probe_pixmap if not cls._probe_pixmap.isNull() else None
     
     def update_probe_rotation(self):
         """Update the probe rotation animation with force-based physics"""
@@ -16,6 +16,7 @@ class HapticFeedbackAnimation(QWidget):
         # Set up the widget properties
         self.setFixedSize(800, 480)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)  # Paints every pixel, so the page underneath is left alone
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         
         # Set solid blue background matching your theme
@@ -152,6 +153,7 @@ class HapticFeedbackAnimation(QWidget):
     def paintEvent(self, event):
         """Draw the ripples with multiple concentric rings"""
         painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 36, 84))  # #002454 (opaque, so no styled background is drawn)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Draw each ripple
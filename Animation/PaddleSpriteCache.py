@@ -0,0 +1,92 @@
+from pathlib import Path
+from PyQt6.QtCore import Qt, QThread
+from PyQt6.QtGui import QImage, QPixmap, QTransform
+
+SPRITES_DIR = Path(__file__).parent / "Sprites"
+
+
+class PaddleSpriteCache(QThread):
+    """
+    Every paddle image the Power Pong transition shows, pre-rendered once.
+
+    The transition used to read, scale and rotate a PNG on every 16 ms
+    frame. Instead, the sprites are read once, and each frame is scaled to
+    SIZE and rotated in a background thread as a QImage (QPixmap may only be
+    touched on the GUI thread). The GUI turns each image into a pixmap the
+    first time it is shown, so a frame afterwards costs only a setPixmap.
+    preload() starts the shared cache at launch; the transition gets it
+    through shared().
+    """
+
+    SIZE = 400
+    ROTATION_FRAMES = 16
+    ROTATION_STEP = 5.625                              # Degrees per rotation frame (frame 1 = 0°)
+    HIT_ANGLES = [20 * k / 14 for k in range(15)]      # Paddle hit: 0-20° over 14 frames
+
+    _shared = None
+
+    @classmethod
+    def preload(cls):
+        """Start rendering in the background (call once at startup)"""
+        if cls._shared is None:
+            cls._shared = cls()
+            cls._shared.start()
+        return cls._shared
+
+    @classmethod
+    def shared(cls):
+        return cls.preload()
+
+    def __init__(self):
+        super().__init__()
+        self._images = {}   # Key -> QImage, filled by the render thread
+        self._pixmaps = {}  # Key -> QPixmap, converted on the GUI thread
+        self._side = None   # Scaled paddleSide, for angles outside HIT_ANGLES
+
+    def run(self):
+        for frame in range(1, self.ROTATION_FRAMES + 1):
+            image = self._load(f"paddle{frame}.png")
+            if image is not None:
+                self._images[("frame", frame)] = self._rotate(image, (frame - 1) * self.ROTATION_STEP)
+
+        self._side = self._load("paddleSide.png")
+        if self._side is not None:
+            for angle in self.HIT_ANGLES:
+                self._images[("side", round(angle, 2))] = self._rotate(self._side, angle)
+
+    def _load(self, filename):
+        image = QImage(str(SPRITES_DIR / filename))
+        if image.isNull():
+            return None
+        # Same pixel format a QPixmap uses, so frames look exactly as before
+        image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        return image.scaled(self.SIZE, self.SIZE, Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation)
+
+    @staticmethod
+    def _rotate(image, angle):
+        if angle == 0:
+            return image
+        transform = QTransform()
+        transform.rotate(angle)  # Positive for clockwise
+        return image.transformed(transform, Qt.TransformationMode.SmoothTransformation)
+
+    def _pixmap(self, key):
+        if key not in self._pixmaps:
+            self.wait()  # Only blocks if the transition starts before rendering is done
+            image = self._images.get(key)
+            if image is None:
+                if key[0] != "side" or self._side is None:
+                    return None
+                # An angle that was not pre-rendered: render it once now
+                image = self._images[key] = self._rotate(self._side, key[1])
+            self._pixmaps[key] = QPixmap.fromImage(image)
+        return self._pixmaps[key]
+
+    def rotation_frame(self, frame):
+        """Frame 1-16 of the closing paddle rotation, or None if the sprite is missing"""
+        return self._pixmap(("frame", frame))
+
+    def side(self, angle=0.0):
+        """The side-on paddle rotated by angle (degrees), or None if the sprite is missing"""
+        return self._pixmap(("side", round(angle, 2)))
@@ -1,9 +1,8 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPointF
-from PyQt6.QtGui import QPainter, QColor, QPixmap, QTransform
-import os
+from PyQt6.QtGui import QPainter, QColor
 import math
-from pathlib import Path
+from Animation.PaddleSpriteCache import PaddleSpriteCache
 
 class PowerPongTransitionAnimation(QWidget):
     """Power Pong transition animation with centered paddle sprite and bouncing ball"""
@@ -17,6 +16,7 @@ class PowerPongTransitionAnimation(QWidget):
         # Set up the widget properties
         self.setFixedSize(800, 480)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)  # Paints every pixel, so the page underneath is left alone
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         
         # Set solid blue background matching your theme
@@ -112,13 +112,13 @@ class PowerPongTransitionAnimation(QWidget):
         self.paddle_label = QLabel(self)
         self.paddle_label.setFixedSize(400, 400)
         
-        # Load and display the paddleSide.png sprite
-        sprite_path = os.path.join(os.path.dirname(__file__), "Sprites", "paddleSide.png")
-        if os.path.exists(sprite_path):
-            pixmap = QPixmap(sprite_path)
-            # Scaler for paddle here
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.paddle_label.setPixmap(scaled_pixmap)
+        # Paddle frames are scaled and rotated once, up front (shared between transitions)
+        self.sprites = PaddleSpriteCache.shared()
+        
+        # Display the paddleSide.png sprite
+        pixmap = self.sprites.side(0)
+        if pixmap is not None:
+            self.paddle_label.setPixmap(pixmap)
         else:
             # Fallback text if image not found
             self.paddle_label.setText("PADDLE")
@@ -472,66 +472,35 @@ class PowerPongTransitionAnimation(QWidget):
                 self.apply_paddle_rotation(0)
                 
     def apply_paddle_rotation(self, rotation_angle):
-        """Apply rotation to the current paddle image"""
-        # Load the current paddle image
-        sprite_path = os.path.join(os.path.dirname(__file__), "Sprites", "paddleSide.png")
-        if os.path.exists(sprite_path):
-            pixmap = QPixmap(sprite_path)
-            # Scale the pixmap to the specified size
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            
-            # Apply the rotation
-            transform = QTransform()
-            transform.rotate(rotation_angle)  # Positive for clockwise
-            rotated_pixmap = scaled_pixmap.transformed(transform, Qt.TransformationMode.SmoothTransformation)
-            
-            # Update the paddle image
-            self.paddle_label.setPixmap(rotated_pixmap)
+        """Show the paddle image rotated by rotation_angle (pre-rendered)"""
+        pixmap = self.sprites.side(rotation_angle)
+        if pixmap is not None:
+            self.paddle_label.setPixmap(pixmap)
         
     def load_paddle_rotation_frame(self, frame_number):
         """Load and display a specific paddle rotation frame"""
         if frame_number < 1 or frame_number > self.paddle_rotation_frames:
             return
             
-        # Construct filename (1.png, 2.png, etc.)
-        frame_filename = f"paddle{frame_number}.png"
-        sprite_path = Path(__file__).parent / "Sprites" / frame_filename
-        
-        if os.path.exists(sprite_path):
-            pixmap = QPixmap(str(sprite_path))
-            # Scale the pixmap to the specified size
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            
-            # Calculate progressive rotation: start at 0° and rotate 5.625° clockwise per frame
-            # Frame 1 = 0°, Frame 2 = 5.625°, Frame 3 = 11.25°, ..., Frame 16 = 84.375°
-            rotation_angle = (frame_number - 1) * 5.625  # Start from 0° for frame 1
-            
-            # Apply progressive rotation
-            transform = QTransform()
-            transform.rotate(rotation_angle)  # Positive for clockwise
-            rotated_pixmap = scaled_pixmap.transformed(transform, Qt.TransformationMode.SmoothTransformation)
-            
+        # Frame N is paddleN.png already rotated (frame_number - 1) * 5.625° clockwise
+        # Frame 1 = 0°, Frame 2 = 5.625°, Frame 3 = 11.25°, ..., Frame 16 = 84.375°
+        pixmap = self.sprites.rotation_frame(frame_number)
+        
+        if pixmap is not None:
             # SIMPLE MOVEMENT: Calculate new X and Y positions based on current frame
             new_x = self.paddle_start_x - ((frame_number - 1) * self.paddle_move_left_per_frame)
             new_y = self.paddle_start_y - ((frame_number - 1) * self.paddle_move_up_per_frame)
             
-            # Debug: print the movement calculation
-            print(f"Frame {frame_number}: X = {new_x} (moved {((frame_number - 1) * self.paddle_move_left_per_frame)} pixels left), Y = {new_y} (moved {((frame_number - 1) * self.paddle_move_up_per_frame)} pixels up)")
-            
             # Update BOTH the image AND position in one go
-            self.paddle_label.setPixmap(rotated_pixmap)
+            self.paddle_label.setPixmap(pixmap)
             self.paddle_label.move(int(new_x), int(new_y))  # Use both X and Y movement
             
-            # Force immediate update
-            self.paddle_label.update()
-            self.paddle_label.repaint()
-            
             # Store current position
             self.paddle_current_x = new_x
             self.paddle_current_y = new_y
         else:
             # Fallback text if image not found
-            self.paddle_label.setText(f"[{frame_filename} not found]")
+            self.paddle_label.setText(f"[paddle{frame_number}.png not found]")
             self.paddle_label.setStyleSheet("""
                 QLabel {
                     color: #FFFFFF;
@@ -14,6 +14,7 @@ class SpringDampenerAnimation(QWidget):
         # Set up the widget properties
         self.setFixedSize(800, 480)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)  # Paints every pixel, so the page underneath is left alone
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         
         # Set solid blue background matching your theme
@@ -111,3 +112,8 @@ class SpringDampenerAnimation(QWidget):
     def stop_animation(self):
         """Stop the animation"""
         self.loading_timer.stop()
+
+    def paintEvent(self, event):
+        """Draw the blue background (the widget is opaque, so no styled background is drawn)"""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(0, 36, 84))  # #002454
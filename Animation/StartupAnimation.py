@@ -1,8 +1,9 @@
 from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QSizePolicy
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QTransform
+from PyQt6.QtGui import QPixmap, QPainter, QColor
 from pathlib import Path
 import math
+from Animation.GearRenderer import GearRenderer
 
 class StartupAnimation(QWidget):
     animation_complete = pyqtSignal()
@@ -70,22 +71,13 @@ class StartupAnimation(QWidget):
         else:
             self.logo_label.setText("Logo")
         
-        # Load single gear image for rotation
-        gear_path = base_dir / "Animation" / "Sprites" / "gear1.png"
-        if gear_path.exists():
-            self.original_gear_pixmap = QPixmap(str(gear_path))
-        else:
-            self.original_gear_pixmap = QPixmap()
-        
         # Animation variables
         self.gear_size = 640  # Size of gear image - ADJUSTABLE
         self.rotation_angle = 0  # Current rotation angle in degrees
         
-        # Create gear label that will rotate around the logo
-        self.gear_label = QLabel()
-        self.gear_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.gear_label.setMinimumSize(self.gear_size, self.gear_size)
-        self.gear_label.setStyleSheet("background-color: transparent;")  # Make gear label transparent
+        # Create gear that will rotate around the logo (single gear image, scaled once per size)
+        self.gear_label = GearRenderer(base_dir / "Animation" / "Sprites" / "gear1.png")
+        self.gear_label.setFixedSize(self.gear_size, self.gear_size)
         
         # Load and display the initial gear image
         self.update_gear_rotation()
@@ -116,27 +108,7 @@ class StartupAnimation(QWidget):
     
     def update_gear_rotation(self):
         """Update the gear image with current rotation angle"""
-        if self.original_gear_pixmap.isNull():
-            return
-            
-        # Create a transform for rotation
-        transform = QTransform()
-        transform.translate(self.gear_size // 2, self.gear_size // 2)  # Move to center
-        transform.rotate(self.rotation_angle)  # Apply rotation
-        transform.translate(-self.gear_size // 2, -self.gear_size // 2)  # Move back
-        
-        # Apply the transform to create rotated gear
-        rotated_gear = self.original_gear_pixmap.scaled(
-            self.gear_size, self.gear_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        # Apply rotation transform
-        rotated_gear = rotated_gear.transformed(transform, Qt.TransformationMode.SmoothTransformation)
-        
-        # Set the rotated gear to the label
-        self.gear_label.setPixmap(rotated_gear)
+        self.gear_label.set_angle(self.rotation_angle)
     
     def paintEvent(self, event):
         """Custom paint event to draw the yellow circle overlay"""
@@ -0,0 +1,58 @@
+from collections import deque
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class CommandQueue(QObject):
+    """
+    Holds Power Pong commands until the motor can take them.
+
+    Nothing is sent while the motor is busy, setting-only commands (T)
+    included. Once it is ready, commands go out in order: a T as soon as it
+    reaches the front, a move (the motor state machine's MOVES, answered
+    with Z ... z) only after the previous move's z. While the motor is
+    busy, a speed or offset change replaces one of the same kind waiting at
+    the tail of the queue, so a run of taps sends only the latest value,
+    still in its place relative to any swing queued around it. Nothing else
+    is ever dropped.
+    """
+
+    pending_changed = pyqtSignal(int)  # Number of commands waiting
+
+    COALESCE = ("T", "O")  # Latest value wins while waiting
+
+    def __init__(self, motor, send, parent=None):
+        """motor: MotorStateMachine; send: callable that writes one command string without blocking"""
+        super().__init__(parent)
+        self.motor = motor
+        self.send = send
+        self.pending = deque()
+        motor.ready_changed.connect(self._on_ready_changed)
+
+    def __len__(self):
+        return len(self.pending)
+
+    def submit(self, text):
+        """Send now if the motor is free, otherwise queue (coalescing at the tail)"""
+        if self.pending and self.pending[-1][0] == text[0] and text[0] in self.COALESCE:
+            self.pending[-1] = text
+        else:
+            self.pending.append(text)
+        self._drain()
+        self.pending_changed.emit(len(self.pending))
+
+    def clear(self):
+        self.pending.clear()
+        self.pending_changed.emit(0)
+
+    def _on_ready_changed(self, ready):
+        if ready and self.pending:
+            self._drain()
+            self.pending_changed.emit(len(self.pending))
+
+    def _drain(self):
+        """Send queued commands until one of them starts a move"""
+        while self.pending and self.motor.ready:
+            text = self.pending.popleft()
+            if text[0] in self.motor.MOVES:
+                self.motor.command(text[0])  # Not ready until its z
+            self.send(text)
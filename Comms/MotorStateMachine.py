@@ -0,0 +1,138 @@
+import time
+from collections import deque
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class MotorStateMachine(QObject):
+    """
+    Tracks whether the Power Pong motor is free to take a new command.
+
+    The firmware brackets every motion with ``Z`` (moving) and ``z`` (idle),
+    which the dispatcher turns into motor_status_changed events. A command
+    sent from the page moves the machine to "commanded"; Z moves it to
+    "moving" and z back to "idle", at which point ready_changed(True) fires
+    straight away. Every transition is timestamped, and the time from a
+    command being sent to its z is kept per command (the last HISTORY
+    moves), so the safety timeout for a lost z follows how long that
+    command really takes instead of a fixed guess.
+
+    States:
+        locked    -> page not in Power Pong mode (before P / after M)
+        commanded -> command sent, waiting for Z
+        moving    -> Z received, waiting for z
+        idle      -> ready for the next command
+    """
+
+    ready_changed = pyqtSignal(bool)
+
+    MOVES = ("P", "O", "G", "R")  # Commands the firmware answers with Z ... z
+    HISTORY = 50                  # Measured durations kept per command
+    MIN_SAMPLES = 3               # Measurements needed before the default timeout is replaced
+    PERCENTILE = 95
+    MARGIN = 1.5                  # Timeout = MARGIN x percentile
+    MIN_TIMEOUT_MS = 500
+    MAX_TIMEOUT_MS = 15000
+
+    def __init__(self, default_timeout_ms=4000, parent=None):
+        super().__init__(parent)
+        self.default_timeout_ms = default_timeout_ms
+        self.state = "locked"
+        self.command_name = None
+        self.command_time = None
+        self.timed_out = False   # The last command's timeout fired before its z
+        self.durations = {cmd: deque(maxlen=self.HISTORY) for cmd in self.MOVES}
+        self.timeouts = {cmd: 0 for cmd in self.MOVES}   # Moves whose z never came
+        self.transitions = deque(maxlen=64)             # (perf_counter, state, command)
+
+        self.safety_timer = QTimer(self)
+        self.safety_timer.setSingleShot(True)
+        self.safety_timer.timeout.connect(self._on_timeout)
+
+    @property
+    def ready(self):
+        return self.state == "idle"
+
+    def _set_state(self, state, now=None):
+        was_ready = self.ready
+        self.state = state
+        self.transitions.append((time.perf_counter() if now is None else now, state, self.command_name))
+        if self.ready != was_ready:
+            self.ready_changed.emit(self.ready)
+
+    def command(self, cmd):
+        """A motion command was just written to the board"""
+        now = time.perf_counter()
+        self.command_name = cmd
+        self.command_time = now
+        self.timed_out = False
+        self._set_state("commanded", now)
+        self.safety_timer.start(self.timeout_ms(cmd))
+
+    def lock(self):
+        """Leaving Power Pong mode: no commands until the next P"""
+        self.safety_timer.stop()
+        self.command_name = None
+        self.timed_out = False
+        self._set_state("locked")
+
+    def on_motor_status(self, moving):
+        """Z / z event from the dispatcher"""
+        now = time.perf_counter()
+        if moving:
+            if self.state != "commanded":
+                # Z without a command from this page: lock until z all the same
+                self.command_name = None
+                self.command_time = now
+                self.safety_timer.start(self.default_timeout_ms)
+            self._set_state("moving", now)
+            return
+
+        if self.state in ("commanded", "moving"):
+            self.safety_timer.stop()
+            self._record(now)
+            self._set_state("idle", now)
+        elif self.state == "idle" and self.timed_out:
+            # Late z after the timeout: still a real duration, so the timeout grows to fit it
+            self._record(now)
+        elif self.state == "locked":
+            self._set_state("idle", now)  # Board is in Power Pong mode and ready
+
+    def _record(self, now):
+        self.timed_out = False
+        if self.command_name not in self.durations:
+            return
+        duration = now - self.command_time
+        self.durations[self.command_name].append(duration)
+        print(f"Motor {self.command_name} took {duration:.2f}s "
+              f"(timeout now {self.timeout_ms(self.command_name)} ms)")  # Debug
+
+    def _on_timeout(self):
+        if self.state not in ("commanded", "moving"):
+            return
+        if self.command_name in self.timeouts:
+            self.timeouts[self.command_name] += 1
+        self.timed_out = True
+        print(f"Motor {self.command_name}: no idle status, unlocking after timeout")  # Debug
+        self._set_state("idle")
+
+    def timeout_ms(self, cmd):
+        """Safety timeout for a command: a margin over its measured percentile once there are enough moves"""
+        measured = self.durations.get(cmd, ())
+        if len(measured) < self.MIN_SAMPLES:
+            return self.default_timeout_ms
+        ms = self.MARGIN * np.percentile(measured, self.PERCENTILE) * 1000
+        return int(min(max(ms, self.MIN_TIMEOUT_MS), self.MAX_TIMEOUT_MS))
+
+    def histogram(self, cmd, bins=10):
+        """(counts, bin edges in s) of the measured durations of one command"""
+        return np.histogram(np.asarray(self.durations.get(cmd, ()), dtype=float), bins=bins)
+
+    def stats(self, cmd):
+        """Count, median and percentile duration (s) of one command, or None before any move"""
+        measured = self.durations.get(cmd, ())
+        if not measured:
+            return None
+        return {"count": len(measured), "median": float(np.median(measured)),
+                f"p{self.PERCENTILE}": float(np.percentile(measured, self.PERCENTILE)),
+                "timeouts": self.timeouts[cmd]}
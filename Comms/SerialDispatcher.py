@@ -0,0 +1,262 @@
+import queue, threading, time
+import numpy as np
+from PyQt6.QtCore import QCoreApplication, QObject, QThread, pyqtSignal
+from Data.RingBuffer import SampleRingBuffer
+
+
+class SerialReaderThread(QThread):
+    """Background thread that runs the dispatcher's read loop"""
+
+    def __init__(self, dispatcher):
+        super().__init__(dispatcher)
+        self.dispatcher = dispatcher
+
+    def run(self):
+        self.dispatcher._read_loop()
+
+
+class SerialWriterThread(QThread):
+    """Background thread that writes queued commands to the port"""
+
+    def __init__(self, dispatcher):
+        super().__init__(dispatcher)
+        self.dispatcher = dispatcher
+
+    def run(self):
+        self.dispatcher._write_loop()
+
+
+class SerialDispatcher(QObject):
+    """
+    Single owner of the shared serial port.
+
+    Every page used to poll the port on its own timer, which meant they raced
+    each other and swallowed each other's bytes. The dispatcher is now the only
+    reader: a background thread drains the port in bulk, splits the stream into
+    lines, sorts the lines into typed messages and hands them to the pages.
+    Pages send commands with ``send`` and clear stale input with
+    ``reset_input_buffer``; none of them touch the raw port.
+
+    Message types (one per line, Arduino ``Serial.println`` adds ``\\r\\n``):
+        12.345                 -> samples ring buffer          (AFM stream)
+        Z / z                  -> motor_status_changed(bool)   (Power Pong)
+        DATA_START / DATA_END  -> data_start() / data_end()    (Spring Dampener)
+        0.100,4.385            -> swing_rows(ndarray (N, 2))   (Spring Dampener)
+        anything else          -> text_received(str)
+
+    AFM samples arrive at 100 Hz, so they are not sent one signal at a time.
+    They are written to ``self.samples``, which the AFM page drains in
+    batches. One read usually holds several samples, so each is stamped by
+    spreading the chunk evenly between the previous read and this one
+    (``time.perf_counter``), at most one device period apart. Swing
+    CSV rows are parsed a chunk at a time into one float array per signal.
+    The other messages are rare and are emitted as signals from the reader
+    thread; Qt queues them onto the GUI thread.
+
+    ``send`` queues bytes for a writer thread that does the write + flush, so
+    a page can send without ever blocking the GUI on the port. It is the only
+    way to write: everything goes out in order, from one thread. The port
+    side of ``reset_input_buffer`` is queued the same way, so a reset after
+    ``send(b"M\\n")`` clears what arrived up to the moment M went out.
+    """
+
+    motor_status_changed = pyqtSignal(bool)  # True = motor moving ('Z'), False = idle ('z')
+    data_start = pyqtSignal()
+    data_end = pyqtSignal()
+    swing_rows = pyqtSignal(object)  # float64 ndarray, shape (N, 2): time, position
+    text_received = pyqtSignal(str)
+
+    IDLE_SLEEP_S = 0.002      # Reader thread back-off when nothing is waiting
+    SAMPLE_CAPACITY = 16384   # ~160 s of AFM stream at 100 Hz
+    SAMPLE_PERIOD_S = 0.01    # AFM stream rate (100 Hz)
+    RESET_INPUT = object()    # Writer-queue marker for reset_input_buffer
+
+    def __init__(self, ser, parent=None):
+        super().__init__(parent)
+        self.ser = ser
+
+        # Bytes received after the last newline (an incomplete line)
+        self._partial = b""
+
+        # Arrival time of the last chunk that held AFM samples
+        self._last_arrival = None
+
+        # AFM samples, written by the reader thread and drained by the GUI
+        self.samples = SampleRingBuffer(self.SAMPLE_CAPACITY)
+
+        # Held while bytes are read + parsed, and while the input is reset,
+        # so a reset never lands in the middle of a chunk
+        self._lock = threading.Lock()
+        self._running = False
+        self.reader = SerialReaderThread(self)
+
+        # Commands waiting for the writer thread (None = stop, RESET_INPUT = clear the input)
+        self._outgoing = queue.Queue()
+        self.writer = SerialWriterThread(self)
+
+    def start(self):
+        """Start the reader thread"""
+        if self.reader.isRunning():
+            return
+        self._running = True
+        self.reader.start()
+        self.writer.start()
+
+        # Make sure the thread is joined even if the window is never closed
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    def stop(self):
+        """Stop the reader thread and wait for it to exit"""
+        self._running = False
+        self._outgoing.put(None)
+        self.reader.wait()
+        self.writer.wait()
+
+    # Port access for the pages. Both calls return at once: the work is queued
+    # for the writer thread and runs there in call order, so unlike a port
+    # write, nothing has reached the Arduino yet when send() returns.
+    def send(self, data: bytes):
+        """Queue bytes for the writer thread"""
+        if not self.writer.isRunning():
+            self.ser.write(data)  # Not started (yet): fall back to a direct write
+            self.ser.flush()
+            return
+        self._outgoing.put(data)
+
+    def reset_input_buffer(self):
+        """Drop everything received so far, once every command sent before this has gone out"""
+        self.samples.discard()
+        if not self.writer.isRunning():
+            self._reset_input()
+            return
+        self._outgoing.put(self.RESET_INPUT)
+
+    def _reset_input(self):
+        """Clear the OS input buffer and the partial line (held off while a chunk is parsed)"""
+        with self._lock:
+            self._partial = b""
+            self._last_arrival = None
+            try:
+                self.ser.reset_input_buffer()
+            except Exception:
+                pass
+
+    def _read_loop(self):
+        """Reader thread body: read whatever is waiting and dispatch it"""
+        while self._running:
+            try:
+                waiting = self.ser.in_waiting
+            except Exception:
+                waiting = 0  # Port went away; keep idling until stopped
+
+            if not waiting:
+                time.sleep(self.IDLE_SLEEP_S)
+                continue
+
+            with self._lock:
+                try:
+                    chunk = self.ser.read(waiting)
+                except Exception:
+                    continue
+                self.feed(chunk, time.perf_counter())
+
+    def _write_loop(self):
+        """Writer thread body: write + flush each queued command in order"""
+        while True:
+            data = self._outgoing.get()
+            if data is None:
+                return
+            if data is self.RESET_INPUT:
+                self._reset_input()
+                continue
+            try:
+                self.ser.write(data)
+                self.ser.flush()
+            except Exception as e:
+                print(f"Serial write failed: {e}")  # Debug
+
+    def feed(self, chunk: bytes, arrival=None):
+        """Split raw bytes into lines and dispatch every complete one"""
+        if arrival is None:
+            arrival = time.perf_counter()
+
+        data = self._partial + chunk
+        lines = data.split(b"\n")
+        self._partial = lines.pop()  # Last element is the unterminated remainder
+
+        samples = []
+        rows = []  # Consecutive CSV rows, parsed together
+        for raw in lines:
+            line = raw.decode("utf-8", errors="ignore").strip()
+            if not line:
+                continue
+            if line.count(",") == 1:
+                rows.append(line.split(","))
+                continue
+            if rows:
+                self._dispatch_rows(rows)  # Keep rows ordered against DATA_END etc.
+                rows = []
+            value = self._dispatch_line(line)
+            if value is not None:
+                samples.append(value)
+
+        if rows:
+            self._dispatch_rows(rows)
+        if samples:
+            self.samples.push_many(self._spread_arrival(arrival, len(samples)), samples)
+            self._last_arrival = arrival
+
+    def _spread_arrival(self, arrival, n):
+        """Per-sample times for n samples read at ``arrival`` (the last one lands on it)"""
+        start = arrival - n * self.SAMPLE_PERIOD_S  # After an idle gap, assume device rate
+        if self._last_arrival is not None:
+            start = max(start, self._last_arrival)
+        return start + np.arange(1, n + 1) * ((arrival - start) / n)
+
+    def _dispatch_rows(self, rows):
+        """Parse a batch of (time, position) CSV rows in one go and emit them together"""
+        try:
+            parsed = np.array(rows, dtype=np.float64)
+        except ValueError:
+            # Something in the batch is not numeric (e.g. the CSV header) - sort row by row
+            good = []
+            for fields in rows:
+                try:
+                    good.append((float(fields[0]), float(fields[1])))
+                except ValueError:
+                    self.text_received.emit(",".join(fields))
+            parsed = np.array(good, dtype=np.float64).reshape(-1, 2)
+        if len(parsed):
+            self.swing_rows.emit(parsed)
+
+    def _dispatch_line(self, line: str):
+        """Classify a single line; returns the value for AFM samples, emits everything else"""
+        if line == "Z":
+            self.motor_status_changed.emit(True)
+            return None
+        if line == "z":
+            self.motor_status_changed.emit(False)
+            return None
+        if line == "DATA_START":
+            self.data_start.emit()
+            return None
+        if line == "DATA_END":
+            self.data_end.emit()
+            return None
+
+        # Lines with other comma counts are not swing rows
+        if "," in line:
+            self.text_received.emit(line)
+            return None
+
+        # Plain numeric samples (AFM angle stream)
+        try:
+            value = float(line)
+        except ValueError:
+            self.text_received.emit(line)
+            return None
+        if not np.isfinite(value):
+            return None
+        return value
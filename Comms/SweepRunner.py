@@ -0,0 +1,160 @@
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from Data.SwingCollector import SwingCollector
+from Data.SwingAnalysis import analyze_step
+
+
+class SweepRunner(QObject):
+    """
+    Runs a list of (K, D) Spring Dampener experiments back to back, unattended.
+
+    For each pair: send K and D, send Q, collect the DATA_START ... DATA_END
+    block from the dispatcher, analyse it and move on. The firmware logs for
+    30 s, but most swings settle within a few seconds, so once the trace has
+    been still for SETTLE_WINDOW rows the runner sends a second Q. The
+    firmware handles that Q like the first one (DATA_START, clock reset to
+    0), then logs one ``0.0,<pos>`` row with the arm heading home and sends
+    DATA_END. Rows after the second Q are ignored, so the trace ends at the
+    settle. After every run the arm swings back to zero, so the next run
+    starts after ``rest_s``.
+
+    State machine:
+        idle -> starting (K/D/Q sent, waiting for DATA_START)
+             -> collecting (rows arriving, watching for the settle)
+             -> resting (arm returning) -> starting (next pair) ... -> idle
+    A run that never starts or never ends is recorded as failed and skipped.
+    """
+
+    run_started = pyqtSignal(int, float, float)  # index, K, D
+    rows_received = pyqtSignal()                 # New rows in self.collector
+    run_finished = pyqtSignal(int, object)       # index, result dict
+    sweep_finished = pyqtSignal(bool)            # True if it ran to the end, False if stopped
+
+    START_TIMEOUT_MS = 2000    # DATA_START should follow Q almost at once
+    END_TIMEOUT_MS = 35000     # The firmware always ends a log after 30 s
+    SETTLE_WINDOW = 15         # Rows (1.5 s at 10 Hz) that must be still before stopping early
+    SETTLE_STD = 0.5           # Degrees
+    MIN_MOVE_DEG = 5.0         # Don't call a run settled before it has moved
+
+    def __init__(self, dispatcher, rest_s=3.0, parent=None):
+        super().__init__(parent)
+        self.dispatcher = dispatcher
+        self.rest_ms = int(rest_s * 1000)
+        self.collector = SwingCollector()
+
+        self.pairs = []
+        self.index = -1
+        self.state = "idle"
+        self.stopped_early = False
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._on_timeout)
+
+        dispatcher.data_start.connect(self._on_data_start)
+        dispatcher.data_end.connect(self._on_data_end)
+        dispatcher.swing_rows.connect(self._on_rows)
+
+    def is_running(self):
+        return self.state != "idle"
+
+    def start(self, pairs):
+        """Start a sweep over an iterable of (K, D) pairs"""
+        if self.is_running():
+            return
+        self.pairs = [(float(K), float(D)) for K, D in pairs]
+        self.index = -1
+        self._next_run()
+
+    def stop(self):
+        """Abort the sweep (ends the current log if one is running)"""
+        if not self.is_running():
+            return
+        if self.state == "collecting" and not self.stopped_early:
+            self._write("Q\n")  # Second Q: stop logging and send the arm home
+        self.timer.stop()
+        self.state = "idle"
+        self.sweep_finished.emit(False)
+
+    def _write(self, text):
+        self.dispatcher.send(text.encode())
+
+    def _next_run(self):
+        self.index += 1
+        if self.index >= len(self.pairs):
+            self.state = "idle"
+            self.sweep_finished.emit(True)
+            return
+
+        K, D = self.pairs[self.index]
+        self.collector.clear()
+        self.stopped_early = False
+        self.state = "starting"
+        self.run_started.emit(self.index, K, D)
+
+        self.dispatcher.reset_input_buffer()
+        self._write(f"K{K:.1f}\n")
+        self._write(f"D{int(D)}\n")
+        self._write("Q\n")
+        self.timer.start(self.START_TIMEOUT_MS)
+
+    def _on_data_start(self):
+        if self.state != "starting":
+            return
+        self.collector.clear()
+        self.state = "collecting"
+        self.timer.start(self.END_TIMEOUT_MS)
+
+    def _on_rows(self, rows):
+        if self.state != "collecting" or self.stopped_early:
+            return  # After the second Q only the firmware's 0.0 row is left; keep it out
+        self.collector.extend(rows)
+        self.rows_received.emit()
+        if self._settled():
+            self.stopped_early = True
+            self._write("Q\n")  # Ends the log now instead of after 30 s
+
+    def _settled(self):
+        """True once the swing has moved and the last SETTLE_WINDOW rows are still"""
+        positions = self.collector.positions
+        if len(positions) < self.SETTLE_WINDOW:
+            return False
+        if np.ptp(positions) < self.MIN_MOVE_DEG:
+            return False
+        return positions[-self.SETTLE_WINDOW:].std() < self.SETTLE_STD
+
+    def _on_data_end(self):
+        if self.state != "collecting":
+            return
+        self._finish_run("ok")
+
+    def _on_timeout(self):
+        if self.state == "starting":
+            self._finish_run("no data")
+        elif self.state == "collecting":
+            # No Q here: if the firmware already ended the log, Q would start a new one
+            self._finish_run("timeout")
+        elif self.state == "resting":
+            self._next_run()
+
+    def _finish_run(self, status):
+        K, D = self.pairs[self.index]
+        data = self.collector.view()
+        metrics = analyze_step(data[:, 0], data[:, 1]) if len(data) else None
+        result = {
+            "K": K,
+            "D": D,
+            "status": status,
+            "stopped_early": self.stopped_early,
+            "duration": float(data[-1, 0] - data[0, 0]) if len(data) else 0.0,
+            "metrics": metrics,
+            "data": data.copy(),
+        }
+        self.run_finished.emit(self.index, result)
+
+        if self.index + 1 >= len(self.pairs):
+            self._next_run()  # Last run: no need to wait for the arm
+            return
+        # Let the arm swing back to zero before the next run
+        self.state = "resting"
+        self.timer.start(self.rest_ms)
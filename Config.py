@@ -4,4 +4,30 @@ BOARDLESS = False # Set to false if board is present (Important!)
 
 DEVICE = "Windows" # Options: Mac, Linux, Windows (if using Raspberry Pi, use Linux)
 
-DEV_MODE = True # Set to true to show escape button in main menu, false to hide it (for developer purposes)
\ No newline at end of file
+DEV_MODE = True # Set to true to show escape button in main menu, false to hide it (for developer purposes)
+
+AFM_MAX_FPS = 30 # Max redraw rate of the AFM live graph (lower it on weak boards to save CPU; samples are never dropped)
+
+AFM_MAX_TRIALS = 10 # Number of trials (rows) on the topography map
+
+AFM_TRIAL_SAMPLES = 300 # Columns per trial: each recorded trial is resampled to exactly this many evenly spaced values
+
+AFM_TRIAL_FILE = "trials.bin" # Binary trial store shared by the AFM and Topography pages (an old trials.txt is imported automatically)
+
+POWER_PONG_MOTOR_TIMEOUT_MS = 4000 # Power Pong: unlock the buttons after this long if the motor's idle status (z) is lost, until real move times have been measured
+
+SPRING_PLANT_GAIN = 3.0 # Spring Dampener model: arm acceleration per motor volt (rad/s^2 per V), rough estimate for the gain preview
+
+SPRING_PLANT_FRICTION = 0.5 # Spring Dampener model: viscous friction of the arm (1/s), rough estimate for the gain preview
+
+SPRING_TARGET_SETTLING_S = 2.0 # Spring Dampener auto-tune: default settling time target (s) for recommended gains
+
+SPRING_SWEEP_K = [5.0, 10.0, 15.0, 20.0] # Spring Dampener sweep: spring constants to try (every K is run with every D)
+
+SPRING_SWEEP_D = [0, 1, 2, 3] # Spring Dampener sweep: damping gains to try
+
+SPRING_SWEEP_REST_S = 3.0 # Spring Dampener sweep: pause between runs while the arm swings back to zero
+
+SPRING_SWEEP_FILE = "sweepResults.csv" # Spring Dampener sweep: one summary row per run, kept across restarts
+
+SPRING_HISTORY_FILE = "swingHistory.bin" # Spring Dampener: binary store of every swing this session (started fresh on launch)
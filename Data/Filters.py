@@ -0,0 +1,205 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class DeadZone:
+    """Snap values within +/- threshold of zero to exactly zero (stateless)"""
+
+    name = "Dead Zone"
+
+    def __init__(self, threshold=0.01):
+        self.threshold = threshold
+
+    def process(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(np.abs(x) < self.threshold, 0.0, x)
+
+    def prime(self, value):
+        pass
+
+    def reset(self):
+        pass
+
+
+class LowPass:
+    """
+    Single-pole IIR low-pass: y[n] = (1 - alpha) * y[n-1] + alpha * x[n].
+
+    The recursion is solved in closed form one block at a time,
+        y[k] = d^(k+1) * y[-1] + alpha * d^k * cumsum(x[j] / d^j)    (d = 1 - alpha)
+    so a batch is a handful of NumPy operations instead of a Python loop. The
+    block length is kept short enough that d^k never underflows.
+    """
+
+    name = "Low-pass"
+
+    def __init__(self, alpha=0.2, initial=0.0):
+        self.alpha = float(alpha)
+        self.y = float(initial)
+
+        decay = 1.0 - self.alpha
+        if decay <= 0.0:
+            self.block = None  # alpha == 1: output is the input
+        else:
+            # Keep decay**block above ~1e-200
+            self.block = int(max(1, min(1024, -200 / np.log10(decay)))) if decay < 1.0 else 1024
+            self.powers = decay ** np.arange(self.block)
+
+    def process(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        if len(x) == 0:
+            return x.copy()
+        if self.block is None:
+            self.y = float(x[-1])
+            return x.copy()
+
+        decay = 1.0 - self.alpha
+        out = np.empty_like(x)
+        for start in range(0, len(x), self.block):
+            chunk = x[start:start + self.block]
+            p = self.powers[:len(chunk)]
+            out[start:start + len(chunk)] = p * (decay * self.y + self.alpha * np.cumsum(chunk / p))
+            self.y = float(out[start + len(chunk) - 1])
+        return out
+
+    def prime(self, value):
+        self.y = float(value)
+
+    def reset(self):
+        self.y = 0.0
+
+
+class MovingMedian:
+    """Causal moving median over the last ``window`` samples"""
+
+    name = "Median"
+
+    def __init__(self, window=9):
+        self.window = int(window)
+        self.history = np.zeros(self.window - 1)
+
+    def process(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        if len(x) == 0:
+            return x.copy()
+        padded = np.concatenate((self.history, x))
+        self.history = padded[len(padded) - (self.window - 1):].copy()
+        return np.median(sliding_window_view(padded, self.window), axis=1)
+
+    def prime(self, value):
+        self.history[:] = value
+
+    def reset(self):
+        self.history[:] = 0.0
+
+
+class SavitzkyGolay:
+    """
+    Causal Savitzky-Golay smoother.
+
+    Fits a polynomial of ``order`` to the last ``window`` samples and takes its
+    value at the newest one. The fit is linear in the samples, so it reduces to
+    one FIR kernel that is applied to the whole batch with a single matmul.
+    """
+
+    name = "Savitzky-Golay"
+
+    def __init__(self, window=21, order=2):
+        self.window = int(window)
+        self.order = int(order)
+        positions = np.arange(-(self.window - 1), 1, dtype=np.float64)
+        vander = np.vander(positions, self.order + 1, increasing=True)
+        self.kernel = np.linalg.pinv(vander)[0]  # Row that yields the constant term (value at 0)
+        self.history = np.zeros(self.window - 1)
+
+    def process(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        if len(x) == 0:
+            return x.copy()
+        padded = np.concatenate((self.history, x))
+        self.history = padded[len(padded) - (self.window - 1):].copy()
+        return sliding_window_view(padded, self.window) @ self.kernel
+
+    def prime(self, value):
+        self.history[:] = value
+
+    def reset(self):
+        self.history[:] = 0.0
+
+
+class Kalman1D:
+    """
+    1-D Kalman filter for a slowly wandering value (random-walk model).
+
+    With constant noise variances the gain does not depend on the data and
+    settles to a fixed value after a few samples. Until then the update runs
+    per sample; after that it is the same first-order recursion as LowPass
+    with alpha = steady-state gain, and is vectorised the same way.
+    """
+
+    name = "Kalman"
+
+    def __init__(self, process_var=1e-3, measurement_var=2e-2, initial=0.0):
+        self.q = float(process_var)
+        self.r = float(measurement_var)
+
+        # Steady state of the predicted variance: P^2 - qP - qr = 0
+        p_prior = (self.q + np.sqrt(self.q ** 2 + 4 * self.q * self.r)) / 2
+        self.steady_gain = p_prior / (p_prior + self.r)
+        self.steady = LowPass(self.steady_gain)
+
+        self.prime(initial)
+        self.p = self.r  # Start uncertain so the first samples are trusted
+
+    def process(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        out = np.empty_like(x)
+        i = 0
+        # Converging: exact per-sample update
+        while i < len(x) and not self._converged():
+            p_prior = self.p + self.q
+            gain = p_prior / (p_prior + self.r)
+            self.y += gain * (x[i] - self.y)
+            self.p = (1 - gain) * p_prior
+            out[i] = self.y
+            i += 1
+        # Converged: constant-gain recursion, vectorised
+        if i < len(x):
+            self.steady.prime(self.y)
+            out[i:] = self.steady.process(x[i:])
+            self.y = self.steady.y
+        return out
+
+    def _converged(self):
+        p_prior = self.p + self.q
+        return abs(p_prior / (p_prior + self.r) - self.steady_gain) < 1e-6
+
+    def prime(self, value):
+        self.y = float(value)
+
+    def reset(self):
+        self.prime(0.0)
+        self.p = self.r
+
+
+class FilterChain:
+    """Runs a batch through several filters in order, keeping each one's state"""
+
+    def __init__(self, filters, name=None):
+        self.filters = list(filters)
+        self.name = name or " + ".join(f.name for f in self.filters)
+
+    def process(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        for f in self.filters:
+            x = f.process(x)
+        return x
+
+    def prime(self, value):
+        """Start every stage as if it had been sitting at ``value`` (no jump when switching)"""
+        for f in self.filters:
+            f.prime(value)
+
+    def reset(self):
+        for f in self.filters:
+            f.reset()
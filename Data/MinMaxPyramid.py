@@ -0,0 +1,133 @@
+import numpy as np
+
+
+class GrowableArray:
+    """1-D float array with amortised O(1) appends and zero-copy views"""
+
+    def __init__(self, capacity=4096):
+        self.data = np.empty(int(capacity), dtype=np.float64)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        need = self.n + len(values)
+        if need > len(self.data):
+            grown = np.empty(max(need, 2 * len(self.data)), dtype=np.float64)
+            grown[:self.n] = self.data[:self.n]
+            self.data = grown
+        self.data[self.n:need] = values
+        self.n = need
+
+    def view(self):
+        return self.data[:self.n]
+
+    def clear(self):
+        self.n = 0
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution min/max summary of a growing (t, y) series.
+
+    Level 0 holds the raw samples. Each level above it merges FACTOR buckets of
+    the level below into one bucket that keeps its start time and the min and
+    max inside it. Levels are extended incrementally as samples arrive, so the
+    cost of an append is proportional to the batch, not to the history.
+
+    ``query`` picks the finest level that fits the requested number of points
+    and returns an interleaved min/max polyline, so zooming out to a whole
+    session draws about as many vertices as there are pixels while every peak
+    is still visible.
+    """
+
+    FACTOR = 4
+
+    def __init__(self):
+        self.t = [GrowableArray()]     # Bucket start time, per level
+        self.lo = [GrowableArray()]    # Bucket min, per level (level 0 = raw values)
+        self.hi = [None]               # Bucket max, per level (level 0 has no separate max)
+
+    def __len__(self):
+        return len(self.t[0])
+
+    def clear(self):
+        self.__init__()
+
+    def extend(self, t, y):
+        """Append a batch of samples (t must be non-decreasing)"""
+        if len(t) == 0:
+            return
+        self.t[0].extend(t)
+        self.lo[0].extend(y)
+
+        level = 1
+        while True:
+            src_n = len(self.t[level - 1])
+            if src_n < self.FACTOR:
+                break
+            if level == len(self.t):
+                self.t.append(GrowableArray())
+                self.lo.append(GrowableArray())
+                self.hi.append(GrowableArray())
+
+            done = len(self.t[level])
+            ready = src_n // self.FACTOR
+            if ready > done:
+                a, b = done * self.FACTOR, ready * self.FACTOR
+                src_t = self.t[level - 1].view()[a:b].reshape(-1, self.FACTOR)
+                src_lo = self.lo[level - 1].view()[a:b].reshape(-1, self.FACTOR)
+                src_hi = src_lo if level == 1 else self.hi[level - 1].view()[a:b].reshape(-1, self.FACTOR)
+                self.t[level].extend(src_t[:, 0])
+                self.lo[level].extend(src_lo.min(axis=1))
+                self.hi[level].extend(src_hi.max(axis=1))
+            level += 1
+
+    def time_span(self):
+        """(first, last) sample time, or None while empty"""
+        if len(self) == 0:
+            return None
+        raw_t = self.t[0].view()
+        return raw_t[0], raw_t[-1]
+
+    def query(self, t0, t1, max_points):
+        """Polyline (x, y) covering [t0, t1] with at most about max_points vertices"""
+        if len(self) == 0:
+            return np.empty(0), np.empty(0)
+
+        # Pick the finest level whose bucket count (2 vertices each) fits
+        raw_t = self.t[0].view()
+        raw_count = np.searchsorted(raw_t, t1, "right") - np.searchsorted(raw_t, t0, "left")
+        level = 0
+        while level + 1 < len(self.t) and raw_count * (2 if level else 1) > max_points:
+            level += 1
+            raw_count = raw_count // self.FACTOR
+
+        # Walk down from the chosen level so the incomplete tail of each level
+        # is filled in from the finer one below it
+        xs, ys = [], []
+        covered = 0  # Raw samples already summarised by coarser levels
+        for lvl in range(level, -1, -1):
+            size = self.FACTOR ** lvl
+            first = covered // size
+            lvl_t = self.t[lvl].view()[first:]
+            if len(lvl_t):
+                i0 = max(0, np.searchsorted(lvl_t, t0, "right") - 1)
+                i1 = np.searchsorted(lvl_t, t1, "right")
+                if i1 > i0:
+                    seg_t = lvl_t[i0:i1]
+                    seg_lo = self.lo[lvl].view()[first + i0:first + i1]
+                    if lvl == 0:
+                        xs.append(seg_t)
+                        ys.append(seg_lo)
+                    else:
+                        seg_hi = self.hi[lvl].view()[first + i0:first + i1]
+                        xs.append(np.repeat(seg_t, 2))
+                        ys.append(np.column_stack((seg_lo, seg_hi)).ravel())
+            covered = len(self.t[lvl]) * size
+
+        if not xs:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(xs), np.concatenate(ys)
@@ -0,0 +1,140 @@
+import numpy as np
+
+
+class SampleRingBuffer:
+    """
+    Preallocated (timestamp, value) ring buffer between one producer and one consumer.
+
+    The serial reader thread is the only writer and the GUI thread is the only
+    reader. No lock is needed: the producer fills the slots first and only then
+    bumps ``write_count``, and the consumer only ever moves its own
+    ``read_count``. If the consumer falls a full lap behind, the oldest samples
+    are dropped and counted in ``overruns`` instead of blocking the producer.
+    """
+
+    def __init__(self, capacity=16384):
+        self.capacity = int(capacity)
+        self.t = np.zeros(self.capacity, dtype=np.float64)
+        self.v = np.zeros(self.capacity, dtype=np.float64)
+
+        self.write_count = 0  # Samples ever written (producer only)
+        self.read_count = 0   # Samples ever consumed (consumer only)
+        self.overruns = 0     # Samples overwritten before the consumer got to them
+
+    # Producer side (reader thread)
+    def push(self, t, value):
+        """Write one sample"""
+        i = self.write_count % self.capacity
+        self.t[i] = t
+        self.v[i] = value
+        self.write_count += 1
+
+    def push_many(self, t, values):
+        """Write a batch of samples (``t`` is one timestamp per sample, or one for all)"""
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return
+        t = np.broadcast_to(np.asarray(t, dtype=np.float64), values.shape)
+        if n > self.capacity:
+            # Only the newest lap can survive anyway
+            skipped = n - self.capacity
+            values = values[skipped:]
+            t = t[skipped:]
+            self.write_count += skipped
+            n = self.capacity
+
+        start = self.write_count % self.capacity
+        first = min(n, self.capacity - start)
+        self.t[start:start + first] = t[:first]
+        self.v[start:start + first] = values[:first]
+        if first < n:
+            self.t[:n - first] = t[first:]
+            self.v[:n - first] = values[first:]
+
+        # Publish only after the slots are filled
+        self.write_count += n
+
+    # Consumer side (GUI thread)
+    def read_new(self):
+        """Return copies of every (t, value) written since the last call"""
+        end = self.write_count
+        start = self.read_count
+        if end - start > self.capacity:
+            self.overruns += end - start - self.capacity
+            start = end - self.capacity
+
+        t = self._copy_range(self.t, start, end)
+        v = self._copy_range(self.v, start, end)
+
+        # The producer may have lapped us while we were copying
+        lapped = self.write_count - self.capacity - start
+        if lapped > 0:
+            self.overruns += lapped
+            t, v = t[lapped:], v[lapped:]
+
+        self.read_count = end
+        return t, v
+
+    def discard(self):
+        """Skip everything written so far (used when the stream is reset)"""
+        self.read_count = self.write_count
+
+    def _copy_range(self, arr, start, end):
+        n = end - start
+        if n <= 0:
+            return np.empty(0, dtype=arr.dtype)
+        i = start % self.capacity
+        if i + n <= self.capacity:
+            return arr[i:i + n].copy()
+        return np.concatenate((arr[i:], arr[:i + n - self.capacity]))
+
+
+class PlotBuffer:
+    """
+    Fixed-capacity (x, y) window for live plots.
+
+    Every sample is written twice, at slot ``i`` and ``i + capacity`` of arrays
+    twice the capacity. That way the newest ``count`` samples are always one
+    contiguous slice, so ``view()`` hands pyqtgraph zero-copy views in order
+    and the cost per frame stays the same however long the page stays open.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = int(capacity)
+        self.x = np.zeros(2 * self.capacity, dtype=np.float64)
+        self.y = np.zeros(2 * self.capacity, dtype=np.float64)
+        self.head = 0   # Next slot to write, in [0, capacity)
+        self.count = 0  # Valid samples, at most capacity
+
+    def __len__(self):
+        return self.count
+
+    def extend(self, xs, ys):
+        """Append a batch, dropping the oldest samples once full"""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        n = len(xs)
+        if n == 0:
+            return
+        if n > self.capacity:
+            xs, ys = xs[-self.capacity:], ys[-self.capacity:]
+            n = self.capacity
+
+        idx = (self.head + np.arange(n)) % self.capacity
+        self.x[idx] = xs
+        self.x[idx + self.capacity] = xs
+        self.y[idx] = ys
+        self.y[idx + self.capacity] = ys
+
+        self.head = (self.head + n) % self.capacity
+        self.count = min(self.capacity, self.count + n)
+
+    def view(self):
+        """Oldest-to-newest (x, y) as views into the buffer (do not modify)"""
+        start = self.head + self.capacity - self.count
+        return self.x[start:start + self.count], self.y[start:start + self.count]
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
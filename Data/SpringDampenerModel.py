@@ -0,0 +1,187 @@
+import math
+import numpy as np
+from Data.SwingAnalysis import STEP_DEG
+
+
+class SpringDampenerModel:
+    """
+    Digital twin of the Spring Dampener demo.
+
+    Controller (as in springDampenerLoop):
+        u = K * (target - theta) - D * omega, clipped to +/- voltage_limit
+    Plant (torque-mode motor driving the arm, small-angle free of gravity):
+        theta'' = gain * u - friction * theta'
+
+    ``gain`` (rad/s^2 per volt) and ``friction`` (1/s) are properties of the
+    hardware, not of the gains; Config holds rough defaults. Everything is
+    integrated with semi-implicit Euler at the firmware's 1 ms resolution, and
+    K / D may be arrays: a whole K x D grid is one broadcast simulation.
+    """
+
+    def __init__(self, gain, friction, voltage_limit=6.0, dt=0.001):
+        self.gain = float(gain)
+        self.friction = float(friction)
+        self.voltage_limit = float(voltage_limit)
+        self.dt = float(dt)
+
+    def simulate(self, K, D, duration=10.0, log_period=0.1, step_deg=STEP_DEG, gain=None, friction=None):
+        """
+        Swing from rest at 0 towards step_deg. K and D (and gain / friction,
+        which default to the model's own) broadcast against each other;
+        returns (times, positions) with positions in degrees, shaped
+        broadcast(...).shape + (n_logged,), logged every log_period like the firmware.
+        """
+        K = np.asarray(K, dtype=np.float64)
+        D = np.asarray(D, dtype=np.float64)
+        gain = np.asarray(self.gain if gain is None else gain, dtype=np.float64)
+        friction = np.asarray(self.friction if friction is None else friction, dtype=np.float64)
+        shape = np.broadcast_shapes(K.shape, D.shape, gain.shape, friction.shape)
+
+        target = np.radians(step_deg)
+        n_steps = int(round(duration / self.dt))
+        log_every = max(1, int(round(log_period / self.dt)))
+        n_log = n_steps // log_every + 1
+
+        theta = np.zeros(shape)
+        omega = np.zeros(shape)
+        u = np.empty(shape)
+        positions = np.empty(shape + (n_log,))
+        positions[..., 0] = 0.0
+
+        dt, limit = self.dt, self.voltage_limit
+        for i in range(1, n_steps + 1):
+            np.clip(K * (target - theta) - D * omega, -limit, limit, out=u)
+            omega += dt * (gain * u - friction * omega)
+            theta += dt * omega  # Semi-implicit: position uses the updated velocity
+            if i % log_every == 0:
+                positions[..., i // log_every] = theta
+
+        times = np.arange(n_log) * (log_every * self.dt)
+        return times, np.degrees(positions)
+
+    def preview(self, K, D, duration=10.0, log_period=0.1, step_deg=STEP_DEG):
+        """
+        Predicted (times, positions) for one pair of gains. Same integrator as
+        simulate(), but on plain floats: for a single trace that is ~30x faster
+        than numpy on 0-d arrays, which keeps the picker preview instant.
+        """
+        K, D = float(K), float(D)
+        target = math.radians(step_deg)
+        n_steps = int(round(duration / self.dt))
+        log_every = max(1, int(round(log_period / self.dt)))
+
+        dt, gain, friction, limit = self.dt, self.gain, self.friction, self.voltage_limit
+        theta = omega = 0.0
+        logged = [0.0]
+        for i in range(1, n_steps + 1):
+            u = min(limit, max(-limit, K * (target - theta) - D * omega))
+            omega += dt * (gain * u - friction * omega)
+            theta += dt * omega
+            if i % log_every == 0:
+                logged.append(theta)
+
+        times = np.arange(len(logged)) * (log_every * self.dt)
+        return times, np.degrees(logged)
+
+    def sweep(self, K_values, D_values, duration=10.0, band=0.02, step_deg=STEP_DEG):
+        """
+        Simulate every K x D pair in one call. Returns a dict of
+        (len(K_values), len(D_values)) arrays: overshoot (%) and settling
+        time (s, into a +/- band*step window; NaN if it never settles).
+        """
+        K = np.asarray(K_values, dtype=np.float64)[:, None]
+        D = np.asarray(D_values, dtype=np.float64)[None, :]
+        times, positions = self.simulate(K, D, duration, step_deg=step_deg)
+
+        overshoot = np.maximum(0.0, (positions.max(axis=-1) - step_deg) / step_deg * 100.0)
+
+        # Last logged sample outside the band, found from the end of each trace
+        outside = np.abs(positions - step_deg) > band * step_deg
+        last = outside.shape[-1] - 1 - np.argmax(outside[..., ::-1], axis=-1)
+        settling = np.where(outside.any(axis=-1), times[np.minimum(last + 1, len(times) - 1)], 0.0)
+        settling[outside[..., -1]] = np.nan  # Still outside when the run ends
+
+        return {"K": K.ravel(), "D": D.ravel(), "overshoot": overshoot, "settling": settling}
+
+
+def fit_plant(times, positions, K, D, voltage_limit=6.0, step_deg=STEP_DEG, rounds=3, grid=9, max_window=10.0):
+    """
+    Fit the model's plant (gain, friction) to one recorded swing run with gains K, D.
+
+    The arm's inertia J, friction c and motor torque constant b only appear
+    as gain = b / J and friction = c / J for a voltage-driven motor, so those
+    two numbers are what can be identified. A linear least-squares fit of
+    theta'' = gain * u - friction * theta' (derivatives by finite differences)
+    gives the starting point. The 10 Hz log makes those derivatives biased, so
+    that estimate is refined by simulating a grid of (gain, friction) around
+    it in one vectorised run and keeping the closest match. The grid shrinks
+    each round. Only the swing itself is fitted: the trace is cut 2 s after
+    it settles (and after max_window seconds at most), since the flat tail
+    adds simulation time but no information.
+
+    Returns a dict with gain, friction and rms_deg (fit error), or None if
+    the swing is too short or did not move.
+    """
+    t = np.asarray(times, dtype=np.float64)
+    y = np.asarray(positions, dtype=np.float64)
+    if len(t) < 10 or np.ptp(y) < 1.0:
+        return None
+    # Cut the settled tail (2% band around the mean of the last 10%)
+    final = y[-max(3, len(y) // 10):].mean()
+    outside = np.flatnonzero(np.abs(y - final) > 0.02 * abs(step_deg))
+    end = min(t[outside[-1]] + 2.0 if len(outside) else t[-1], t[0] + max_window)
+    keep = t <= end
+    t, y = t[keep], y[keep]
+
+    theta = np.radians(y - y[0])
+    target = np.radians(step_deg)
+
+    # Equation error: acceleration is linear in (gain, friction)
+    velocity = np.gradient(theta, t)
+    acceleration = np.gradient(velocity, t)
+    u = np.clip(K * (target - theta) - D * velocity, -voltage_limit, voltage_limit)
+    A = np.column_stack([u, -velocity])
+    (gain, friction), *_ = np.linalg.lstsq(A, acceleration, rcond=None)
+    gain = max(float(gain), 1e-3)
+    friction = max(float(friction), 0.0)
+
+    # Output error: simulate candidate plants against the logged trace
+    model = SpringDampenerModel(gain, friction, voltage_limit)
+    measured = y - y[0]
+    duration = float(t[-1])
+    span = 2.0  # Search gain and friction within x / span and x * span
+    for _ in range(rounds):
+        scale = np.geomspace(1 / span, span, grid)
+        gains = (gain * scale)[:, None]
+        frictions = (max(friction, 0.05) * scale)[None, :]
+        sim_t, sim = model.simulate(K, D, duration, step_deg=step_deg, gain=gains, friction=frictions)
+        # Sample each simulated trace at the logged times (nearest sample, so
+        # float32 times like 0.1000000015 do not slip to the next one)
+        idx = np.clip(np.rint(t / (sim_t[1] - sim_t[0])).astype(int), 0, len(sim_t) - 1)
+        err = np.sqrt(np.mean((sim[..., idx] - measured) ** 2, axis=-1))
+        i, j = np.unravel_index(np.argmin(err), err.shape)
+        gain, friction, rms = float(gains[i, 0]), float(frictions[0, j]), float(err[i, j])
+        span = np.sqrt(span)
+
+    return {"gain": gain, "friction": friction, "rms_deg": rms}
+
+
+def recommend_gains(sweep, target_settling, max_overshoot=5.0):
+    """
+    Pick gains from a SpringDampenerModel.sweep() result: the gentlest pair
+    (smallest K, then D) whose predicted 2% settling time meets
+    target_settling with at most max_overshoot %. If none meets the target,
+    the fastest-settling pair within the overshoot limit.
+    Returns (K, D, overshoot, settling) or None.
+    """
+    overshoot, settling = sweep["overshoot"], sweep["settling"]
+    calm = (overshoot <= max_overshoot) & np.isfinite(settling)
+    if not calm.any():
+        return None
+
+    ok = calm & (settling <= target_settling)
+    if ok.any():
+        i, j = np.argwhere(ok)[0]  # argwhere is row-major: smallest K first, then smallest D
+    else:
+        i, j = np.unravel_index(np.argmin(np.where(calm, settling, np.inf)), settling.shape)
+    return float(sweep["K"][i]), float(sweep["D"][j]), float(overshoot[i, j]), float(settling[i, j])
@@ -0,0 +1,105 @@
+import csv, os
+
+
+class SweepResults:
+    """
+    Results of K/D sweep runs, indexed by gains.
+
+    One summary row per run (gains, status and the analyze_step metrics) is
+    kept in memory and appended to a CSV file, so results survive a restart
+    and can be opened in a spreadsheet. ``index`` maps (K, D) to the latest
+    run with those gains, so repeated pairs overwrite rather than pile up in
+    the comparison view.
+    """
+
+    METRICS = ["overshoot_pct", "rise_time", "settling_time_2", "settling_time_5",
+               "peak_time", "steady_state_error", "damping_ratio", "natural_freq"]
+    FIELDS = ["run", "K", "D", "status", "stopped_early", "duration"] + METRICS
+
+    def __init__(self, path="sweepResults.csv"):
+        self.path = path
+        self.rows = []
+        self.index = {}
+        self._load()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, newline="") as f:
+                for row in csv.DictReader(f):
+                    self._add_row(self._parse(row))
+        except Exception as e:
+            print(f"Could not read {self.path}: {e}")  # Debug
+
+    @classmethod
+    def _parse(cls, row):
+        parsed = {"run": int(row["run"]), "status": row["status"],
+                  "stopped_early": row["stopped_early"] == "1"}
+        for name in ["K", "D", "duration"] + cls.METRICS:
+            parsed[name] = float(row[name]) if row.get(name) else None
+        return parsed
+
+    def _add_row(self, row):
+        self.rows.append(row)
+        self.index[(row["K"], row["D"])] = len(self.rows) - 1
+
+    def add(self, result):
+        """Record a SweepRunner result dict; returns the summary row"""
+        metrics = result["metrics"] or {}
+        row = {
+            "run": self.rows[-1]["run"] + 1 if self.rows else 1,
+            "K": result["K"],
+            "D": result["D"],
+            "status": result["status"],
+            "stopped_early": result["stopped_early"],
+            "duration": result["duration"],
+        }
+        for name in self.METRICS:
+            row[name] = metrics.get(name)
+        self._add_row(row)
+        self._append_to_file(row)
+        return row
+
+    def _append_to_file(self, row):
+        if not self.path:
+            return
+        try:
+            new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            with open(self.path, "a", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                if new_file:
+                    writer.writeheader()
+                values = {k: ("" if v is None else v) for k, v in row.items()}
+                values["stopped_early"] = int(row["stopped_early"])
+                writer.writerow(values)
+        except Exception as e:
+            print(f"Error saving sweep result: {e}")  # Debug
+
+    def get(self, K, D):
+        """Latest run with these gains, or None"""
+        i = self.index.get((float(K), float(D)))
+        return None if i is None else self.rows[i]
+
+    def latest(self):
+        """Latest run per (K, D), in run order"""
+        return [self.rows[i] for i in sorted(self.index.values())]
+
+    def best(self, max_overshoot=5.0):
+        """Fastest-settling successful run within the overshoot limit, or None"""
+        candidates = [r for r in self.latest()
+                      if r["status"] == "ok" and r["settling_time_2"] is not None
+                      and r["overshoot_pct"] is not None and r["overshoot_pct"] <= max_overshoot]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda r: r["settling_time_2"])
+
+    def clear(self):
+        self.rows = []
+        self.index = {}
+        if self.path and os.path.exists(self.path):
+            with open(self.path, "w") as f:
+                f.write("")
@@ -0,0 +1,139 @@
+import numpy as np
+
+# The firmware's Q command moves the setpoint by target_offset = 2.094 rad
+STEP_DEG = 120.0
+
+
+def rolling_std(x, window):
+    """Standard deviation of every length-`window` slice of x, in O(n) from cumulative sums"""
+    x = np.asarray(x, dtype=np.float64)
+    if len(x) < window:
+        return np.empty(0)
+    # Centre first so the sum of squares does not lose precision
+    x = x - x.mean()
+    c1 = np.concatenate(([0.0], np.cumsum(x)))
+    c2 = np.concatenate(([0.0], np.cumsum(x * x)))
+    mean = (c1[window:] - c1[:-window]) / window
+    var = (c2[window:] - c2[:-window]) / window - mean * mean
+    return np.sqrt(np.maximum(var, 0.0))
+
+
+def _crossing_time(t, r, level):
+    """First time the normalised response r reaches `level`, linearly interpolated"""
+    above = r >= level
+    if not above.any():
+        return None
+    i = int(np.argmax(above))
+    if i == 0:
+        return float(t[0])
+    # Interpolate between the last sample below and the first at/above
+    r0, r1 = r[i - 1], r[i]
+    frac = (level - r0) / (r1 - r0) if r1 != r0 else 0.0
+    return float(t[i - 1] + frac * (t[i] - t[i - 1]))
+
+
+def _settling_time(t, y, final, band):
+    """Time after which y stays within +/- band of final (None if it never does)"""
+    outside = np.abs(y - final) > band
+    if not outside.any():
+        return float(t[0])
+    last = len(outside) - 1 - int(np.argmax(outside[::-1]))
+    if last == len(y) - 1:
+        return None  # Still outside the band at the end of the capture
+    return float(t[last + 1])
+
+
+def analyze_step(times, positions, setpoint=None, stable_window=10, stable_std=0.5):
+    """
+    Step-response metrics for one Spring Dampener swing, all O(n) and vectorised.
+
+    times, positions: the logged (s, degrees) rows. setpoint defaults to the
+    starting position + STEP_DEG. Returns a dict; metrics that cannot be
+    determined from the capture (e.g. never settled) are None.
+    """
+    t = np.asarray(times, dtype=np.float64)
+    y = np.asarray(positions, dtype=np.float64)
+    if len(t) < 2:
+        return None
+    if np.any(np.diff(t) < 0):
+        order = np.argsort(t, kind="stable")
+        t, y = t[order], y[order]
+
+    initial = float(y[0])
+    if setpoint is None:
+        setpoint = initial + STEP_DEG
+    step = setpoint - initial
+    if step == 0:
+        return None
+
+    # Steady-state value: mean of the last 10% of the capture (at least 3 samples)
+    tail = max(3, len(y) // 10)
+    final = float(y[-tail:].mean())
+
+    # Response normalised so 0 = start, 1 = setpoint, whatever the step direction
+    r = (y - initial) / step
+
+    # Rise time 10% -> 90% of the step
+    t10 = _crossing_time(t, r, 0.1)
+    t90 = _crossing_time(t, r, 0.9)
+    rise_time = t90 - t10 if t10 is not None and t90 is not None else None
+
+    # Peak and overshoot past the setpoint
+    i_peak = int(np.argmax(r))
+    peak_time = float(t[i_peak] - t[0])
+    peak = float(y[i_peak])
+    overshoot_pct = max(0.0, float(r[i_peak] - 1.0) * 100.0)
+
+    # Settling into a 2% / 5% band (of the step size) around the steady-state value
+    settle_2 = _settling_time(t, y, final, 0.02 * abs(step))
+    settle_5 = _settling_time(t, y, final, 0.05 * abs(step))
+
+    # Damping ratio / natural frequency from the logarithmic decrement of
+    # successive peaks of the error around the steady-state value
+    damping_ratio, natural_freq = None, None
+    e = (y - final) * np.sign(step)
+    noise = max(0.2, 0.005 * abs(step))
+    peaks = np.flatnonzero((e[1:-1] > e[:-2]) & (e[1:-1] >= e[2:]) & (e[1:-1] > noise)) + 1
+    if len(peaks) >= 2:
+        n = len(peaks) - 1
+        delta = np.log(e[peaks[0]] / e[peaks[-1]]) / n
+        damping_ratio = float(delta / np.sqrt(4 * np.pi ** 2 + delta ** 2))
+        period = (t[peaks[-1]] - t[peaks[0]]) / n
+        if period > 0:
+            natural_freq = float(2 * np.pi / period / np.sqrt(1 - damping_ratio ** 2))
+    elif overshoot_pct > 0 and peak_time > 0:
+        # Single overshoot: use the second-order overshoot / peak-time relations
+        ln_os = np.log(overshoot_pct / 100.0)
+        damping_ratio = float(-ln_os / np.sqrt(np.pi ** 2 + ln_os ** 2))
+        natural_freq = float(np.pi / (peak_time * np.sqrt(1 - damping_ratio ** 2)))
+
+    # Swing start: first sample-to-sample move well above the typical change
+    diffs = np.abs(np.diff(y))
+    moving = diffs > 2 * diffs.std()
+    swing_start = float(t[int(np.argmax(moving))]) if moving.any() else float(t[0])
+
+    # Swing end: centre of the first window whose position spread is small
+    spread = rolling_std(y, stable_window)
+    calm = spread < stable_std
+    if calm.any():
+        stable_time = float(t[int(np.argmax(calm)) + stable_window // 2])
+    else:
+        stable_time = float(t[-1])
+
+    return {
+        "initial": initial,
+        "setpoint": float(setpoint),
+        "final": final,
+        "step": float(step),
+        "rise_time": rise_time,
+        "settling_time_2": None if settle_2 is None else settle_2 - float(t[0]),
+        "settling_time_5": None if settle_5 is None else settle_5 - float(t[0]),
+        "peak_time": peak_time,
+        "peak": peak,
+        "overshoot_pct": overshoot_pct,
+        "steady_state_error": float(setpoint - final),
+        "damping_ratio": damping_ratio,
+        "natural_freq": natural_freq,
+        "swing_start": swing_start,
+        "stable_time": stable_time,
+    }
@@ -0,0 +1,37 @@
+import numpy as np
+
+
+class SwingCollector:
+    """Preallocated, growable (N, 2) array of (time, position) rows for one swing"""
+
+    def __init__(self, capacity=1024):
+        self.data = np.empty((int(capacity), 2), dtype=np.float64)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def extend(self, rows):
+        """Append a (k, 2) batch of rows"""
+        k = len(rows)
+        if self.n + k > len(self.data):
+            grown = np.empty((max(self.n + k, 2 * len(self.data)), 2), dtype=np.float64)
+            grown[:self.n] = self.data[:self.n]
+            self.data = grown
+        self.data[self.n:self.n + k] = rows
+        self.n += k
+
+    def view(self):
+        """(N, 2) view of the rows collected so far (do not keep across extend)"""
+        return self.data[:self.n]
+
+    @property
+    def times(self):
+        return self.data[:self.n, 0]
+
+    @property
+    def positions(self):
+        return self.data[:self.n, 1]
@@ -0,0 +1,135 @@
+import os, struct, time
+import numpy as np
+
+
+class SwingHistory:
+    """
+    Every Spring Dampener swing of the session, in one append-only binary file.
+
+    Layout: a 32-byte file header, then one record per swing: a fixed-size
+    record header (row count, K, D, timestamp and the analyze_step metrics as
+    float32, NaN = not measurable) followed by the rows as float32
+    (time, position) pairs. The file is scanned once on open to build an
+    in-memory offset index, so any run is fetched with a single seek + read;
+    fetched traces and their decimated versions are cached.
+    """
+
+    MAGIC = b"IDKSWING"
+    VERSION = 1
+    HEADER = struct.Struct("<8sH")  # magic, version
+    HEADER_SIZE = 32
+    METRICS = ("initial", "setpoint", "final", "step", "rise_time", "settling_time_2", "settling_time_5",
+               "peak_time", "peak", "overshoot_pct", "steady_state_error", "damping_ratio", "natural_freq",
+               "swing_start", "stable_time")
+    RECORD = struct.Struct("<Iffd" + "f" * len(METRICS))  # rows, K, D, timestamp, metrics
+    DTYPE = np.dtype("<f4")
+
+    def __init__(self, path="swingHistory.bin"):
+        self.path = path
+        self.offsets = []   # File offset of each run's rows
+        self.runs = []      # Per-run info: rows, K, D, timestamp, metrics
+        self._traces = {}
+        self._decimated = {}
+        self._open_or_create()
+
+    def __len__(self):
+        return len(self.runs)
+
+    def _open_or_create(self):
+        """Validate the header and index the records (recreating the file if it is unusable)"""
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                header = f.read(self.HEADER_SIZE)
+                if len(header) == self.HEADER_SIZE and self.HEADER.unpack_from(header) == (self.MAGIC, self.VERSION):
+                    self._index(f)
+                    return
+            print(f"{self.path}: incompatible swing history, starting a new one")  # Debug
+
+        with open(self.path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION).ljust(self.HEADER_SIZE, b"\0"))
+
+    def _index(self, f):
+        """Walk the record headers; a record cut short by a crash is dropped"""
+        size = os.fstat(f.fileno()).st_size
+        offset = self.HEADER_SIZE
+        while offset + self.RECORD.size <= size:
+            f.seek(offset)
+            fields = self.RECORD.unpack(f.read(self.RECORD.size))
+            end = offset + self.RECORD.size + fields[0] * 2 * self.DTYPE.itemsize
+            if end > size:
+                break
+            self.offsets.append(offset + self.RECORD.size)
+            self.runs.append(self._unpack(fields))
+            offset = end
+        if offset != size:
+            os.truncate(self.path, offset)
+
+    @classmethod
+    def _unpack(cls, fields):
+        rows, K, D, timestamp = fields[:4]
+        values = [None if np.isnan(v) else float(v) for v in fields[4:]]
+        metrics = None if all(v is None for v in values) else dict(zip(cls.METRICS, values))
+        return {"rows": rows, "K": K, "D": D, "timestamp": timestamp, "metrics": metrics}
+
+    def append(self, data, K, D, metrics=None, timestamp=None):
+        """Store one swing ((N, 2) time, position rows); returns its index"""
+        data = np.asarray(data, dtype=self.DTYPE).reshape(-1, 2)
+        timestamp = time.time() if timestamp is None else timestamp
+        values = [np.nan if not metrics or metrics.get(name) is None else metrics[name] for name in self.METRICS]
+        record = self.RECORD.pack(len(data), K, D, timestamp, *values)
+
+        with open(self.path, "ab") as f:
+            offset = f.tell()
+            f.write(record)
+            f.write(data.tobytes())
+
+        self.offsets.append(offset + self.RECORD.size)
+        self.runs.append(self._unpack(self.RECORD.unpack(record)))
+        return len(self.runs) - 1
+
+    def run(self, index):
+        """Info for one run: rows, K, D, timestamp and metrics (None if it could not be analysed)"""
+        return self.runs[index]
+
+    def get(self, index):
+        """The rows of one run as an (N, 2) float64 array (read once, then cached)"""
+        if index < 0:
+            index += len(self.runs)
+        if index not in self._traces:
+            with open(self.path, "rb") as f:
+                f.seek(self.offsets[index])
+                raw = np.fromfile(f, dtype=self.DTYPE, count=self.runs[index]["rows"] * 2)
+            self._traces[index] = raw.reshape(-1, 2).astype(np.float64)
+        return self._traces[index]
+
+    def decimated(self, index, max_points=200):
+        """(times, positions) of one run cut down to about max_points, keeping each bucket's min and max"""
+        if index < 0:
+            index += len(self.runs)
+        key = (index, max_points)
+        if key not in self._decimated:
+            data = self.get(index)
+            self._decimated[key] = self._decimate(data[:, 0], data[:, 1], max_points)
+        return self._decimated[key]
+
+    @staticmethod
+    def _decimate(t, y, max_points):
+        n = len(y)
+        if n <= max_points:
+            return t, y
+        k = -(-n // max(1, max_points // 2))  # Samples per bucket (two kept from each)
+        m = n // k * k
+        buckets = y[:m].reshape(-1, k)
+        i_min, i_max = buckets.argmin(axis=1), buckets.argmax(axis=1)
+        base = np.arange(len(buckets)) * k
+        # Keep min and max in time order within each bucket
+        idx = np.column_stack([base + np.minimum(i_min, i_max), base + np.maximum(i_min, i_max)]).ravel()
+        idx = np.concatenate([idx, np.arange(m, n)])
+        return t[idx], y[idx]
+
+    def clear(self):
+        os.truncate(self.path, self.HEADER_SIZE)
+        self.offsets = []
+        self.runs = []
+        self._traces = {}
+        self._decimated = {}
@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class TrialMatrixModel(QObject):
+    """
+    In-memory matrix of AFM trials, shared by the AFM and Topography pages.
+
+    MainWindow owns one instance and hands it to both pages. The AFM page
+    appends/removes trials, the Topography page renders straight from
+    ``matrix()`` and redraws on the change signals, so opening the map never
+    touches the disk. Every change is mirrored to the on-disk TrialStore by a
+    single background writer thread (one worker keeps the writes in order).
+    """
+
+    trial_added = pyqtSignal(int)    # row index
+    trial_removed = pyqtSignal(int)  # row index
+    trials_cleared = pyqtSignal()
+    trial_updated = pyqtSignal(int)  # row index of the trial still being recorded
+
+    def __init__(self, store, max_trials, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.max_trials = int(max_trials)
+        self.n_values = store.n_values
+
+        # Preallocated; rows >= count are NaN
+        self.data = np.full((self.max_trials, self.n_values), np.nan, dtype=np.float32)
+        self.count = 0
+        self.pending = False  # Row `count` holds a trial that is still being recorded
+
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TrialStoreWriter")
+
+        # Start from whatever is already on disk
+        stored = store.matrix()[:self.max_trials]
+        self.count = len(stored)
+        self.data[:self.count] = stored
+        del stored  # Release the memory map
+
+    def __len__(self):
+        return self.count
+
+    def is_full(self):
+        return self.count >= self.max_trials
+
+    def matrix(self):
+        """(count, n_values) view of the recorded trials - read only, do not keep across changes"""
+        return self.data[:self.count]
+
+    def row(self, index):
+        """One row of the matrix, including the in-progress row (read only)"""
+        return self.data[index]
+
+    def update_pending(self, values):
+        """Show a trial that is still being recorded in the next free row (not counted, not saved)"""
+        if self.is_full():
+            return
+        values = np.asarray(values, dtype=np.float32)[:self.n_values]
+        self.data[self.count] = np.nan
+        self.data[self.count, :len(values)] = values
+        self.pending = True
+        self.trial_updated.emit(self.count)
+
+    def discard_pending(self):
+        if not self.pending:
+            return
+        self.pending = False
+        if not self.is_full():
+            self.data[self.count] = np.nan
+            self.trial_updated.emit(self.count)
+
+    def append(self, values):
+        """Add a trial; returns its row, or -1 if the matrix is full"""
+        if self.is_full():
+            return -1
+        row = self.count
+        values = np.asarray(values, dtype=np.float32)[:self.n_values]
+        self.data[row] = np.nan
+        self.data[row, :len(values)] = values
+        self.count += 1
+        self.pending = False
+
+        self._persist(self.store.append, self.data[row].copy())
+        self.trial_added.emit(row)
+        return row
+
+    def remove_last(self):
+        """Drop the most recent trial; returns False if there was none"""
+        if self.count == 0:
+            return False
+        self.count -= 1
+        self.data[self.count] = np.nan
+
+        self._persist(self.store.remove_last)
+        self.trial_removed.emit(self.count)
+        return True
+
+    def clear(self):
+        if self.count == 0 and not self.pending:
+            return  # Already empty - nothing to redraw or save
+        self.count = 0
+        self.pending = False
+        self.data[:] = np.nan
+
+        self._persist(self.store.clear)
+        self.trials_cleared.emit()
+
+    def _persist(self, write, *args):
+        """Queue a store write on the background thread"""
+        self._writer.submit(self._write_safely, write, *args)
+
+    @staticmethod
+    def _write_safely(write, *args):
+        try:
+            write(*args)
+        except Exception as e:
+            print(f"Trial store write failed: {e}")  # Debug
+
+    def shutdown(self):
+        """Finish pending writes (called when the app closes)"""
+        self._writer.shutdown(wait=True)
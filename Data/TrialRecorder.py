@@ -0,0 +1,82 @@
+import time
+import numpy as np
+from Data.MinMaxPyramid import GrowableArray
+
+
+class TrialRecorder:
+    """
+    Captures every sample of one AFM trial and resamples it onto a uniform grid.
+
+    Arrival timestamps jitter with USB latency and with how busy the GUI was
+    when a batch was read, but the firmware emits one sample every
+    ``sample_period`` seconds. The recorder therefore rebuilds a device-rate
+    timeline (sample index * period) anchored at the lowest-latency arrival,
+    and the trial ends after ``duration`` seconds of device time rather than
+    of wall time. ``resample()`` then interpolates the trial onto ``n_points``
+    evenly spaced columns, so every trial lines up column for column.
+    """
+
+    STALL_GRACE_S = 2.0  # Finish anyway if the stream stops mid-trial
+
+    def __init__(self, duration, n_points, sample_period=0.01):
+        self.duration = float(duration)
+        self.n_points = int(n_points)
+        self.sample_period = float(sample_period)
+        self.capacity = int(round(self.duration / self.sample_period))  # Samples in a full trial
+
+        self.arrival = GrowableArray(int(duration / sample_period) + 64)
+        self.values = GrowableArray(int(duration / sample_period) + 64)
+        self.active = False
+        self.start_time = None
+
+    def start(self):
+        self.arrival.clear()
+        self.values.clear()
+        self.start_time = time.perf_counter()
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def add(self, sample_t, values):
+        """
+        Append a batch (perf_counter arrival times, filtered values). Samples
+        from before start() are skipped, and so are any beyond a full trial,
+        which a burst can bring in all at once.
+        """
+        if not self.active:
+            return
+        keep = sample_t >= self.start_time
+        room = max(0, self.capacity - len(self.values))
+        self.arrival.extend(sample_t[keep][:room])
+        self.values.extend(values[keep][:room])
+
+    def elapsed(self):
+        """Seconds of device time captured so far"""
+        return len(self.values) * self.sample_period
+
+    def is_complete(self):
+        if self.elapsed() >= self.duration:
+            return True
+        return time.perf_counter() - self.start_time >= self.duration + self.STALL_GRACE_S
+
+    def device_times(self):
+        """Jitter-free timestamps: i * period, offset by the minimum observed latency"""
+        arrival = self.arrival.view()
+        ticks = np.arange(len(arrival)) * self.sample_period
+        return (arrival - ticks).min() + ticks
+
+    def resample(self, partial=False):
+        """
+        The trial on a uniform grid of n_points columns spanning duration.
+        With partial=True (trial still running) columns not reached yet are NaN.
+        """
+        values = self.values.view()
+        if len(values) == 0:
+            return np.full(self.n_points, np.nan) if partial else np.zeros(self.n_points)
+        t = self.device_times()
+        grid = t[0] + np.arange(self.n_points) * (self.duration / self.n_points)
+        out = np.interp(grid, t, values)
+        if partial:
+            out[grid > t[-1]] = np.nan
+        return out
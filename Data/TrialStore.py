@@ -0,0 +1,109 @@
+import os, struct
+import numpy as np
+
+
+class TrialStore:
+    """
+    Append-only binary file of AFM trials.
+
+    Layout: a 32-byte header (magic, version, values per trial) followed by
+    fixed-size float32 records, one per trial. Because every record has the
+    same size, the offset index is implicit (HEADER_SIZE + i * record_size):
+    appending is a single write at the end, removing the last trial is a
+    truncate, and the trial count comes from the file size without reading
+    anything. ``matrix()`` maps the records as an (n_trials, n_values) array.
+
+    A legacy ``trials.txt`` (one comma-separated trial per line) is imported
+    on first use and then emptied.
+    """
+
+    MAGIC = b"IDKTRIAL"
+    VERSION = 1
+    HEADER = struct.Struct("<8sHI")  # magic, version, values per trial
+    HEADER_SIZE = 32
+    DTYPE = np.dtype("<f4")
+
+    def __init__(self, path="trials.bin", n_values=300, legacy_path="trials.txt"):
+        self.path = path
+        self.n_values = int(n_values)
+        self.record_size = self.n_values * self.DTYPE.itemsize
+
+        self._open_or_create()
+        if legacy_path:
+            self._import_legacy(legacy_path)
+
+    def __len__(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0
+        return max(0, size - self.HEADER_SIZE) // self.record_size
+
+    def _offset(self, index):
+        return self.HEADER_SIZE + index * self.record_size
+
+    def _open_or_create(self):
+        """Validate the header (recreating the file if it is missing or for another layout)"""
+        header = b""
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                header = f.read(self.HEADER_SIZE)
+
+        if len(header) == self.HEADER_SIZE:
+            magic, version, n_values = self.HEADER.unpack_from(header)
+            if magic == self.MAGIC and version == self.VERSION and n_values == self.n_values:
+                # Drop a partially written record left by a crash mid-append
+                complete = self._offset(len(self))
+                if os.path.getsize(self.path) != complete:
+                    os.truncate(self.path, complete)
+                return
+            print(f"{self.path}: incompatible trial store, starting a new one")  # Debug
+
+        with open(self.path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.n_values).ljust(self.HEADER_SIZE, b"\0"))
+
+    def _import_legacy(self, legacy_path):
+        try:
+            if not os.path.exists(legacy_path) or os.path.getsize(legacy_path) == 0:
+                return
+            with open(legacy_path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        self.append([float(v) if v.strip() else np.nan for v in line.strip().split(",")])
+            with open(legacy_path, "w") as f:
+                f.write("")
+        except Exception:
+            pass  # Leave the text file alone if it cannot be parsed
+
+    def append(self, values):
+        """Add one trial (cropped or NaN-padded to n_values)"""
+        row = np.full(self.n_values, np.nan, dtype=self.DTYPE)
+        values = np.asarray(values, dtype=self.DTYPE)[:self.n_values]
+        row[:len(values)] = values
+        with open(self.path, "ab") as f:
+            f.write(row.tobytes())
+
+    def remove_last(self):
+        """Drop the most recent trial; returns False if there was none"""
+        n = len(self)
+        if n == 0:
+            return False
+        os.truncate(self.path, self._offset(n - 1))
+        return True
+
+    def clear(self):
+        os.truncate(self.path, self.HEADER_SIZE)
+
+    def read(self, index):
+        """One trial as a float32 array"""
+        with open(self.path, "rb") as f:
+            f.seek(self._offset(index))
+            return np.frombuffer(f.read(self.record_size), dtype=self.DTYPE)
+
+    def matrix(self):
+        """All trials as a read-only (n_trials, n_values) memory map (copy it before truncating on Windows)"""
+        n = len(self)
+        if n == 0:
+            return np.empty((0, self.n_values), dtype=self.DTYPE)
+        return np.memmap(self.path, dtype=self.DTYPE, mode="r",
+                         offset=self.HEADER_SIZE, shape=(n, self.n_values))
@@ -2,91 +2,19 @@ import time, serial, os
 import numpy as np
 import pyqtgraph as pg
 import matplotlib.pyplot as plt
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPointF
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6 import QtWidgets, QtCore
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QLabel
 )
-from PyQt6.QtGui import QPainter, QColor, QPen
 from GUI.GuessSamplesGUI import GuessSamplesPageWidget
-
-
-class CircleOverlay(QWidget):
-    """Separate overlay widget for the shrinking circle animation"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        
-        # Animation properties
-        self.circle_radius = 933  # Start with full screen coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.shrinking_circle = True
-        
-        # Set a solid background to ensure visibility
-        self.setStyleSheet("background-color: white;")
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.shrinking_circle = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the shrinking white circle overlay"""
-        if not self.shrinking_circle:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw white circle that covers the screen and shrinks
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(255, 255, 255))  # White fill
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
-
-
-class BlueTransitionOverlay(QWidget):
-    """Overlay widget for the blue transition when going back to main menu"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        
-        # Animation properties
-        self.circle_radius = 0  # Start with no coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.expanding_circle = False
-        
-        # Set transparent background
-        self.setStyleSheet("background-color: transparent;")
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.expanding_circle = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the expanding blue circle overlay"""
-        if not self.expanding_circle:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw blue circle that expands to fill the screen
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(0, 36, 84))  # #002454
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
+from Data.RingBuffer import PlotBuffer
+from Data.MinMaxPyramid import MinMaxPyramid
+from Data.TrialRecorder import TrialRecorder
+from Animation.CircleTransition import CircleTransition
+from Data.Filters import DeadZone, LowPass, MovingMedian, SavitzkyGolay, Kalman1D, FilterChain
+from GUI.FramePacer import FramePacer, PacedGraphicsLayoutWidget
+import Config
 
 
 class AfmPageWidget(QWidget):
@@ -95,10 +23,11 @@ class AfmPageWidget(QWidget):
     map_requested = pyqtSignal()
     references_requested = pyqtSignal()
 
-    def __init__(self, ser, parent=None):
+    def __init__(self, ser, trials, transition=None, parent=None):
         super().__init__(parent)
 
         self.ser = ser
+        self.trials = trials  # Shared TrialMatrixModel (also drawn by the Topography page)
 
         self.setObjectName("AfmPage")
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
@@ -111,15 +40,25 @@ class AfmPageWidget(QWidget):
         self.SETTLE_DEG = 0.5
         self.SETTLE_SECS = 10.0
         self.WINDOW_SECONDS = 10
-        self.TIMER_MS = 25
+        self.WINDOW_MARGIN_SECONDS = 2
+        self.SAMPLE_RATE_HZ = 100  # runAFM() prints at 100 Hz
+        self.TIMER_MS = 25  # Ingest tick (drains every sample queued by the reader thread)
 
         self.DEAD_ZONE = 0.01
         self.LPF_ALPHA = 0.20
 
-        self.MAX_TRIALS = 10
+        # Smoothing stage options (label, factory); the dead zone always runs first
+        self.FILTER_PRESETS = [
+            ("LPF", lambda: LowPass(self.LPF_ALPHA)),
+            ("Median", lambda: MovingMedian(9)),
+            ("Savitzky-Golay", lambda: SavitzkyGolay(21, 2)),
+            ("Kalman", lambda: Kalman1D(1e-3, 2e-2)),
+        ]
+
+        self.MAX_TRIALS = Config.AFM_MAX_TRIALS
         self.RECORD_DURATION = 10
-        self.MAX_VALUES_PER_TRIAL = 300
-        self.TRIAL_FILE = "trials.txt"
+        self.PREVIEW_INTERVAL_S = 0.5  # How often a running trial is pushed to the map
+        self.MAX_VALUES_PER_TRIAL = Config.AFM_TRIAL_SAMPLES
         
         # Animation state tracking
         self.animation_in_progress = False
@@ -137,9 +76,10 @@ class AfmPageWidget(QWidget):
         gh_layout = QVBoxLayout(graph_holder)
         gh_layout.setContentsMargins(0, 0, 0, 0)
 
-        win = pg.GraphicsLayoutWidget(title="Gimbal angle (°)")
+        win = PacedGraphicsLayoutWidget(title="Gimbal angle (°)")  # Reports its paint time to the frame pacer
         win.setBackground('w')  # Set the entire GraphicsLayoutWidget background to white
         gh_layout.addWidget(win)                       # add plot to holder
+        self.graph_widget = win
         layout.addWidget(graph_holder)                 # add holder to page
 
         self.plot = win.addPlot(labels={"left": "angle (°)",
@@ -157,6 +97,42 @@ class AfmPageWidget(QWidget):
         thick_pen = pg.mkPen(color='r', width=4)
         self.curve = self.plot.plot(pen=thick_pen)
 
+        # Frame budget readout (developer mode only)
+        self.frame_stats_label = QLabel("", graph_holder)
+        self.frame_stats_label.setStyleSheet("color: #002454; font: 10px 'Roboto'; background-color: transparent;")
+        self.frame_stats_label.setFixedWidth(500)
+        self.frame_stats_label.move(60, 8)
+        self.frame_stats_label.setVisible(Config.DEV_MODE)
+
+        # Session history: drag pans through time (y stays fixed), the buttons
+        # zoom, and "Live" jumps back to following the newest samples
+        self.live_view = True
+        self.plot.setMouseEnabled(x=True, y=False)
+        self.plot.vb.setLimits(xMin=0)
+        self.plot.vb.sigRangeChangedManually.connect(self._on_manual_range)
+        self.plot.vb.sigXRangeChanged.connect(self._on_x_range_changed)
+
+        self.zoom_out_button = QPushButton("−", graph_holder)
+        self.zoom_in_button = QPushButton("+", graph_holder)
+        self.live_view_button = QPushButton("Live", graph_holder)
+        for i, button in enumerate((self.zoom_out_button, self.zoom_in_button, self.live_view_button)):
+            button.setObjectName("view_button")
+            button.setFixedSize(50, 30)
+            button.move(633 + i * 52, 120)
+            button.raise_()
+        self.zoom_out_button.clicked.connect(lambda: self.zoom_history(2.0))
+        self.zoom_in_button.clicked.connect(lambda: self.zoom_history(0.5))
+        self.live_view_button.clicked.connect(self.go_live)
+        self.live_view_button.hide()
+
+        # Filter selector (cycles through FILTER_PRESETS without dropping samples)
+        self.filter_button = QPushButton("", graph_holder)
+        self.filter_button.setObjectName("view_button")
+        self.filter_button.setFixedSize(154, 30)
+        self.filter_button.move(633, 155)
+        self.filter_button.raise_()
+        self.filter_button.clicked.connect(self.cycle_filter)
+
         # 2) Create Back button *with graph_holder as its parent* and
         #    position it manually.
         self.back_button = QPushButton("Back", graph_holder)
@@ -243,13 +219,28 @@ class AfmPageWidget(QWidget):
         button_layout.addWidget(right_button_container, 1)  # Equal stretch
 
         # State variables
-        self.data_t, self.data_deg = [], []
+        # Only the visible window (plus margin) is kept for the live curve
+        self.plot_data = PlotBuffer((self.WINDOW_SECONDS + self.WINDOW_MARGIN_SECONDS) * self.SAMPLE_RATE_HZ)
+        # The whole session, summarised for zoomed-out browsing
+        self.history = MinMaxPyramid()
         self.t0, self.deg_filt = None, 0.0
         self.auto_scaled, self.settle_start = False, None
-        self.recording, self.recorded_trial_data, self.record_start_time = False, [], None
+        # Every sample of a trial is captured, then resampled to a fixed number of columns
+        self.recording = False
+        self.last_preview = 0.0
+        self.recorder = TrialRecorder(self.RECORD_DURATION, self.MAX_VALUES_PER_TRIAL, 1.0 / self.SAMPLE_RATE_HZ)
         self.trial_index = 0
+        self.counter_text = ""
+        self.set_filter(0)
 
-        # Load trials
+        # Samples are captured by the dispatcher's reader thread (with a per-sample
+        # arrival timestamp) and drained from its ring buffer once per tick
+        self.samples = self.ser.samples
+
+        # Trial counter follows the shared trial model
+        self.trials.trial_added.connect(self.load_trials)
+        self.trials.trial_removed.connect(self.load_trials)
+        self.trials.trials_cleared.connect(self.load_trials)
         self.load_trials()
 
         # Button connections
@@ -276,33 +267,18 @@ class AfmPageWidget(QWidget):
         self.timer = QtCore.QTimer()
         self.timer.timeout.connect(self.update)
         self.timer.start(self.TIMER_MS)
-        
-        # Shrinking circle animation
-        self.shrinking_circle = True  # Start with white screen
-        self.circle_radius = 933  # Start with full screen coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.shrink_animation_timer = QTimer()
-        self.shrink_animation_timer.timeout.connect(self.update_shrink_animation)
-        self.shrink_animation_timer.setInterval(16)  # 60 FPS for smooth animation
-        self.shrink_frames = 35  # Same speed as expanding circle
-        self.shrink_frame_count = 0
-        
-        # Don't create overlay here - wait until page is shown
-        self.circle_overlay = None
-        
-        # Blue transition animation (going back)
-        self.blue_transition_timer = QTimer()
-        self.blue_transition_timer.timeout.connect(self.update_blue_transition)
-        self.blue_transition_timer.setInterval(16)  # 60 FPS for smooth animation
-        self.blue_transition_frames = 30  # 0.5 seconds
-        self.blue_transition_frame_count = 0
-        self.blue_transition_active = False
-        
-        # Don't create blue overlay here - wait until needed
-        self.blue_transition_overlay = None
-        
-        # Add a method to reset animation state
-        self._reset_shrink_animation()
+
+        # Redraws are paced separately from ingest: only when new samples
+        # arrived, and at most Config.AFM_MAX_FPS times a second
+        self.pacer = FramePacer(self.render_frame, Config.AFM_MAX_FPS, self)
+        self.pacer.stats_updated.connect(self.frame_stats_label.setText)
+        self.graph_widget.pacer = self.pacer
+        self.pacer.start()
+        
+        # Circle transitions (the main window's shared overlay)
+        self.transition = transition if transition is not None else CircleTransition(self)
+        self.shrink_duration_ms = 560  # White reveal when the page opens (35 frames at 60 FPS)
+        self.expand_duration_ms = 480  # Blue wipe when going back (30 frames at 60 FPS)
     
     def disable_all_buttons(self):
         """Disable all buttons during animations"""
@@ -316,118 +292,107 @@ class AfmPageWidget(QWidget):
         for button in self.all_buttons:
             button.setEnabled(True)
     
-    def _reset_shrink_animation(self):
-        """Reset the shrinking circle animation to initial state"""
-        self.shrink_frame_count = 0
-        self.shrinking_circle = True
-        self.circle_radius = 933  # Full screen coverage
-        if hasattr(self, 'shrink_animation_timer'):
-            self.shrink_animation_timer.stop()
-            
-    def _reset_blue_transition(self):
-        """Reset the blue transition animation to initial state"""
-        self.blue_transition_frame_count = 0
-        self.blue_transition_active = False
-        if hasattr(self, 'blue_transition_timer'):
-            self.blue_transition_timer.stop()
-    
-    def update_shrink_animation(self):
-        """Update the shrinking circle animation"""
-        self.shrink_frame_count += 1
-        
-        # Calculate progress (0.0 to 1.0) - reverse of expanding circle
-        progress = 1.0 - (self.shrink_frame_count / self.shrink_frames)
-        progress = max(0.0, progress)  # Don't go below 0
-        
-        # Calculate radius based on progress
-        max_radius = 933
-        self.circle_radius = progress * max_radius
-        
-        # Update the overlay widget if it exists
-        if self.circle_overlay is not None:
-            self.circle_overlay.update_circle(self.circle_radius)
-            
-            # Check if shrinking is complete
-            if self.shrink_frame_count >= self.shrink_frames:
-                self.shrink_animation_timer.stop()
-                self.shrinking_circle = False
-                self.circle_overlay.set_animation_state(False)  # Hide the overlay
-
-    def update_blue_transition(self):
-        """Update the blue transition animation when going back"""
-        self.blue_transition_frame_count += 1
-        
-        # Calculate progress (0.0 to 1.0)
-        progress = min(self.blue_transition_frame_count / self.blue_transition_frames, 1.0)
-        
-        # Calculate radius based on progress - expand from center to fill screen
-        max_radius = 933  # Full screen coverage
-        self.blue_transition_radius = progress * max_radius
-        
-        # Update the blue overlay widget if it exists
-        if self.blue_transition_overlay is not None:
-            self.blue_transition_overlay.update_circle(self.blue_transition_radius)
-            
-            # Check if expansion is complete
-            if self.blue_transition_frame_count >= self.blue_transition_frames:
-                self.blue_transition_timer.stop()
-                self.blue_transition_active = False
-                
-                # Re-enable buttons before emitting back signal
-                self.enable_all_buttons()
-                
-                # Now that the blue circle has filled the screen, emit the back signal
-                # This will trigger the page transition to main menu
-                self.back_requested.emit()
-
-    def load_trials(self):
-        if os.path.exists(self.TRIAL_FILE):
-            with open(self.TRIAL_FILE, "r") as f:
-                lines = f.readlines()
-            self.trial_index = 0 if len(lines) >= self.MAX_TRIALS else len(lines)
-        else:
-            with open(self.TRIAL_FILE, "w") as f:
-                f.write("")
+    def load_trials(self, *args):
+        """Sync the trial counter with the shared trial model"""
+        self.trial_index = len(self.trials)
         self.trial_label.setText(f"Current Trial: {self.trial_index} / {self.MAX_TRIALS}")
 
     def update(self):
-        latest = None
-        while self.ser.in_waiting:
-            try:
-                latest = float(self.ser.readline())
-            except ValueError:
-                continue
-        if latest is None:
-            return
-
-        latest = 0.0 if abs(latest) < self.DEAD_ZONE else latest
-        self.deg_filt = (1 - self.LPF_ALPHA) * self.deg_filt + self.LPF_ALPHA * latest
-
-        now = time.time()
-        if self.t0 is None:
-            self.t0 = now
-        self.data_t.append(now - self.t0)
-        self.data_deg.append(self.deg_filt)
-
-        self.curve.setData(self.data_t, self.data_deg)
-        self.plot.setXRange(max(0, self.data_t[-1] - self.WINDOW_SECONDS), self.data_t[-1], padding=0)
-        self.trial_label.setText(f"Current Trial: {self.trial_index} / {self.MAX_TRIALS}")
+        # Every sample since the last tick, stamped when it arrived
+        sample_t, samples = self.samples.read_new()
+        if len(samples):
+            if self.t0 is None:
+                self.t0 = sample_t[0]
+
+            filtered = self.filter_chain.process(samples)
+            self.deg_filt = float(filtered[-1])
+            self.plot_data.extend(sample_t - self.t0, filtered)
+            self.history.extend(sample_t - self.t0, filtered)
+            self.recorder.add(sample_t, filtered)
+            self.pacer.mark_dirty()
 
         if self.recording:
-            seconds = int(now - self.record_start_time)
-            self.trial_counter.setText(f"Seconds left: {10 - seconds}")
-            if len(self.recorded_trial_data) < self.MAX_VALUES_PER_TRIAL:
-                self.recorded_trial_data.append(self.deg_filt)
-            if now - self.record_start_time >= self.RECORD_DURATION:
-                self.stop_recording()
-                
+            seconds = int(self.recorder.elapsed())
+            self.counter_text = f"Seconds left: {max(0, self.RECORD_DURATION - seconds)}"
+            if self.recorder.is_complete():
+                self.stop_recording()  # In the same tick as the samples that completed it
+            elif self.recorder.elapsed() - self.last_preview >= self.PREVIEW_INTERVAL_S:
+                # Let the map fill in while the trial is still running
+                self.last_preview = self.recorder.elapsed()
+                self.trials.update_pending(self.recorder.resample(partial=True))
+
+    def render_frame(self):
+        """Draw the latest window (called by the frame pacer, not per sample)"""
+        if len(self.plot_data) == 0:
+            return
+        if self.live_view:
+            plot_t, plot_deg = self.plot_data.view()
+            self.curve.setData(plot_t, plot_deg, skipFiniteCheck=True)
+            self.plot.setXRange(max(0, plot_t[-1] - self.WINDOW_SECONDS), plot_t[-1], padding=0)
+        else:
+            # Browsing history: about one min/max pair per pixel of the visible range
+            (x0, x1), _ = self.plot.vb.viewRange()
+            max_points = max(100, int(self.plot.vb.width()))
+            hist_t, hist_deg = self.history.query(x0, x1, max_points)
+            self.curve.setData(hist_t, hist_deg, skipFiniteCheck=True)
+
+        # Only touch the labels when the text actually changed (setText relayouts)
+        trial_text = f"Current Trial: {self.trial_index} / {self.MAX_TRIALS}"
+        if self.trial_label.text() != trial_text:
+            self.trial_label.setText(trial_text)
+        if self.counter_text and self.trial_counter.text() != self.counter_text:
+            self.trial_counter.setText(self.counter_text)
+
+    def _on_manual_range(self, *args):
+        """User dragged the plot -> browse the session history"""
+        self._enter_history_view()
+
+    def _on_x_range_changed(self, *args):
+        if not self.live_view:
+            self.pacer.mark_dirty()  # Re-query the pyramid for the new range
+
+    def _enter_history_view(self):
+        if self.live_view:
+            self.live_view = False
+            self.live_view_button.show()
+        self.pacer.mark_dirty()
+
+    def zoom_history(self, factor):
+        """Zoom the time axis around the centre of the view (factor > 1 zooms out)"""
+        if self.animation_in_progress or len(self.history) == 0:
+            return
+        self._enter_history_view()
+        self.plot.vb.scaleBy(x=factor, y=1)
+
+    def go_live(self):
+        """Return to following the newest samples"""
+        self.live_view = True
+        self.live_view_button.hide()
+        self.pacer.mark_dirty()
+
+    def set_filter(self, index):
+        """Switch the smoothing stage; the new filter starts from the current output so the curve does not jump"""
+        self.filter_index = index % len(self.FILTER_PRESETS)
+        label, factory = self.FILTER_PRESETS[self.filter_index]
+        self.filter_chain = FilterChain([DeadZone(self.DEAD_ZONE), factory()], label)
+        self.filter_chain.prime(self.deg_filt)
+        self.filter_button.setText(f"Filter: {label}")
+
+    def cycle_filter(self):
+        if self.animation_in_progress:
+            return
+        self.set_filter(self.filter_index + 1)
+
     def _full_reset(self):
         """Clear plot data and zero the clock (leave port open)."""
 
-        self.data_t.clear()
-        self.data_deg.clear()
+        self.plot_data.clear()
+        self.history.clear()
+        self.go_live()
+        self.samples.discard()
         self.t0       = None
         self.deg_filt = 0.0
+        self.filter_chain.reset()
         self.curve.clear()
 
     def _resume_if_needed(self):
@@ -435,9 +400,9 @@ class AfmPageWidget(QWidget):
         if not self.timer.isActive():
             self.ser.reset_input_buffer()    # drop whatever accumulated
             self._full_reset()               # fresh graph
-            self.ser.write(b"A")          # AFM = 1  ➜ start stream
-            self.ser.flush()
+            self.ser.send(b"A")           # AFM = 1  ➜ start stream
             self.timer.start(self.TIMER_MS)
+            self.pacer.start()
 
     def start_recording(self):
         if self.animation_in_progress:
@@ -445,47 +410,35 @@ class AfmPageWidget(QWidget):
         if self.trial_index >= self.MAX_TRIALS:
             return
         self.recording = True
-        self.recorded_trial_data = []
-        self.record_start_time = time.time()
+        self.recorder.start()
+        self.last_preview = 0.0
 
     def stop_recording(self):
         self.recording = False
-        with open(self.TRIAL_FILE, "a") as f:
-            f.write(",".join(f"{v:.4f}" for v in self.recorded_trial_data) + "\n")
-        self.trial_index += 1
+        self.recorder.stop()
+        trial = self.recorder.resample()  # Always MAX_VALUES_PER_TRIAL evenly spaced values
+        self.trials.append(trial)  # Saved to disk in the background
+
+    def cancel_recording(self):
+        """Drop a trial that is still being recorded (its preview row goes with it)"""
+        if not self.recording:
+            return
+        self.recording = False
+        self.recorder.stop()
+        self.trials.discard_pending()
+        self.counter_text = "Awaiting start..."
+        self.trial_counter.setText(self.counter_text)
 
     def clear_trial_file(self):
         if self.animation_in_progress:
             return
-        with open(self.TRIAL_FILE, "w") as f:
-            f.write("")
-        self.trial_index = 0
+        self.trials.clear()
 
     def clear_prev_trial(self):
-        """Clear the last trial (remove last line from trials.txt)"""
+        """Clear the last trial"""
         if self.animation_in_progress:
             return
-        
-        try:
-            if os.path.exists(self.TRIAL_FILE):
-                with open(self.TRIAL_FILE, "r") as f:
-                    lines = f.readlines()
-                
-                # Only proceed if there are lines to remove
-                if lines:
-                    # Remove the last line (strip newline and re-add if needed)
-                    lines = lines[:-1]
-                    
-                    # Write back the remaining lines
-                    with open(self.TRIAL_FILE, "w") as f:
-                        f.writelines(lines)
-                    
-                    # Update trial index
-                    self.trial_index = max(0, len(lines))
-                    self.trial_label.setText(f"Current Trial: {self.trial_index} / {self.MAX_TRIALS}")
-        except Exception:
-            # Silently ignore any file operation errors
-            pass
+        self.trials.remove_last()
 
     def on_map_button(self):
         """User pressed 'Map' → tell MainWindow to flip pages."""
@@ -543,30 +496,8 @@ class AfmPageWidget(QWidget):
             self._resume_if_needed()
         super().showEvent(event)
         
-        # Always reset and recreate the overlays when the page is shown
-        # This ensures the animations work every time
-        
-        # Clean up existing white shrinking overlay
-        if self.circle_overlay is not None:
-            self.circle_overlay.deleteLater()
-            self.circle_overlay = None
-            
-        # Clean up existing blue transition overlay (from previous visits)
-        if hasattr(self, 'blue_transition_overlay') and self.blue_transition_overlay is not None:
-            self.blue_transition_overlay.deleteLater()
-            self.blue_transition_overlay = None
-        
-        # Create fresh white shrinking overlay
-        self.circle_overlay = CircleOverlay(self)
-        self.circle_overlay.setFixedSize(800, 480)
-        self.circle_overlay.move(0, 0)  # Position at top-left corner
-        self.circle_overlay.raise_()  # Ensure it's on top of everything
-        self.circle_overlay.show()  # Explicitly show the overlay
-        
-        # Reset animation state and start the shrinking animation
-        self._reset_shrink_animation()
-        self._reset_blue_transition()  # Also reset blue transition state
-        self.shrink_animation_timer.start()
+        # Reveal the page from under a full white screen
+        self.transition.shrink(CircleTransition.WHITE, self.shrink_duration_ms)
 
     def go_back(self):
         """User hit Back -> start blue transition animation, then switch to menu."""
@@ -575,55 +506,27 @@ class AfmPageWidget(QWidget):
             
         self.disable_all_buttons()
         
-        # Stop the data stream and reset
+        # Stop the data stream and reset (a trial cut short is not kept)
+        self.cancel_recording()
         self.timer.stop()
+        self.pacer.stop()
         # Note: Don't send M command here - main.py will handle it
         self._full_reset()
 
         # Send MAIN_MENU command to Arduino to reset it from AFM mode
-        self.ser.write(b"M\n")
-        self.ser.flush()
+        self.ser.send(b"M\n")
         
         # CRITICAL: Clear any pending serial data to prevent conflicts
-        if hasattr(self, 'ser') and self.ser:
-            try:
-                self.ser.reset_input_buffer()
-                self.ser.reset_output_buffer()
-            except:
-                pass
-        
-        # Clean up shrinking animation state
-        if self.circle_overlay is not None:
-            self.shrink_animation_timer.stop()
-            self.circle_overlay.hide()
-            
-        # Clean up blue transition animation state
-        if hasattr(self, 'blue_transition_timer'):
-            self.blue_transition_timer.stop()
-        if hasattr(self, 'blue_shrinking_timer'):
-            self.blue_shrinking_timer.stop()
-        
-        # Start the blue transition animation
-        self._start_blue_transition()
+        self.ser.reset_input_buffer()  # Runs once M is out (the writer flushes every command)
         
-    def _start_blue_transition(self):
-        """Start the blue circle expansion animation when going back"""
-        # Create the blue transition overlay
-        self.blue_transition_overlay = BlueTransitionOverlay(self)
-        self.blue_transition_overlay.setFixedSize(800, 480)
-        self.blue_transition_overlay.move(0, 0)  # Position at top-left corner
-        self.blue_transition_overlay.raise_()  # Ensure it's on top of everything
-        self.blue_transition_overlay.show()  # Show the overlay
-        
-        # Reset animation state
-        self.blue_transition_frame_count = 0
-        self.blue_transition_active = True
-        
-        # Activate the blue overlay
-        self.blue_transition_overlay.set_animation_state(True)
-        
-        # Start the animation timer
-        self.blue_transition_timer.start()
+        # Cover the page in blue, then switch to the menu
+        self.transition.expand(CircleTransition.BLUE, self.expand_duration_ms, on_finished=self._finish_back)
+
+    def _finish_back(self):
+        """The blue circle has filled the screen: hand over to the main menu"""
+        # Re-enable buttons before emitting back signal
+        self.enable_all_buttons()
+        self.back_requested.emit()
 
     def closeEvent(self, event):
         super().closeEvent(event)
\ No newline at end of file
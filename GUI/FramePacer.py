@@ -0,0 +1,110 @@
+import time
+import pyqtgraph as pg
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class FramePacer(QObject):
+    """
+    Calls a render function at most ``max_fps`` times a second, and only when
+    new data has been marked dirty since the last frame.
+
+    Keeps the data path (ingest, filtering, recording) on its own timer, so a
+    slow redraw on a weak board only lowers the frame rate; it never slows down
+    acquisition. Frame cost is measured every frame and reported once a second
+    through ``stats_updated`` so smoothness can be traded for CPU. It has two
+    parts: the render call (pushing data into the plot items) and the paint
+    Qt runs afterwards, which the plot widget reports through record_paint()
+    (see PacedGraphicsLayoutWidget).
+    """
+
+    stats_updated = pyqtSignal(str)
+
+    STATS_INTERVAL_S = 1.0
+
+    def __init__(self, render, max_fps=30, parent=None):
+        super().__init__(parent)
+        self.render = render
+        self.dirty = False
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.timeout.connect(self._on_frame)
+        self.set_max_fps(max_fps)
+
+        self._reset_stats()
+
+    def set_max_fps(self, max_fps):
+        self.max_fps = max(1, int(max_fps))
+        self.budget_ms = 1000.0 / self.max_fps
+        self.frame_timer.setInterval(int(round(self.budget_ms)))
+
+    def mark_dirty(self):
+        """New data is waiting to be drawn"""
+        self.dirty = True
+
+    def start(self):
+        self._reset_stats()
+        self.frame_timer.start()
+
+    def stop(self):
+        self.frame_timer.stop()
+        self.dirty = False
+
+    def _on_frame(self):
+        if self.dirty:
+            self.dirty = False
+
+            start = time.perf_counter()
+            self.render()
+            data_ms = (time.perf_counter() - start) * 1000.0
+
+            self._frames += 1
+            self._data_total += data_ms
+            self._pending_data_ms += data_ms  # The frame is complete once it has been painted
+        # else: nothing new - skip the redraw entirely
+
+        elapsed = time.perf_counter() - self._window_start
+        if elapsed >= self.STATS_INTERVAL_S:
+            fps = self._frames / elapsed
+            data = self._data_total / self._frames if self._frames else 0.0
+            paint = self._paint_total / self._paints if self._paints else 0.0
+            frame = data + paint
+            self.stats_updated.emit(
+                f"{fps:.0f}/{self.max_fps} fps  frame {frame:.1f} ms avg (data {data:.1f} + paint {paint:.1f}), "
+                f"{self._frame_max:.1f} ms max  ({100 * frame / self.budget_ms:.0f}% of {self.budget_ms:.0f} ms budget)"
+            )
+            self._reset_stats()
+
+    def record_paint(self, paint_ms):
+        """The plot has just been painted (called by the widget, after its paintEvent)"""
+        self._paints += 1
+        self._paint_total += paint_ms
+        self._frame_max = max(self._frame_max, self._pending_data_ms + paint_ms)
+        self._pending_data_ms = 0.0
+
+    def _reset_stats(self):
+        self._window_start = time.perf_counter()
+        self._frames = 0
+        self._data_total = 0.0
+        self._pending_data_ms = 0.0
+        self._paints = 0
+        self._paint_total = 0.0
+        self._frame_max = 0.0
+
+
+class PacedGraphicsLayoutWidget(pg.GraphicsLayoutWidget):
+    """
+    GraphicsLayoutWidget that times its own paints for a FramePacer.
+
+    pyqtgraph draws in a later paint event, not inside the pacer's render
+    call, so this is the only place the drawing cost can be measured.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pacer = None  # Set once the page has created its pacer
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        super().paintEvent(event)
+        if self.pacer is not None:
+            self.pacer.record_paint((time.perf_counter() - start) * 1000.0)
@@ -0,0 +1,170 @@
+import numpy as np
+import pyqtgraph as pg
+import matplotlib.cm as cm
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtCore import Qt, QRectF, pyqtSignal
+
+
+class GainMapOverlay(QWidget):
+    """
+    Full-screen heatmap of the model's predicted overshoot / settling time
+    over a K x D grid. Tapping a cell emits gains_selected(K, D). Built once;
+    show_map() only swaps the image data.
+    """
+
+    gains_selected = pyqtSignal(float, float)
+    closed = pyqtSignal()
+
+    METRICS = {
+        "overshoot": ("Overshoot (%)", "Overshoot"),
+        "settling":  ("Settling time 2% (s)", "Settling Time"),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setGeometry(0, 0, 800, 480)  # Full screen size
+        self.setObjectName("GainMapOverlay")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setStyleSheet("""
+            QWidget#GainMapOverlay {
+                background-color: #002454;
+                border: 2px solid #FAC01A;
+            }
+            QLabel {
+                color: #FFFFFF;
+                font: 600 12px 'Roboto';
+                background-color: transparent;
+                border: none;
+            }
+            QLabel#GainMapTitle {
+                color: #FAC01A;
+                font: 600 18px 'Roboto';
+            }
+            QPushButton {
+                font: 600 14px 'Roboto';
+                color: #FFFFFF;
+                background-color: rgba(255,255,255,0.05);
+                border: 2px solid #FAC01A;
+                border-radius: 6px;
+                padding: 6px 16px;
+            }
+            QPushButton:hover {
+                background-color: rgba(255,255,255,0.10);
+            }
+        """)
+
+        self.result = None
+        self.metric = "overshoot"
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(5)
+
+        header = QHBoxLayout()
+        title = QLabel("Gain Map (model prediction)")
+        title.setObjectName("GainMapTitle")
+        self.hint_label = QLabel("Tap a cell to pick those gains")
+        self.metric_btn = QPushButton()
+        self.metric_btn.clicked.connect(self.toggle_metric)
+        header.addWidget(title)
+        header.addStretch(1)
+        header.addWidget(self.hint_label)
+        header.addStretch(1)
+        header.addWidget(self.metric_btn)
+        layout.addLayout(header)
+
+        self.graph = pg.GraphicsLayoutWidget()
+        self.graph.setBackground('#002454')
+        layout.addWidget(self.graph, stretch=1)
+
+        self.plot = self.graph.addPlot()
+        self.plot.setMouseEnabled(x=False, y=False)
+        self.plot.hideButtons()
+        self.plot.setMenuEnabled(False)
+        self.plot.setLabel("bottom", "Damping Gain (D)", color="#FFFFFF")
+        self.plot.setLabel("left", "Spring Constant (K)", color="#FFFFFF")
+        for axis in ("left", "bottom"):
+            self.plot.getAxis(axis).setPen("w")
+            self.plot.getAxis(axis).setTextPen("w")
+
+        self.img_item = pg.ImageItem()
+        self.plot.addItem(self.img_item)
+        lut = (cm.get_cmap("viridis")(np.linspace(0, 1, 256)) * 255).astype(np.ubyte)
+        self.img_item.setLookupTable(lut)
+
+        # Current picker gains
+        self.marker = pg.ScatterPlotItem(size=14, symbol="x", pen=pg.mkPen("#FF6B6B", width=3), brush=None)
+        self.plot.addItem(self.marker)
+
+        self.scale_label = QLabel()
+        self.scale_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.scale_label)
+
+        back_button = QPushButton("Back")
+        back_button.clicked.connect(self.close_map)
+        layout.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        self.graph.scene().sigMouseClicked.connect(self._on_click)
+        self._update_metric_button()
+        self.hide()
+
+    def show_map(self, result, K, D):
+        """result: SpringDampenerModel.sweep() output; K, D: the current picker gains"""
+        self.result = result
+        self.set_marker(K, D)
+        self._draw()
+        self.show()
+        self.raise_()
+
+    def set_marker(self, K, D):
+        self.marker.setData([D], [K])
+
+    def toggle_metric(self):
+        self.metric = "settling" if self.metric == "overshoot" else "overshoot"
+        self._update_metric_button()
+        self._draw()
+
+    def _update_metric_button(self):
+        other = "settling" if self.metric == "overshoot" else "overshoot"
+        self.metric_btn.setText(f"Show {self.METRICS[other][1]}")
+
+    def _draw(self):
+        if self.result is None:
+            return
+        K, D = self.result["K"], self.result["D"]
+        values = self.result[self.metric]
+
+        # Runs that never settle are drawn at the top of the scale
+        finite = values[np.isfinite(values)]
+        high = float(finite.max()) if len(finite) else 1.0
+        high = high if high > 0 else 1.0
+        image = np.where(np.isfinite(values), values, high)
+
+        # ImageItem is column-major: image[x, y] -> x = D, y = K
+        self.img_item.setImage(image.T, levels=(0, high), autoLevels=False)
+        dK = K[1] - K[0] if len(K) > 1 else 1.0
+        dD = D[1] - D[0] if len(D) > 1 else 1.0
+        self.img_item.setRect(QRectF(D[0] - dD / 2, K[0] - dK / 2, dD * len(D), dK * len(K)))
+        self.plot.setRange(xRange=(D[0] - dD / 2, D[-1] + dD / 2), yRange=(K[0] - dK / 2, K[-1] + dK / 2), padding=0)
+
+        suffix = " (top colour = never settles)" if self.metric == "settling" else ""
+        self.scale_label.setText(f"{self.METRICS[self.metric][0]}: dark = 0, bright = {high:.1f}{suffix}")
+
+    def _on_click(self, event):
+        if self.result is None or not self.isVisible():
+            return
+        pos = self.plot.vb.mapSceneToView(event.scenePos())
+        K, D = self.result["K"], self.result["D"]
+        if not (K[0] - 1 <= pos.y() <= K[-1] + 1 and D[0] - 1 <= pos.x() <= D[-1] + 1):
+            return  # Outside the map
+        i, j = int(np.argmin(np.abs(K - pos.y()))), int(np.argmin(np.abs(D - pos.x())))
+        k, d = float(K[i]), float(D[j])
+        self.set_marker(k, d)
+        overshoot, settling = self.result["overshoot"][i, j], self.result["settling"][i, j]
+        settle_text = "never" if np.isnan(settling) else f"{settling:.1f}s"
+        self.hint_label.setText(f"K {k:.1f}, D {d:.0f}: overshoot {overshoot:.1f}%, settles {settle_text}")
+        self.gains_selected.emit(k, d)
+
+    def close_map(self):
+        self.hide()
+        self.closed.emit()
@@ -1,92 +1,15 @@
 from pathlib import Path
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore    import Qt, QSize, pyqtSignal, QTimer, QPointF
-from PyQt6.QtGui     import QIcon, QCursor, QPainter, QColor
+from PyQt6.QtCore    import Qt, QSize, pyqtSignal
+from PyQt6.QtGui     import QIcon, QCursor
 import serial
+from Animation.CircleTransition import CircleTransition
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 IMAGES_DIR   = Path("Images")
 STYLES_DIR   = PROJECT_ROOT / "Styles"
 
 
-class CircleOverlay(QWidget):
-    """Separate overlay widget for the shrinking circle animation"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        
-        # Animation properties
-        self.circle_radius = 1000  # Start with full screen coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.shrinking_circle = True
-        
-        # Set a solid background to ensure visibility
-        self.setStyleSheet("background-color: white;")
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.shrinking_circle = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the shrinking white circle overlay"""
-        if not self.shrinking_circle:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw white circle that covers the screen and shrinks
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(255, 255, 255))  # White fill
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
-
-
-class WhiteTransitionOverlay(QWidget):
-    """Overlay widget for the white transition when going back to main menu"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        
-        # Animation properties
-        self.circle_radius = 0  # Start with no coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.expanding_circle = False
-        
-        # Set transparent background
-        self.setStyleSheet("background-color: transparent;")
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.expanding_circle = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the expanding white circle overlay"""
-        if not self.expanding_circle:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw white circle that expands to fill the screen
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(255, 255, 255))  # White fill
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
-
-
 class Picker(QWidget):
     """One vertical picker column with ▲ / ▼ / Add."""
     value_added = pyqtSignal(str)
@@ -155,7 +78,7 @@ class HapticFeedbackPageWidget(QWidget):
     """Haptic Feedback page with adjustable parameters for ticks and spring constant."""
     back_requested = pyqtSignal()
 
-    def __init__(self, serial_connection=None, parent=None):
+    def __init__(self, serial_connection=None, transition=None, parent=None):
         super().__init__(parent)
 
         self.serial_connection = serial_connection
@@ -272,22 +195,10 @@ class HapticFeedbackPageWidget(QWidget):
         # Filter out None values
         self.all_buttons = [btn for btn in self.all_buttons if btn is not None]
         
-        # Shrinking circle animation setup
-        self.shrink_animation_timer = QTimer()
-        self.shrink_animation_timer.timeout.connect(self.update_shrink_animation)
-        self.shrink_animation_timer.setInterval(16)  # 60 FPS for smooth animation
-        self.shrink_frames = 35  # Same as AFM
-        self.shrink_frame_count = 0
-        self.circle_overlay = None
-        
-        # White transition animation (going back)
-        self.white_transition_timer = QTimer()
-        self.white_transition_timer.timeout.connect(self.update_white_transition)
-        self.white_transition_timer.setInterval(16)  # 60 FPS for smooth animation
-        self.white_transition_frames = 35  # Match shrinking animation speed
-        self.white_transition_frame_count = 0
-        self.white_transition_active = False
-        self.white_transition_overlay = None
+        # Circle transitions (the main window's shared overlay)
+        self.transition = transition if transition is not None else CircleTransition(self)
+        self.shrink_duration_ms = 560  # Same as AFM (35 frames at 60 FPS)
+        self.expand_duration_ms = 560  # Match shrinking animation speed
 
     # Serial communication helpers
     def _write(self, text: str):
@@ -295,8 +206,7 @@ class HapticFeedbackPageWidget(QWidget):
         if self.serial_connection is None:
             print("→", text.strip())
             return
-        self.serial_connection.write(text.encode())
-        self.serial_connection.flush()
+        self.serial_connection.send(text.encode())
 
     def _send_num_ticks(self, value: str):
         """Send number of ticks command: n{value}"""
@@ -322,125 +232,9 @@ class HapticFeedbackPageWidget(QWidget):
         for button in self.all_buttons:
             button.setEnabled(True)
 
-    def _reset_white_transition(self):
-        """Reset the white transition animation to initial state"""
-        self.white_transition_frame_count = 0
-        self.white_transition_active = False
-        if hasattr(self, 'white_transition_timer'):
-            self.white_transition_timer.stop()
-    
-    def showEvent(self, event):
-        """Called when page is shown - clean up overlays and reset animations"""
-        super().showEvent(event)
-        
-        # Always reset and recreate the overlays when the page is shown
-        # This ensures the animations work every time
-        
-        # Clean up existing white shrinking overlay
-        if self.circle_overlay is not None:
-            self.circle_overlay.deleteLater()
-            self.circle_overlay = None
-        
-        # Clean up existing white transition overlay (from previous visits)
-        if self.white_transition_overlay is not None:
-            self.white_transition_overlay.deleteLater()
-            self.white_transition_overlay = None
-        
-        # Reset animation states
-        self._reset_white_transition()
-    
     def start_shrink_animation(self):
         """Start the shrinking circle animation when page is first shown"""
-        # Clean up existing overlay if any
-        if self.circle_overlay is not None:
-            self.circle_overlay.setParent(None)
-            self.circle_overlay.deleteLater()
-            self.circle_overlay = None
-        
-        # Create fresh white shrinking overlay
-        self.circle_overlay = CircleOverlay(self)
-        self.circle_overlay.setFixedSize(800, 480)
-        self.circle_overlay.move(0, 0)
-        self.circle_overlay.raise_()
-        self.circle_overlay.show()
-        
-        # Reset animation state and start the shrinking animation
-        self.shrink_frame_count = 0
-        self.shrink_animation_timer.start()
-    
-    def update_shrink_animation(self):
-        """Update the shrinking circle animation"""
-        self.shrink_frame_count += 1
-        
-        # Calculate progress (1.0 to 0.0 - shrinking)
-        progress = 1.0 - (self.shrink_frame_count / self.shrink_frames)
-        progress = max(0.0, progress)  # Clamp to 0
-        
-        # Calculate new radius - shrink from full screen to small circle
-        start_radius = 1000  # Full screen coverage
-        end_radius = 25      # Small circle in center
-        new_radius = int(start_radius - (start_radius - end_radius) * (1.0 - progress))
-        
-        # Update the circle overlay
-        if self.circle_overlay is not None:
-            self.circle_overlay.update_circle(new_radius)
-        
-        # Check if shrinking is complete
-        if self.shrink_frame_count >= self.shrink_frames:
-            self.shrink_animation_timer.stop()
-            
-            # Hide the overlay completely
-            if self.circle_overlay is not None:
-                self.circle_overlay.set_animation_state(False)
-                self.circle_overlay.hide()
-                self.circle_overlay.setParent(None)
-                self.circle_overlay.deleteLater()
-                self.circle_overlay = None
-    
-    def update_white_transition(self):
-        """Update the white transition animation when going back"""
-        self.white_transition_frame_count += 1
-        
-        # Calculate progress (0.0 to 1.0)
-        progress = min(self.white_transition_frame_count / self.white_transition_frames, 1.0)
-        
-        # Calculate radius based on progress - expand from center to fill screen
-        max_radius = 1000  # Full screen coverage
-        white_transition_radius = progress * max_radius
-        
-        # Update the white overlay widget if it exists
-        if self.white_transition_overlay is not None:
-            self.white_transition_overlay.update_circle(white_transition_radius)
-            
-            # Check if expansion is complete
-            if self.white_transition_frame_count >= self.white_transition_frames:
-                self.white_transition_timer.stop()
-                self.white_transition_active = False
-                
-                # Re-enable buttons before emitting back signal
-                self.enable_all_buttons()
-                
-                # Now that the white circle has filled the screen, emit the back signal
-                self.back_requested.emit()
-    
-    def _start_white_transition(self):
-        """Start the white circle expansion animation when going back"""
-        # Create the white transition overlay
-        self.white_transition_overlay = WhiteTransitionOverlay(self)
-        self.white_transition_overlay.setFixedSize(800, 480)
-        self.white_transition_overlay.move(0, 0)  # Position at top-left corner
-        self.white_transition_overlay.raise_()  # Ensure it's on top of everything
-        self.white_transition_overlay.show()  # Show the overlay
-        
-        # Reset animation state
-        self.white_transition_frame_count = 0
-        self.white_transition_active = True
-        
-        # Activate the white overlay
-        self.white_transition_overlay.set_animation_state(True)
-        
-        # Start the animation timer
-        self.white_transition_timer.start()
+        self.transition.shrink(CircleTransition.WHITE, self.shrink_duration_ms, start_radius=1000, end_radius=25)
     
     def go_back(self):
         """Start white transition animation, then emit back signal"""
@@ -451,13 +245,14 @@ class HapticFeedbackPageWidget(QWidget):
         self.disable_all_buttons()
         
         # Send MAIN_MENU command to Arduino to reset it from Haptic Feedback mode
-        self.serial_connection.write(b"M\n")
-        self.serial_connection.flush()
-        
-        # Clean up any existing white transition overlay
-        if self.white_transition_overlay is not None:
-            self.white_transition_overlay.deleteLater()
-            self.white_transition_overlay = None
+        self.serial_connection.send(b"M\n")
         
         # Start the white transition animation
-        self._start_white_transition()
+        self.transition.expand(CircleTransition.WHITE, self.expand_duration_ms, end_radius=1000,
+                               on_finished=self._finish_back)
+
+    def _finish_back(self):
+        """The white circle has filled the screen: hand over to the main menu"""
+        # Re-enable buttons before emitting back signal
+        self.enable_all_buttons()
+        self.back_requested.emit()
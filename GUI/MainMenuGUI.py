@@ -1,136 +1,15 @@
 
 from pathlib import Path
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
-from PyQt6.QtCore    import Qt, QTimer, QPointF
-from PyQt6.QtGui     import QPixmap, QTransform, QPainter, QColor
+from PyQt6.QtCore    import Qt, QTimer
+from PyQt6.QtGui     import QPixmap
 import Config
-
-
-class YellowCircleOverlay(QWidget):
-    """Separate overlay widget for the shrinking yellow circle animation"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)  # Pass through mouse events
-        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        
-        # Animation properties
-        self.circle_radius = 1000  # Start with full screen coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.visible = True
-        
-        # Set a solid background to ensure visibility
-        self.setStyleSheet("background-color: transparent;")  # Start transparent
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.visible = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the shrinking yellow circle overlay"""
-        if not self.visible:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw yellow circle that covers the screen and shrinks
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(250, 192, 26))  # #FAC01A
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
-
-
-class BlueCircleOverlay(QWidget):
-    """Separate overlay widget for the shrinking blue circle animation"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)  # Pass through mouse events
-        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        
-        # Animation properties
-        self.circle_radius = 1000  # Start with full screen coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.visible = True
-        
-        # Set a solid background to ensure visibility
-        self.setStyleSheet("background-color: transparent;")  # Start transparent
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.visible = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the shrinking blue circle overlay"""
-        if not self.visible:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw blue circle that covers the screen and shrinks
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(0, 36, 84))  # #002454
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
-
-
-class WhiteCircleOverlay(QWidget):
-    """Separate overlay widget for the shrinking white circle animation when coming back from Power Pong"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)  # Pass through mouse events
-        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        
-        # Animation properties
-        self.circle_radius = 1000  # Start with full screen coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.visible = True
-        
-        # Set a solid background to ensure visibility
-        self.setStyleSheet("background-color: transparent;")  # Start transparent
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.visible = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the shrinking white circle overlay"""
-        if not self.visible:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw white circle that covers the screen and shrinks
-        painter.setPen(Qt.PenStyle.NoPen)  # No outline
-        painter.setBrush(QColor(255, 255, 255))  # White fill
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
+from Animation.GearRenderer import GearRenderer
+from Animation.CircleTransition import CircleTransition
 
 
 class MenuPage(QWidget):
-    def __init__(self, ser, main_window=None, parent=None):
+    def __init__(self, ser, main_window=None, transition=None, parent=None):
         super().__init__(parent)
         self.ser = ser
         self.main_window = main_window  # Store reference to main window
@@ -163,19 +42,10 @@ class MenuPage(QWidget):
         logo_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
         logo_lbl.setStyleSheet("background-color: transparent;")  # Ensure logo has no background
         
-        # Rotating gear setup
-        gear_path = base_dir / "Animation" / "Sprites" / "gearMainMenu.png"
-        if gear_path.exists():
-            self.original_gear_pixmap = QPixmap(str(gear_path))
-        else:
-            self.original_gear_pixmap = QPixmap()
-        
-        # Create gear label that will rotate around the logo
-        self.gear_label = QLabel()
-        self.gear_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Create gear that will rotate around the logo
+        self.gear_label = GearRenderer(base_dir / "Animation" / "Sprites" / "gearMainMenu.png")
         self.gear_size = 324  # Same size as startup animation
         self.gear_label.setFixedSize(self.gear_size, self.gear_size)  # Fixed size for precise positioning
-        self.gear_label.setStyleSheet("background-color: transparent;")
         
         # Position gear using easily adjustable x,y coordinates
         # Adjust these values to position the gear exactly where you want it
@@ -202,7 +72,7 @@ class MenuPage(QWidget):
         self.rotation_timer.timeout.connect(self.update_gear_rotation)
         self.rotation_timer.setInterval(50)  # 20 FPS for smooth but not too fast rotation
         
-        # Start the rotation animation
+        # Start the rotation animation (paused whenever the menu is hidden)
         self.rotation_timer.start()
         
         # Load and display the initial gear image
@@ -336,41 +206,13 @@ class MenuPage(QWidget):
         
         lay.addStretch()
         
-        # Circle overlay animation setup
-        self.shrink_animation_timer = QTimer()
-        self.shrink_animation_timer.timeout.connect(self.update_shrink_animation)
-        self.shrink_animation_timer.setInterval(16)  # 60 FPS for smooth animation
-        self.shrink_frames = 20  # 0.33 seconds
-        self.shrink_frame_count = 0
-        
-        # Don't create overlays automatically - they will be created by specific functions
-        self.yellow_circle_overlay = None
-        self.blue_circle_overlay = None
-        self.white_circle_overlay = None
+        # Circle reveal when arriving at the menu (the main window's shared overlay)
+        self.transition = transition if transition is not None else CircleTransition(self)
+        self.shrink_duration_ms = 320  # 20 frames at 60 FPS
     
     def update_gear_rotation(self):
         """Update the gear image with current rotation angle"""
-        if self.original_gear_pixmap.isNull():
-            return
-            
-        # Create a transform for rotation - using the exact same method as startup animation
-        transform = QTransform()
-        transform.translate(self.gear_size // 2, self.gear_size // 2)  # Move to center
-        transform.rotate(self.rotation_angle)  # Apply rotation
-        transform.translate(-self.gear_size // 2, -self.gear_size // 2)  # Move back
-        
-        # Apply the transform to create rotated gear
-        rotated_gear = self.original_gear_pixmap.scaled(
-            self.gear_size, self.gear_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        # Apply rotation transform
-        rotated_gear = rotated_gear.transformed(transform, Qt.TransformationMode.SmoothTransformation)
-        
-        # Set the rotated gear to the label
-        self.gear_label.setPixmap(rotated_gear)
+        self.gear_label.set_angle(self.rotation_angle)
         
         # Increment rotation angle for next frame
         self.rotation_angle += self.rotation_speed
@@ -378,105 +220,39 @@ class MenuPage(QWidget):
         # Keep angle between 0 and 360 degrees
         self.rotation_angle = self.rotation_angle % 360
     
-    def update_shrink_animation(self):
-        """Update the circle shrinking animation frame by frame (works for both yellow and blue)"""
-        self.shrink_frame_count += 1
-        
-        # Calculate progress (0.0 to 1.0)
-        progress = min(self.shrink_frame_count / self.shrink_frames, 1.0)
-        
-        # Calculate new radius - shrink from full screen to small circle
-        start_radius = 1000  # Full screen coverage (much larger than needed)
-        end_radius = 25      # Small circle in center
-        new_radius = int(start_radius - (start_radius - end_radius) * progress)
-        
-        # Update the appropriate overlay widget
-        if self.yellow_circle_overlay is not None:
-            self.yellow_circle_overlay.update_circle(new_radius)
-        elif self.blue_circle_overlay is not None:
-            self.blue_circle_overlay.update_circle(new_radius)
-        elif self.white_circle_overlay is not None:
-            self.white_circle_overlay.update_circle(new_radius)
-        
-        # Check if shrinking is complete
-        if self.shrink_frame_count >= self.shrink_frames:
-            self.shrink_animation_timer.stop()
-            
-            # Hide the appropriate overlay completely
-            if self.yellow_circle_overlay is not None:
-                self.yellow_circle_overlay.set_animation_state(False)
-                self.yellow_circle_overlay = None
-            elif self.blue_circle_overlay is not None:
-                self.blue_circle_overlay.set_animation_state(False)
-                self.blue_circle_overlay = None
-            elif self.white_circle_overlay is not None:
-                self.white_circle_overlay.set_animation_state(False)
-                self.white_circle_overlay = None
-    
+    def _start_circle_animation(self, color):
+        """Shrink a full-screen circle of color down to the centre to reveal the menu"""
+        # Small delay before the circle starts closing, as the page settles in
+        self.transition.shrink(color, self.shrink_duration_ms, start_radius=1000, end_radius=25, delay_ms=100)
+
     def start_yellow_circle_animation(self):
         """Start the yellow circle shrinking animation (called after startup animation)"""
-        # Create the yellow circle overlay
-        if self.main_window:
-            self.yellow_circle_overlay = YellowCircleOverlay(self.main_window)
-        else:
-            self.yellow_circle_overlay = YellowCircleOverlay(self)
-            
-        self.yellow_circle_overlay.setFixedSize(800, 480)
-        self.yellow_circle_overlay.move(0, 0)  # Position at top-left corner
-        
-        # CRITICAL: Ensure overlay is on top of everything
-        self.yellow_circle_overlay.raise_()  # Raise to top
-        self.yellow_circle_overlay.show()    # Show the overlay
-        
-        # Reset animation state and start the shrinking animation
-        self.shrink_frame_count = 0
-        QTimer.singleShot(100, self.shrink_animation_timer.start)  # 0.1 second delay
+        self._start_circle_animation(CircleTransition.YELLOW)
         
     def start_blue_circle_animation(self):
         """Start the blue circle shrinking animation (called when coming back from AFM GUI)"""
-        # Create the blue circle overlay
-        if self.main_window:
-            self.blue_circle_overlay = BlueCircleOverlay(self.main_window)
-        else:
-            self.blue_circle_overlay = BlueCircleOverlay(self)
-            
-        self.blue_circle_overlay.setFixedSize(800, 480)
-        self.blue_circle_overlay.move(0, 0)  # Position at top-left corner
-        
-        # CRITICAL: Ensure overlay is on top of everything
-        self.blue_circle_overlay.raise_()  # Raise to top
-        self.blue_circle_overlay.show()    # Show the overlay
-        
-        # Reset animation state and start the shrinking animation
-        self.shrink_frame_count = 0
-        QTimer.singleShot(100, self.shrink_animation_timer.start)  # 0.1 second delay
+        self._start_circle_animation(CircleTransition.BLUE)
         
     def start_white_circle_animation(self):
         """Start the white circle shrinking animation (called when coming back from Power Pong)"""
-        # Create the white circle overlay
-        if self.main_window:
-            self.white_circle_overlay = WhiteCircleOverlay(self.main_window)
-        else:
-            self.white_circle_overlay = WhiteCircleOverlay(self)
-            
-        self.white_circle_overlay.setFixedSize(800, 480)
-        self.white_circle_overlay.move(0, 0)  # Position at top-left corner
-        
-        # CRITICAL: Ensure overlay is on top of everything
-        self.white_circle_overlay.raise_()  # Raise to top
-        self.white_circle_overlay.show()    # Show the overlay
-        
-        # Reset animation state and start the shrinking animation
-        self.shrink_frame_count = 0
-        QTimer.singleShot(100, self.shrink_animation_timer.start)  # 0.1 second delay
+        self._start_circle_animation(CircleTransition.WHITE)
 
-    
     def reposition_gear(self, x, y):
         """Reposition the gear to new coordinates at runtime"""
         self.gear_x = x
         self.gear_y = y
         self.gear_label.move(self.gear_x, self.gear_y)
-    
+
+    def showEvent(self, event):
+        """Resume the gear when the menu comes back"""
+        super().showEvent(event)
+        self.rotation_timer.start()
+
+    def hideEvent(self, event):
+        """No point spinning the gear while another page covers the menu"""
+        super().hideEvent(event)
+        self.rotation_timer.stop()
+
     def quit_app(self):
         """Quit the application (called by escape button in dev mode)"""
         if self.main_window:
@@ -1,8 +1,11 @@
 from pathlib import Path
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore    import Qt, QSize, pyqtSignal, QTimer, QPointF
-from PyQt6.QtGui     import QIcon, QCursor, QPainter, QColor, QPen
+from PyQt6.QtCore    import Qt, QSize, pyqtSignal
+from PyQt6.QtGui     import QIcon, QCursor
 import Config
+from Comms.MotorStateMachine import MotorStateMachine
+from Comms.CommandQueue import CommandQueue
+from Animation.CircleTransition import CircleTransition
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 IMAGES_DIR   = Path("Images")
@@ -71,84 +74,6 @@ class Picker(QWidget):
         self.value_added.emit(self._value)
 
 
-class CircleOverlay(QWidget):
-    """Separate overlay widget for the shrinking circle animation"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        
-        # Animation properties
-        self.circle_radius = 933  # Start with full screen coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.shrinking_circle = True
-        
-        # Set a solid background to ensure visibility
-        self.setStyleSheet("background-color: white;")
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.shrinking_circle = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the shrinking white circle overlay"""
-        if not self.shrinking_circle:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw white circle that covers the screen and shrinks
-        painter.setPen(Qt.PenStyle.NoPen)  # No outline
-        painter.setBrush(QColor(255, 255, 255))  # White fill
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
-
-
-class WhiteTransitionOverlay(QWidget):
-    """Overlay widget for the white transition when going back to main menu"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        
-        # Animation properties
-        self.circle_radius = 0  # Start with no coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.expanding_circle = False
-        
-        # Set transparent background
-        self.setStyleSheet("background-color: transparent;")
-        
-    def update_circle(self, radius):
-        """Update the circle radius for animation"""
-        self.circle_radius = radius
-        self.update()
-        
-    def set_animation_state(self, active):
-        """Set whether the animation is active"""
-        self.expanding_circle = active
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the expanding white circle overlay"""
-        if not self.expanding_circle:
-            return
-            
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw white circle that expands to fill the screen
-        painter.setPen(Qt.PenStyle.NoPen)  # No outline
-        painter.setBrush(QColor(255, 255, 255))  # White fill
-        painter.drawEllipse(self.circle_center, self.circle_radius, self.circle_radius)
-
-
 class PowerPongPageWidget(QWidget):
     """
     Shows the Power-Pong controls and forwards user actions to the Arduino
@@ -156,12 +81,15 @@ class PowerPongPageWidget(QWidget):
 
     Parameters
     ----------
-    ser : serial.Serial-like object
-        Must support .write(bytes) and .flush(); pass None for boardless mode.
+    ser : SerialDispatcher
+        Must support .send(bytes) (non-blocking write) and expose the
+        dispatcher's motor_status_changed signal; pass None for boardless mode.
+    transition : CircleTransition
+        The main window's shared circle overlay (the page makes its own if None).
     """
     back_requested = pyqtSignal()
 
-    def __init__(self, ser, parent: QWidget | None = None):
+    def __init__(self, ser, transition=None, parent: QWidget | None = None):
         super().__init__(parent)
         self.ser = ser                      # <- remember the port (can be None)
 
@@ -235,45 +163,24 @@ class PowerPongPageWidget(QWidget):
         # Filter out None values
         self.all_buttons = [btn for btn in self.all_buttons if btn is not None]
         
-        # Shrinking circle animation
-        self.shrinking_circle = True  # Start with white screen
-        self.circle_radius = 933  # Start with full screen coverage
-        self.circle_center = QPointF(400, 240)  # Center of screen
-        self.shrink_animation_timer = QTimer()
-        self.shrink_animation_timer.timeout.connect(self.update_shrink_animation)
-        self.shrink_animation_timer.setInterval(16)  # 60 FPS for smooth animation
-        self.shrink_frames = 35  # Same speed as expanding circle
-        self.shrink_frame_count = 0
-        
-        # Don't create overlay here - wait until page is shown
-        self.circle_overlay = None
-        
-        # White transition animation (going back)
-        self.white_transition_timer = QTimer()
-        self.white_transition_timer.timeout.connect(self.update_white_transition)
-        self.white_transition_timer.setInterval(16)  # 60 FPS for smooth animation
-        self.white_transition_frames = 30  # 0.5 seconds
-        self.white_transition_frame_count = 0
-        self.white_transition_active = False
-        
-        # Don't create white transition overlay here - wait until needed
-        self.white_transition_overlay = None
-
-        # Motor handling to ensure we dont transition while moving
-        self.motorMoving = True
-        self.motor_timeout_timer = QTimer()
-        self.motor_timeout_timer.timeout.connect(self.motor_timout_handling)
-        # Set timeout to 5 seconds (5000 milliseconds)
-        self.motor_timeout_timer.setInterval(4000)
-        #self.motor_timeout_timer.setSingleShot(True)  # Only fires once
-        
-        self.sending_command = False
+        # Circle transitions (the main window's shared overlay)
+        self.transition = transition if transition is not None else CircleTransition(self)
+        self.shrink_duration_ms = 560  # White reveal when the page opens (35 frames at 60 FPS)
+        self.expand_duration_ms = 480  # White wipe when going back (30 frames at 60 FPS)
+
+        # Motor handling to ensure we dont send commands or transition while moving
+        self.motor = MotorStateMachine(Config.POWER_PONG_MOTOR_TIMEOUT_MS, self)
+        # Taps made while the motor is busy wait here instead of being dropped
+        self.commands = CommandQueue(self.motor, self._write, self)
+        # Back pressed while the motor was busy: leave once it is idle and the queue is empty
+        self.back_pending = False
+        self.motor.ready_changed.connect(self._leave_if_pending)  # After the queue has drained
         
         self.animation_in_progress = False
         
-        self.motor_status_timer = QTimer()
-        self.motor_status_timer.timeout.connect(self.check_for_character)
-        self.motor_status_timer.start(10)
+        # Motor status ('Z' / 'z') comes from the serial dispatcher
+        if self.ser is not None:
+            self.ser.motor_status_changed.connect(self.motor.on_motor_status)
     
     def disable_all_buttons(self):
         """Disable all buttons during animations"""
@@ -290,204 +197,81 @@ class PowerPongPageWidget(QWidget):
     # Serial communication helpers
     def _write(self, text: str):
         """
-        Low-level send. Falls back to a console print when no port present.
+        Low-level send, queued for the dispatcher's writer thread so the GUI
+        never waits on the port. Falls back to a console print when no port present.
         """
         if self.ser is None:
             print("→", text.strip())
             return
-            
-        self.sending_command = True
-        self.ser.write(text.encode())
-        self.ser.flush()
-        self.sending_command = False
+
+        self.ser.send(text.encode())
 
     def _send_speed(self, value: int):
-        if self.animation_in_progress or self.motorMoving:
+        if self.animation_in_progress:
             return
 
+        # Only sets the swing velocity, the motor does not move
         value = value * POWER_SCALE
-        self._write(f"T{value}\n")
+        self.commands.submit(f"T{value}\n")
 
     def _send_offset(self, value: int):
-        if self.animation_in_progress or self.motorMoving:
+        if self.animation_in_progress:
             return
-        self._write(f"O{value}\n")
+        self.commands.submit(f"O{value}\n")
 
     def _send_fore(self):
-        if self.animation_in_progress or self.motorMoving:
+        if self.animation_in_progress:
             return
-        self._write("G\n")
+        self.commands.submit("G\n")
 
     def _send_zero_position(self):
         # Send command in SimpleFOC Commander format: "R {offset}"
-        if self.animation_in_progress or self.motorMoving:
+        if self.animation_in_progress:
             return
         current_offset = 90
-        self._write(f"R{current_offset}\n")
-
-    def motor_timout_handling(self):
-        """This function is responsible for resetting motor moving flag upon timout"""
-        self.motorMoving = False
-        self.motor_timeout_timer.stop()
-
-    # Animation methods
-    def _reset_shrink_animation(self):
-        """Reset the shrinking circle animation to initial state"""
-        self.shrink_frame_count = 0
-        self.shrinking_circle = True
-        self.circle_radius = 933  # Full screen coverage
-        if hasattr(self, 'shrink_animation_timer'):
-            self.shrink_animation_timer.stop()
-            
-    def update_shrink_animation(self):
-        """Update the shrinking circle animation"""
-        self.shrink_frame_count += 1
-        
-        # Calculate progress (0.0 to 1.0) - reverse of expanding circle
-        progress = 1.0 - (self.shrink_frame_count / self.shrink_frames)
-        progress = max(0.0, progress)  # Don't go below 0
-        
-        # Calculate radius based on progress
-        max_radius = 933
-        self.circle_radius = progress * max_radius
-        
-        # Update the overlay widget if it exists
-        if self.circle_overlay is not None:
-            self.circle_overlay.update_circle(self.circle_radius)
-            
-            # Check if shrinking is complete
-            if self.shrink_frame_count >= self.shrink_frames:
-                self.shrink_animation_timer.stop()
-                self.shrinking_circle = False
-                self.circle_overlay.set_animation_state(False)  # Hide the overlay
-        
-        # Using this point as a starting point for the page
-        self.motor_timeout_timer.start()
-                
-    def _reset_white_transition(self):
-        """Reset the white transition animation to initial state"""
-        self.white_transition_frame_count = 0
-        self.white_transition_active = False
-        if hasattr(self, 'white_transition_timer'):
-            self.white_transition_timer.stop()
-            
-    def update_white_transition(self):
-        """Update the white transition animation when going back"""
-        self.white_transition_frame_count += 1
-        
-        # Calculate progress (0.0 to 1.0)
-        progress = min(self.white_transition_frame_count / self.white_transition_frames, 1.0)
-        
-        # Calculate radius based on progress - expand from center to fill screen
-        max_radius = 933  # Full screen coverage
-        self.white_transition_radius = progress * max_radius
-        
-        # Update the white overlay widget if it exists
-        if self.white_transition_overlay is not None:
-            self.white_transition_overlay.update_circle(self.white_transition_radius)
-            
-            # Check if expansion is complete
-            if self.white_transition_frame_count >= self.white_transition_frames:
-                self.white_transition_timer.stop()
-                self.white_transition_active = False
-                
-                # Re-enable buttons before emitting back signal
-                self.enable_all_buttons()
-                
-                # Now that the white circle has filled the screen, emit the back signal
-                # This will trigger the page transition to main menu
-                self.back_requested.emit()
-                
+        self.commands.submit(f"R{current_offset}\n")
+
+    def expect_setup(self):
+        """The main window just sent P: the board homes the paddle (Z ... z) before commands are accepted"""
+        self.motor.command("P")
+
     def go_back(self):
         """User hit Back -> start white transition animation, then switch to menu."""
-        if self.animation_in_progress or self.motorMoving:
+        if self.animation_in_progress:
             return
 
-        self.motorMoving = True
+        self.disable_all_buttons()  # No more taps; queued commands still go out
+
+        if not self.motor.ready or len(self.commands):
+            print(f"Back: waiting for the motor ({len(self.commands)} command(s) queued)")  # Debug
+            self.back_pending = True
+            return
+        self._leave()
 
-        self.motor_timeout_timer.stop()
-            
-        self.disable_all_buttons()
+    def _leave_if_pending(self, ready):
+        # The queue may have started another move on this same ready signal, so ask the motor again
+        if self.back_pending and self.motor.ready and not len(self.commands):
+            self._leave()
+
+    def _leave(self):
+        self.back_pending = False
+        self.motor.lock()
         
         # Send MAIN_MENU command to Arduino 
-        self.ser.write(b"M\n")
-        self.ser.flush()
-        # Clean up shrinking animation state
-        if self.circle_overlay is not None:
-            self.shrink_animation_timer.stop()
-            self.circle_overlay.hide()
-            
-        # Clean up white transition animation state
-        if hasattr(self, 'white_transition_timer'):
-            self.white_transition_timer.stop()
-        
-        # Start the white transition animation
-        self._start_white_transition()
-        
-    def _start_white_transition(self):
-        """Start the white circle expansion animation when going back"""
-        # Create the white transition overlay
-        self.white_transition_overlay = WhiteTransitionOverlay(self)
-        self.white_transition_overlay.setFixedSize(800, 480)
-        self.white_transition_overlay.move(0, 0)  # Position at top-left corner
-        self.white_transition_overlay.raise_()  # Ensure it's on top of everything
-        self.white_transition_overlay.show()  # Show the overlay
-        
-        # Reset animation state
-        self.white_transition_frame_count = 0
-        self.white_transition_active = True
-        
-        # Activate the white overlay
-        self.white_transition_overlay.set_animation_state(True)
-        
-        # Start the animation timer
-        self.white_transition_timer.start()
+        self._write("M\n")
+
+        # Cover the page in white, then switch to the menu
+        self.transition.expand(CircleTransition.WHITE, self.expand_duration_ms, on_finished=self._finish_back)
+
+    def _finish_back(self):
+        """The white circle has filled the screen: hand over to the main menu"""
+        # Re-enable buttons before emitting back signal
+        self.enable_all_buttons()
+        self.back_requested.emit()
 
     def showEvent(self, event):
         """Override showEvent to trigger the white screen collapse animation"""
         super().showEvent(event)
 
-        # Always reset and recreate the overlays when the page is shown
-        # This ensures the animations work every time
-        
-        # Clean up existing white shrinking overlay
-        if self.circle_overlay is not None:
-            self.circle_overlay.deleteLater()
-            self.circle_overlay = None
-            
-        # Clean up existing white transition overlay (from previous visits)
-        if hasattr(self, 'white_transition_overlay') and self.white_transition_overlay is not None:
-            self.white_transition_overlay.deleteLater()
-            self.white_transition_overlay = None
-        
-        # Create fresh white shrinking overlay
-        self.circle_overlay = CircleOverlay(self)
-        self.circle_overlay.setFixedSize(800, 480)
-        self.circle_overlay.move(0, 0)  # Position at top-left corner
-        self.circle_overlay.raise_()  # Ensure it's on top of everything
-        self.circle_overlay.show()  # Explicitly show the overlay
-        
-        # Reset animation state and start the shrinking animation
-        self._reset_shrink_animation()
-        self._reset_white_transition()  # Also reset white transition state
-        self.shrink_animation_timer.start()
-
-    def check_for_character(self):
-        """Check for motor status characters from Arduino"""
-        if self.sending_command:
-            return
-            
-        if self.ser and self.ser.in_waiting > 0:
-            try:
-                data = self.ser.read().decode('utf-8', errors='ignore')
-                if data == 'Z':
-                    print("Motor moving")
-                    self.motorMoving = True
-                    self.motor_timeout_timer.start()
-                elif data == 'z':
-                    print("Motor NOT moving")
-                    self.motorMoving = False
-                    self.motor_timeout_timer.stop() 
-            except:
-                pass
-            
\ No newline at end of file
+        # Reveal the page from under a full white screen
+        self.transition.shrink(CircleTransition.WHITE, self.shrink_duration_ms)
@@ -1,18 +1,53 @@
 from pathlib import Path
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore    import Qt, QSize, pyqtSignal, QTimer
+from PyQt6.QtCore    import Qt, QSize, pyqtSignal, QTimer, QThread
 from PyQt6.QtGui     import QIcon, QCursor
-import serial
 import time
+import numpy as np
+from Data.SwingCollector import SwingCollector
+from Data.SwingAnalysis import analyze_step
+from Data.SpringDampenerModel import SpringDampenerModel, fit_plant, recommend_gains
+from GUI.SwingGraphGUI import SwingGraphOverlay, LiveSwingPlot
+from GUI.GainMapGUI import GainMapOverlay
+from Comms.SweepRunner import SweepRunner
+from Data.SweepResults import SweepResults
+from Data.SwingHistory import SwingHistory
+from GUI.SweepGUI import SweepOverlay
+import Config
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 IMAGES_DIR   = Path("Images")
 STYLES_DIR   = PROJECT_ROOT / "Styles"
 
 
+class PlantFitThread(QThread):
+    """Fits the plant to one swing and simulates the gain grid for it, off the GUI thread"""
+    fitted = pyqtSignal(int, object, object)  # History index, fit (None if too small), sweep (None if not needed)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.job = None
+
+    def fit(self, index, data, K, D, fit, model, K_values, D_values):
+        """Start a job; fit is the cached fit of this run (or None to fit it here)"""
+        self.job = (index, data, K, D, fit, model, K_values, D_values)
+        self.start()
+
+    def run(self):
+        index, data, K, D, fit, model, K_values, D_values = self.job
+        if fit is None:
+            fit = fit_plant(data[:, 0], data[:, 1], K, D)
+        sweep = None
+        if fit is not None:
+            plant = SpringDampenerModel(fit["gain"], fit["friction"], model.voltage_limit, model.dt)
+            sweep = plant.sweep(K_values, D_values)
+        self.fitted.emit(index, fit, sweep)
+
+
 class Picker(QWidget):
     """One vertical picker column with ▲ / ▼ / Add."""
     value_added = pyqtSignal(str)
+    value_changed = pyqtSignal(float)  # Every ▲ / ▼ step, before Add is pressed
 
     COL_W = 200
 
@@ -68,6 +103,17 @@ class Picker(QWidget):
             self._value = new_value
             display_text = f"{self._value:.1f}" if self._is_float else str(int(self._value))
             self.value_lbl.setText(display_text)
+            self.value_changed.emit(self._value)
+
+    def value(self) -> float:
+        return self._value
+
+    def set_value(self, value: float):
+        """Set the displayed value (clamped to the range) without sending it"""
+        self._value = min(self._max_val, max(self._min_val, round(value, 1) if self._is_float else int(round(value))))
+        display_text = f"{self._value:.1f}" if self._is_float else str(int(self._value))
+        self.value_lbl.setText(display_text)
+        self.value_changed.emit(self._value)
 
     def _emit_add(self):
         formatted_value = f"{self._value:.1f}" if self._is_float else str(int(self._value))
@@ -78,12 +124,30 @@ class SpringDampenerPageWidget(QWidget):
     """Spring Dampener Tuning page with adjustable parameters."""
     back_requested = pyqtSignal()
 
-    def __init__(self, serial_connection=None, parent=None):
+    # Gain grid of the gain map and the recommendation (K = 0 never moves, so start at 1)
+    SWEEP_K = np.arange(1, 51)
+    SWEEP_D = np.arange(0, 51)
+
+    def __init__(self, serial_connection=None, history=None, parent=None):
         super().__init__(parent)
 
         self.serial_connection = serial_connection
+        # Every swing of the session (MainWindow owns it so it outlives menu round trips)
+        self.history = history if history is not None else SwingHistory(Config.SPRING_HISTORY_FILE)
         self.data_collection_active = False
-        self.swing_data = []
+        self.swing_data = SwingCollector()  # (time, position) rows of the current swing
+        
+        # Digital twin used to preview gains before running the hardware
+        self.model = SpringDampenerModel(Config.SPRING_PLANT_GAIN, Config.SPRING_PLANT_FRICTION)
+        self.gain_sweeps = {}  # K x D sweep per (gain, friction) plant, computed on first use
+        self.plant_fits = {}  # Fitted plant per history run
+        self.current_fit = None  # (fit, K, D) of the swing on the graph
+        self.fit_thread = PlantFitThread(self)  # Fit + gain sweep of a newly graphed swing
+        self.fit_thread.fitted.connect(self._on_swing_fitted)
+        self.graph_index = -1  # History run on the graph
+        self.active_gains = [13.0, 3.0]  # K, D on the board (firmware defaults until changed)
+        self.swing_gains = tuple(self.active_gains)  # Gains of the last Test run
+        self.target_settling = Config.SPRING_TARGET_SETTLING_S
         
         # Add safety mechanism to prevent rapid button clicking
         self.last_test_time = 0
@@ -112,6 +176,8 @@ class SpringDampenerPageWidget(QWidget):
         # Wire pickers to handle value changes
         self.spring_picker.value_added.connect(self._send_spring_constant)
         self.damping_picker.value_added.connect(self._send_damping_gain)
+        self.spring_picker.value_changed.connect(self._update_prediction)
+        self.damping_picker.value_changed.connect(self._update_prediction)
 
         row.addStretch(1)
         row.addWidget(self.spring_picker)
@@ -133,6 +199,27 @@ class SpringDampenerPageWidget(QWidget):
         graph_btn.clicked.connect(self._graph_swing_data)
         button_column.addWidget(graph_btn, alignment=Qt.AlignmentFlag.AlignHCenter)
         
+        # Live trace of the swing while the test runs
+        self.live_plot = LiveSwingPlot()
+        button_column.addWidget(self.live_plot, alignment=Qt.AlignmentFlag.AlignHCenter)
+        
+        # Predicted overshoot / settling over all gains
+        gain_map_btn = QPushButton("Gain Map")
+        gain_map_btn.setObjectName("GainMapBtn")
+        gain_map_btn.clicked.connect(self._show_gain_map)
+        
+        # Unattended K/D sweep on the hardware
+        sweep_btn = QPushButton("Sweep")
+        sweep_btn.setObjectName("SweepBtn")
+        sweep_btn.clicked.connect(self._show_sweep)
+        sweep_btn.setEnabled(self.serial_connection is not None)
+        
+        small_row = QHBoxLayout()
+        small_row.setSpacing(8)
+        small_row.addWidget(gain_map_btn)
+        small_row.addWidget(sweep_btn)
+        button_column.addLayout(small_row)
+        
         # Add the button column to the main row
         row.addLayout(button_column)
 
@@ -215,6 +302,18 @@ class SpringDampenerPageWidget(QWidget):
                 QPushButton#GraphBtn:hover {
                     background-color: rgba(255,255,255,0.10);
                 }
+                QPushButton#GainMapBtn, QPushButton#SweepBtn {
+                    font: 600 16px 'Roboto';
+                    color: #FFFFFF;
+                    background-color: rgba(255,255,255,0.05);
+                    border: 2px solid #FAC01A;
+                    border-radius: 8px;
+                    padding: 6px 12px;
+                    min-width: 92px;
+                }
+                QPushButton#GainMapBtn:hover, QPushButton#SweepBtn:hover {
+                    background-color: rgba(255,255,255,0.10);
+                }
                 QPushButton#BackBtn {
                     font: 600 18px 'Roboto';
                     color: #FFFFFF;
@@ -239,29 +338,99 @@ class SpringDampenerPageWidget(QWidget):
             self.damping_picker.add_btn if hasattr(self.damping_picker, 'add_btn') else None,
             test_btn,
             graph_btn,
+            gain_map_btn,
+            sweep_btn,
             back_btn
         ]
         # Filter out None values
         self.all_buttons = [btn for btn in self.all_buttons if btn is not None]
 
+        # Step response graph - built once, hidden until the Graph button is pressed
+        self.graph_overlay = SwingGraphOverlay(self)
+        self.gain_map = GainMapOverlay(self)
+        self.gain_map.gains_selected.connect(self._on_gain_map_selected)
+        self.graph_overlay.set_target(self.target_settling)
+        self.graph_overlay.target_changed.connect(self._on_target_changed)
+        self.graph_overlay.apply_requested.connect(self._apply_recommended_gains)
+        self.graph_overlay.browse_requested.connect(self._browse_history)
+        self._update_prediction()
+
+        # Swing data is delivered by the serial dispatcher
+        if self.serial_connection is not None:
+            self.serial_connection.data_start.connect(self._on_data_start)
+            self.serial_connection.data_end.connect(self._on_data_end)
+            self.serial_connection.swing_rows.connect(self._on_swing_rows)
+
+            # Sweep runner drives the same dispatcher; its results are kept in an indexed CSV store
+            self.sweep_runner = SweepRunner(self.serial_connection, Config.SPRING_SWEEP_REST_S, self)
+            self.sweep_runner.run_started.connect(self._on_sweep_run_started)
+            self.sweep_runner.run_finished.connect(self._on_sweep_run_finished)
+            self.sweep_results = SweepResults(Config.SPRING_SWEEP_FILE)
+            pairs = [(K, D) for K in Config.SPRING_SWEEP_K for D in Config.SPRING_SWEEP_D]
+            self.sweep_overlay = SweepOverlay(self.sweep_runner, self.sweep_results, pairs, self)
+        else:
+            self.sweep_runner = None
+
     # Serial communication helpers
     def _write(self, text: str):
         """Low-level send. Falls back to console print when no port present."""
         if self.serial_connection is None:
             print("→", text.strip())
             return
-        self.serial_connection.write(text.encode())
-        self.serial_connection.flush()
+        self.serial_connection.send(text.encode())
 
     def _send_spring_constant(self, value: str):
         if self.animation_in_progress:
             return
         self._write(f"K{value}\n")
+        self.active_gains[0] = float(value)
 
     def _send_damping_gain(self, value: str):
         if self.animation_in_progress:
             return
         self._write(f"D{value}\n")
+        self.active_gains[1] = float(value)
+
+    def _update_prediction(self, *args):
+        """Show the model's swing for the gains currently on the pickers"""
+        times, positions = self.model.preview(self.spring_picker.value(), self.damping_picker.value(),
+                                              duration=self.live_plot.WINDOW_S)
+        self.live_plot.set_prediction(times, positions)
+
+    def _show_gain_map(self):
+        if self.animation_in_progress:
+            return
+        self.gain_map.show_map(self._gain_sweep(), self.spring_picker.value(), self.damping_picker.value())
+
+    def _gain_sweep(self):
+        """Predicted overshoot / settling over the picker range, simulated once per plant"""
+        plant = (self.model.gain, self.model.friction)
+        if plant not in self.gain_sweeps:
+            # One vectorised simulation of the whole picker range
+            self.gain_sweeps[plant] = self.model.sweep(self.SWEEP_K, self.SWEEP_D)
+        return self.gain_sweeps[plant]
+
+    def _on_gain_map_selected(self, K, D):
+        """Put the tapped gains on the pickers (press Add to send them)"""
+        self.spring_picker.set_value(K)
+        self.damping_picker.set_value(D)
+
+    def _show_sweep(self):
+        if self.animation_in_progress or self.sweep_runner is None:
+            return
+        if self.data_collection_active:
+            self._stop_data_collection()
+        self.sweep_overlay.show_sweep()
+
+    def _on_sweep_run_started(self, index, K, D):
+        """The runner has just sent these gains to the board"""
+        self.active_gains = [K, D]
+        self.swing_gains = (K, D)
+
+    def _on_sweep_run_finished(self, index, result):
+        """Sweep runs go into the swing history like any other test"""
+        if len(result["data"]):
+            self.history.append(result["data"], result["K"], result["D"], result["metrics"])
 
     def _send_test_parameters(self):
         if self.animation_in_progress:
@@ -275,14 +444,12 @@ class SpringDampenerPageWidget(QWidget):
         
         print("Test Parameters button pressed - sending Q command")  # Debug
         self.last_test_time = current_time
+        self.swing_gains = tuple(self.active_gains)
         
         # CRITICAL: Clear serial buffer before sending test command
         if self.serial_connection:
-            try:
-                self.serial_connection.reset_input_buffer()
-                print("Serial buffer cleared")  # Debug
-            except Exception as e:
-                print(f"Error clearing serial buffer: {e}")  # Debug
+            self.serial_connection.reset_input_buffer()
+            print("Serial buffer cleared")  # Debug
         
         self._write("Q\n")
         print("Sent Q command to Arduino")  # Debug
@@ -290,327 +457,130 @@ class SpringDampenerPageWidget(QWidget):
         self._start_data_collection()
         
     def _graph_swing_data(self):
-        """Read swing data from file and create a graph"""
+        """Graph the latest swing of the session (earlier ones are a tap on ◀ away)"""
         if self.animation_in_progress:
             print("Graph button pressed but animation in progress")  # Debug
             return
         
-        print("Graph button pressed - checking for data...")  # Debug
-        
-        try:
-            # Check if swingData.txt exists (try both current directory and project root)
-            swing_data_file = Path("swingData.txt")
-            if not swing_data_file.exists():
-                # Try project root directory
-                swing_data_file = Path(__file__).parent.parent / "swingData.txt"
-                if not swing_data_file.exists():
-                    print("swingData.txt file does not exist in current directory or project root")  # Debug
-                return
-            
-            print(f"swingData.txt exists at: {swing_data_file.absolute()}")  # Debug
-                
-            # Read the data
-            data = []
-            with open(swing_data_file, "r") as f:
-                for line_num, line in enumerate(f, 1):
-                    if line.strip() and "," in line:
-                        try:
-                            time_val, position_val = line.strip().split(",")
-                            data.append((float(time_val), float(position_val)))
-                        except ValueError:
-                            print(f"Error parsing line {line_num}: {line.strip()}")  # Debug
-                            continue
-            
-            print(f"Read {len(data)} data points from file")  # Debug
-            
-            if not data:
-                print("No valid data found in file")  # Debug
-                return
-                
-            print("Creating graph...")  # Debug
-            # Create the graph
-            self._create_swing_graph(data)
-            
-        except Exception as e:
-            print(f"Error in _graph_swing_data: {e}")  # Debug
+        if not len(self.history):
+            print("No swings recorded yet")  # Debug
+            return
+        self._show_history_run(len(self.history) - 1)
     
-    def _create_swing_graph(self, data):
-        """Create and display a professional step response graph for PID analysis"""
-        print(f"Creating professional step response graph with {len(data)} data points")  # Debug
+    def _show_history_run(self, index):
+        """Show one stored swing, with the runs before it overlaid (reuses the prebuilt overlay)"""
         try:
-            # Set matplotlib backend for PyQt6
-            import matplotlib
-            matplotlib.use('Qt5Agg')  # Use Qt5Agg backend for PyQt6 compatibility
-            import matplotlib.pyplot as plt
-            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-            from matplotlib.figure import Figure
-            import numpy as np
-            
-            print("Matplotlib imports successful")  # Debug
-            
-            # Clean up any existing graph overlay
-            if hasattr(self, 'graph_overlay') and self.graph_overlay:
-                print("Cleaning up existing graph overlay")  # Debug
-                self.graph_overlay.hide()
-                self.graph_overlay.deleteLater()
-                self.graph_overlay = None
-            
-            # Create overlay widget
-            self.graph_overlay = QWidget(self)
-            self.graph_overlay.setGeometry(0, 0, 800, 480)  # Full screen size
-            self.graph_overlay.setStyleSheet("""
-                QWidget {
-                    background-color: #002454;
-                    border: 2px solid #FAC01A;
-                }
-            """)
-            
-            # Create layout for overlay
-            overlay_layout = QVBoxLayout(self.graph_overlay)
-            overlay_layout.setContentsMargins(8, 8, 8, 8)
-            overlay_layout.setSpacing(5)  # Control spacing between widgets
-            
-            # Create title and metrics layout
-            title_metrics_layout = QHBoxLayout()
-            
-            # Create simple title
-            title_label = QLabel("Swing Analysis")
-            title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: #FAC01A;
-                    font: 600 18px 'Roboto';
-                    margin-bottom: 0px;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-            
-            # Create metrics box (will be populated with data later)
-            self.metrics_label = QLabel("Key Metrics:\nOvershoot: --\nSettling Time: --")
-            self.metrics_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font: 600 10px 'Roboto';
-                    background-color: #002454;
-                    border: 2px solid #FAC01A;
-                    border-radius: 6px;
-                    padding: 4px;
-                    min-width: 120px;
-                    max-width: 120px;
-                }
-            """)
-            self.metrics_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-            
-            # Add title and metrics to horizontal layout
-            title_metrics_layout.addWidget(title_label, 1)  # Title takes most space
-            title_metrics_layout.addWidget(self.metrics_label, 0)  # Metrics takes minimal space
-            
-            overlay_layout.addLayout(title_metrics_layout)
-            
-            # Create matplotlib figure with dark theme
-            fig = Figure(figsize=(9.2, 5.2), facecolor='#002454')
-            fig.subplots_adjust(bottom=0.15, left=0.15, right=0.95, top=0.92)  # More margin for axis labels
-            ax = fig.add_subplot(111, facecolor='#002454')
-            
-            # Extract time and position data
-            times = np.array([point[0] for point in data])
-            positions = np.array([point[1] for point in data])
+            run = self.history.run(index)
+            metrics = run["metrics"]
+            if metrics is None:
+                print(f"Run {index + 1} has too little movement to analyse")  # Debug
+                return
+            data = self.history.get(index)
+            print(f"Showing step response graph for run {index + 1} ({len(data)} data points)")  # Debug
             
-            if len(times) > 0 and len(positions) > 0:
-                # Clean and sort the data for linear presentation
-                data_pairs = list(zip(times, positions))
-                data_pairs.sort(key=lambda x: x[0])  # Sort by time
-                times_clean = np.array([pair[0] for pair in data_pairs])
-                positions_clean = np.array([pair[1] for pair in data_pairs])
-                
-                # Calculate analysis parameters
-                initial_pos = positions_clean[0]
-                final_pos = positions_clean[-1]
-                max_pos = np.max(positions_clean)
-                min_pos = np.min(positions_clean)
-                
-                # Detect swing endpoints by analyzing position changes
-                # Look for significant changes in position to identify swing transitions
-                position_diff = np.diff(positions_clean)
-                significant_changes = np.abs(position_diff) > (np.std(position_diff) * 2)
-                
-                # Find swing endpoints (where significant position changes occur)
-                swing_endpoints = []
-                if len(significant_changes) > 0:
-                    # Find indices where significant changes occur
-                    change_indices = np.where(significant_changes)[0]
-                    
-                    # Add the first significant change as a potential swing endpoint
-                    if len(change_indices) > 0:
-                        swing_endpoints.append((times_clean[change_indices[0]], positions_clean[change_indices[0]]))
-                    
-                    # Look for the end of the swing (where position stabilizes)
-                    # Find where the position stops changing significantly for a while
-                    stable_window = 10  # Look for stability over 10 data points
-                    if len(positions_clean) > stable_window:
-                        for i in range(len(positions_clean) - stable_window):
-                            window_positions = positions_clean[i:i+stable_window]
-                            if np.std(window_positions) < 0.5:  # Position is stable
-                                swing_endpoints.append((times_clean[i+stable_window//2], positions_clean[i+stable_window//2]))
-                                break
-                
-                # If no swing endpoints detected, use the end of data as the swing end
-                if len(swing_endpoints) == 0:
-                    swing_endpoints.append((times_clean[-1], positions_clean[-1]))
-                
-                # Calculate overshoot percentage (for step response)
-                if abs(final_pos - initial_pos) > 1.0:  # Only calculate if there's significant movement
-                    step_size = abs(final_pos - initial_pos)
-                    
-                    if final_pos > initial_pos:  # Positive step (moving up)
-                        # For positive step, overshoot is how much we go above the final value
-                        if max_pos > final_pos:
-                            overshoot = ((max_pos - final_pos) / step_size) * 100
-                        else:
-                            overshoot = 0
-                    else:  # Negative step (moving down)
-                        # For negative step, overshoot is how much we go below the final value
-                        if min_pos < final_pos:
-                            overshoot = ((final_pos - min_pos) / step_size) * 100
-                        else:
-                            overshoot = 0
-                else:
-                    overshoot = 0
-                
-                # Plot the clean step response with markers for data points
-                ax.plot(times_clean, positions_clean, '#FAC01A', linewidth=3, 
-                       marker='o', markersize=4, markevery=5, label='System Response', zorder=3)
-                
-                # Add swing endpoint indicators
-                if len(swing_endpoints) > 0:
-                    # Mark the first swing endpoint (start of significant movement)
-                    first_endpoint_time, first_endpoint_pos = swing_endpoints[0]
-                    ax.axvline(x=first_endpoint_time, color='#FF6B6B', linestyle='-', alpha=0.8, linewidth=2)
-                    ax.text(first_endpoint_time, ax.get_ylim()[1] * 0.95, 'Swing Start', 
-                           rotation=90, ha='right', va='top', color='#FF6B6B', fontsize=10, fontweight='bold',
-                           bbox=dict(boxstyle='round,pad=0.3', facecolor='#002454', edgecolor='#FF6B6B', alpha=0.8))
-                
-                # Mark the final swing endpoint (where swing ends/stabilizes)
-                final_endpoint_time, final_endpoint_pos = swing_endpoints[-1]
-                ax.axvline(x=final_endpoint_time, color='#4ECDC4', linestyle='-', alpha=0.8, linewidth=2)
-                ax.text(final_endpoint_time, ax.get_ylim()[1] * 0.85, 'Swing End', 
-                       rotation=90, ha='right', va='top', color='#4ECDC4', fontsize=10, fontweight='bold',
-                       bbox=dict(boxstyle='round,pad=0.3', facecolor='#002454', edgecolor='#4ECDC4', alpha=0.8))
-                
-                # Add reference lines for analysis
-                if abs(final_pos - initial_pos) > 1.0:
-                    # Final value line (target)
-                    ax.axhline(y=final_pos, color='#FF6B6B', linestyle='--', alpha=0.8, linewidth=2, label='Target')
-                    
-                    # Initial value line (starting position)
-                    ax.axhline(y=initial_pos, color='#4ECDC4', linestyle='--', alpha=0.8, linewidth=2, label='Start')
-                    
-                    # Overshoot line (shows the extreme point)
-                    if overshoot > 0:
-                        if final_pos > initial_pos:  # Positive step
-                            ax.axhline(y=max_pos, color='#FFE66D', linestyle=':', alpha=0.6, linewidth=1, label='Overshoot')
-                        else:  # Negative step
-                            ax.axhline(y=min_pos, color='#FFE66D', linestyle=':', alpha=0.6, linewidth=1, label='Overshoot')
-                
-                # Enhanced styling for professional appearance
-                ax.set_xlabel('Time (seconds)', color='white', fontsize=14, fontweight='bold')
-                ax.set_ylabel('Position (degrees)', color='white', fontsize=14, fontweight='bold')
-                
-                # Professional grid
-                ax.grid(True, alpha=0.3, color='white', linestyle='-', linewidth=0.5)
-                ax.set_axisbelow(True)
-                
-                # Style the axes
-                ax.tick_params(colors='white', labelsize=12)
-                ax.spines['bottom'].set_color('white')
-                ax.spines['top'].set_color('white') 
-                ax.spines['right'].set_color('white')
-                ax.spines['left'].set_color('white')
-                
-                # Update the metrics label with calculated values
-                metrics_text = f"""Key Metrics:
-Overshoot: {overshoot:.1f}%
-Settling Time: {times_clean[-1]:.1f}s"""
-                self.metrics_label.setText(metrics_text)
-                
-                # Compact professional legend
-                legend = ax.legend(loc='upper right', facecolor='#002454', edgecolor='#FAC01A', 
-                                    labelcolor='white', framealpha=0.9, fontsize=7, 
-                                    markerscale=0.8, handlelength=1.5, handletextpad=0.5)
-                legend.get_frame().set_linewidth(1.5)
-                
-                # Set clean axis limits
-                time_range = times_clean[-1] - times_clean[0]
-                pos_range = max_pos - min_pos
-                
-                ax.set_xlim(times_clean[0] - time_range * 0.02, times_clean[-1] + time_range * 0.02)
-                ax.set_ylim(min_pos - pos_range * 0.05, max_pos + pos_range * 0.05)
-                
-                # Set nice tick intervals
-                ax.xaxis.set_major_locator(plt.MaxNLocator(nbins=8))
-                ax.yaxis.set_major_locator(plt.MaxNLocator(nbins=6))
+            # Earlier runs as decimated, cached traces
+            overlays = []
+            for i in range(max(0, index - self.graph_overlay.HISTORY_CURVES), index):
+                earlier = self.history.run(i)
+                overlays.append((f"Run {i + 1}: K {earlier['K']:.1f}, D {earlier['D']:.0f}",
+                                 *self.history.decimated(i)))
             
-            # Add canvas to overlay
-            canvas = FigureCanvas(fig)
-            canvas.setStyleSheet("background-color: transparent; border: none;")
-            overlay_layout.addWidget(canvas)
+            self.graph_index = index
+            self.graph_overlay.show_swing(data[:, 0], data[:, 1], metrics, self._format_metrics(metrics), overlays)
+            stamp = time.strftime("%H:%M:%S", time.localtime(run["timestamp"]))
+            self.graph_overlay.set_run(f"Run {index + 1}/{len(self.history)} · K {run['K']:.1f}, D {run['D']:.0f} · {stamp}",
+                                       index > 0, index < len(self.history) - 1)
+            self._fit_swing(index)
             
-            # Create back button
-            back_button = QPushButton("Back")
-            back_button.setObjectName("GraphBackBtn")
-            back_button.setStyleSheet("""
-                QPushButton#GraphBackBtn {
-                    font: 600 16px 'Roboto';
-                    color: #FFFFFF;
-                    background-color: rgba(255,255,255,0.05);
-                    border: 2px solid #FAC01A;
-                    border-radius: 6px;
-                    padding: 8px 20px;
-                    min-width: 50px;
-                    max-width: 50px;
-                }
-                QPushButton#GraphBackBtn:hover {
-                    background-color: rgba(255,255,255,0.10);
-                }
-            """)
-            back_button.clicked.connect(self._close_graph_overlay)
-            overlay_layout.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
-            
-            # Show the overlay
-            print("Showing professional step response graph")  # Debug
-            self.graph_overlay.show()
-            self.graph_overlay.raise_()
-            print("Professional graph overlay displayed successfully")  # Debug
-            
-        except ImportError as e:
-            print(f"Import error creating graph: {e}")  # Debug
         except Exception as e:
             print(f"Error creating graph: {e}")  # Debug
     
-    def _close_graph_overlay(self):
-        """Close the graph overlay"""
-        if hasattr(self, 'graph_overlay') and self.graph_overlay:
-            self.graph_overlay.hide()
-            self.graph_overlay.deleteLater()
-            self.graph_overlay = None
+    def _browse_history(self, delta):
+        index = self.graph_index + delta
+        if 0 <= index < len(self.history):
+            self._show_history_run(index)
     
+    def _fit_swing(self, index):
+        """Fit the plant to a stored swing (once per run) and calibrate the model with it"""
+        run = self.history.run(index)
+        fit = self.plant_fits.get(index)
+        if index not in self.plant_fits or (fit is not None and (fit["gain"], fit["friction"]) not in self.gain_sweeps):
+            # Fitting and sweeping take seconds on the Pi: the trace is already up, the result follows
+            self.current_fit = None
+            self.graph_overlay.set_tuning("Fitting a model to this swing...", None)
+            if not self.fit_thread.isRunning():
+                self.fit_thread.fit(index, self.history.get(index).copy(), run["K"], run["D"], fit,
+                                    self.model, self.SWEEP_K, self.SWEEP_D)
+            return  # A run graphed while another is fitting is picked up when that one finishes
+        self.current_fit = None if fit is None else (fit, run["K"], run["D"])
+        if fit is None:
+            self.graph_overlay.set_tuning("Swing too small to fit a model", None)
+            return
+
+        if (fit["gain"], fit["friction"]) != (self.model.gain, self.model.friction):
+            self.model.gain, self.model.friction = fit["gain"], fit["friction"]  # Gain map and preview follow the fit
+            self._update_prediction()
+        self._update_recommendation(*self.current_fit)
+
+    def _on_swing_fitted(self, index, fit, sweep):
+        self.fit_thread.wait()  # Emitted at the very end of run(): let it finish so the next fit can start
+        self.plant_fits[index] = fit
+        print(f"Plant fitted for run {index + 1}: {fit}")  # Debug
+        if sweep is not None:
+            self.gain_sweeps[(fit["gain"], fit["friction"])] = sweep
+        if self.graph_overlay.isVisible() and 0 <= self.graph_index < len(self.history):
+            self._fit_swing(self.graph_index)  # The run on the graph now (fits it next if it changed)
+
+    def _update_recommendation(self, fit, K, D):
+        """Recommend gains for the settling target from the fitted model (fitted on a run with gains K, D)"""
+        text = (f"Fitted at K {K:.1f}, D {D:.0f}: "
+                f"gain {fit['gain']:.2f}, friction {fit['friction']:.2f} (fit error {fit['rms_deg']:.1f}°)\n")
+        recommendation = recommend_gains(self._gain_sweep(), self.target_settling)
+        if recommendation is None:
+            self.graph_overlay.set_tuning(text + "No gains in range settle without overshoot", None)
+            return
+        K, D, overshoot, settling = recommendation
+        met = "" if settling <= self.target_settling else " (fastest possible)"
+        text += f"Recommended: K {K:.1f}, D {D:.0f} → settles in {settling:.1f} s{met}, overshoot {overshoot:.1f}%"
+        self.graph_overlay.set_tuning(text, (K, D))
+
+    def _on_target_changed(self, seconds):
+        self.target_settling = seconds
+        if self.current_fit is not None:
+            self._update_recommendation(*self.current_fit)
+
+    def _apply_recommended_gains(self, K, D):
+        """Load the recommended gains onto the pickers and send them to the board"""
+        self.spring_picker.set_value(K)
+        self.damping_picker.set_value(D)
+        self._send_spring_constant(f"{K:.1f}")
+        self._send_damping_gain(str(int(D)))
+
+    @staticmethod
+    def _format_metrics(metrics):
+        """Key step-response metrics as label text ('--' where not measurable)"""
+        def fmt(value, unit, spec=".1f"):
+            return "--" if value is None else f"{value:{spec}}{unit}"
+        return (
+            "Key Metrics:\n"
+            f"Overshoot: {metrics['overshoot_pct']:.1f}%\n"
+            f"Rise (10-90%): {fmt(metrics['rise_time'], 's', '.2f')}\n"
+            f"Settling (2%): {fmt(metrics['settling_time_2'], 's')}\n"
+            f"Settling (5%): {fmt(metrics['settling_time_5'], 's')}\n"
+            f"Peak: {fmt(metrics['peak_time'], 's')}\n"
+            f"SS Error: {metrics['steady_state_error']:.1f}°\n"
+            f"Damping ζ: {fmt(metrics['damping_ratio'], '', '.2f')}\n"
+            f"ωn: {fmt(metrics['natural_freq'], ' rad/s', '.2f')}"
+        )
+
     def _start_data_collection(self):
         """Start collecting swing data from serial"""
         print("Starting data collection...")  # Debug
         self.data_collection_active = True
-        self.swing_data = []
+        self.swing_data.clear()
+        self.live_plot.reset()
         self.last_data_time = time.time()
         
-        # Set up a timer to check for incoming data
-        if hasattr(self, 'data_timer'):
-            self.data_timer.stop()
-        
-        self.data_timer = QTimer()
-        self.data_timer.timeout.connect(self._check_serial_data)
-        self.data_timer.start(100)  # Check every 100ms
-        print("Data collection timer started (checking every 100ms)")  # Debug
-        
         # Set up auto-save timer (saves data if no new data received for 5 seconds)
         if hasattr(self, 'auto_save_timer'):
             self.auto_save_timer.stop()
@@ -620,57 +590,29 @@ Settling Time: {times_clean[-1]:.1f}s"""
         self.auto_save_timer.start(1000)  # Check every 1 second
         print("Auto-save timer started (checking every 1s)")  # Debug
     
-    def _check_serial_data(self):
-        """Check for incoming serial data and collect swing position data"""
+    def _on_data_start(self):
+        """Start signal from the Arduino - begin a fresh swing"""
         if not self.data_collection_active:
             return
-            
-        if not self.serial_connection:
-            print("No serial connection available")  # Debug
+        self.swing_data.clear()  # Clear any previous data
+        self.live_plot.reset()
+        self.last_data_time = time.time()  # Reset timer
+        print("Data collection started")  # Debug
+
+    def _on_data_end(self):
+        """End signal from the Arduino - save what was collected"""
+        if not self.data_collection_active:
             return
-            
-        try:
-            # Check if data is available
-            if self.serial_connection.in_waiting > 0:
-                # Add timeout to prevent blocking
-                line = self.serial_connection.readline().decode('utf-8', errors='ignore').strip()
-                
-                # Debug: print ALL received lines to see what's coming in
-                print(f"Received: '{line}'")
-                
-                # Check for start signal
-                if line == "DATA_START":
-                    self.swing_data = []  # Clear any previous data
-                    self.last_data_time = time.time()  # Reset timer
-                    print("Data collection started")  # Debug
-                    return
-                
-                # Check for end signal
-                if line == "DATA_END":
-                    print(f"Data collection ended with {len(self.swing_data)} points")  # Debug
-                    self._stop_data_collection()
-                    return
-                
-                # Look for CSV format data (time,position) - skip header and empty lines
-                if ',' in line and not line.startswith('time') and line != "time,position" and line.strip():
-                    try:
-                        parts = line.split(',')
-                        if len(parts) == 2:
-                            time_val = parts[0].strip()
-                            position_val = parts[1].strip()
-                            time_float = float(time_val)
-                            position_float = float(position_val)
-                            
-                            # Store the data point
-                            self.swing_data.append((time_float, position_float))
-                            self.last_data_time = time.time()
-                            print(f"Stored data point: {time_float}, {position_float}")  # Debug
-                            
-                    except ValueError as e:
-                        print(f"Error parsing data line: {line}, error: {e}")  # Debug
-                        
-        except Exception as e:
-            print(f"Serial communication error: {e}")  # Debug
+        print(f"Data collection ended with {len(self.swing_data)} points")  # Debug
+        self._stop_data_collection()
+
+    def _on_swing_rows(self, rows):
+        """Store a batch of (time, position) rows of swing data and draw it live"""
+        if not self.data_collection_active:
+            return
+        self.swing_data.extend(rows)
+        self.live_plot.update_swing(self.swing_data.times, self.swing_data.positions)
+        self.last_data_time = time.time()
     
     def _check_auto_save(self):
         """Check if we should auto-save data after no new data for 10 seconds"""
@@ -680,29 +622,24 @@ Settling Time: {times_clean[-1]:.1f}s"""
         time_since_last_data = time.time() - self.last_data_time
         
         # If we have data and no new data for 10 seconds, auto-save (longer timeout for longer tests)
-        if self.swing_data and time_since_last_data > 10.0:
+        if len(self.swing_data) and time_since_last_data > 10.0:
             print(f"Auto-saving data after timeout with {len(self.swing_data)} points")  # Debug
             self._stop_data_collection()
     
     def _stop_data_collection(self):
-        """Stop collecting data and save to file"""
+        """Stop collecting data and add the swing to the session history"""
         self.data_collection_active = False
         
-        if hasattr(self, 'data_timer'):
-            self.data_timer.stop()
         if hasattr(self, 'auto_save_timer'):
             self.auto_save_timer.stop()
         
-        # Save collected data to swingData.txt
-        if self.swing_data:
+        if len(self.swing_data):
             try:
-                # Save to project root directory
-                swing_data_file = Path(__file__).parent.parent / "swingData.txt"
-                with open(swing_data_file, "w") as f:
-                    f.write("time,position\n")
-                    for time_val, position_val in self.swing_data:
-                        f.write(f"{time_val:.3f},{position_val:.3f}\n")
-                print(f"Saved {len(self.swing_data)} data points to {swing_data_file.absolute()}")  # Debug
+                data = self.swing_data.view()
+                data = data[np.argsort(data[:, 0], kind="stable")]  # Stored in time order
+                metrics = analyze_step(data[:, 0], data[:, 1])
+                index = self.history.append(data, *self.swing_gains, metrics)
+                print(f"Stored {len(data)} data points as run {index + 1}")  # Debug
             except Exception as e:
                 print(f"Error saving data: {e}")  # Debug
         else:
@@ -712,16 +649,14 @@ Settling Time: {times_clean[-1]:.1f}s"""
         """Called when Spring Dampener page is shown"""
         super().showEvent(event)
         # Stop any existing data collection when page is shown
+        if self.sweep_runner is not None and self.sweep_runner.is_running():
+            self.sweep_runner.stop()
         if hasattr(self, 'data_collection_active') and self.data_collection_active:
             self._stop_data_collection()
         
         # CRITICAL: Clear any pending serial data from previous pages
         if self.serial_connection:
-            try:
-                self.serial_connection.reset_input_buffer()
-                self.serial_connection.reset_output_buffer()
-            except:
-                pass
+            self.serial_connection.reset_input_buffer()
 
     def disable_all_buttons(self):
         """Disable all buttons during animations"""
@@ -738,7 +673,8 @@ Settling Time: {times_clean[-1]:.1f}s"""
     def go_back(self):
         if self.animation_in_progress:
             return
+        if self.sweep_runner is not None and self.sweep_runner.is_running():
+            self.sweep_runner.stop()
         # Send MAIN_MENU command to Arduino to reset it from AFM mode
-        self.serial_connection.write(b"M\n")
-        self.serial_connection.flush()
+        self.serial_connection.send(b"M\n")
         self.back_requested.emit()
\ No newline at end of file
@@ -0,0 +1,199 @@
+import pyqtgraph as pg
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
+
+
+class SweepOverlay(QWidget):
+    """
+    Full-screen view of an unattended K/D sweep: every run's trace overlaid on
+    one plot (the running one drawn live) and a table of results from the
+    indexed SweepResults store, best gains highlighted. Built once; a sweep is
+    driven by the SweepRunner it is given.
+    """
+
+    COLUMNS = [("K", "K", "{:.1f}"), ("D", "D", "{:.0f}"), ("OS %", "overshoot_pct", "{:.1f}"),
+               ("Settle s", "settling_time_2", "{:.1f}"), ("Rise s", "rise_time", "{:.2f}"),
+               ("SS err", "steady_state_error", "{:.1f}"), ("Status", "status", "{}")]
+    TRACE_COLORS = ["#4ECDC4", "#FF6B6B", "#FFE66D", "#A29BFE", "#55EFC4", "#FD79A8", "#74B9FF", "#FAB1A0"]
+
+    def __init__(self, runner, results, pairs, parent=None):
+        super().__init__(parent)
+        self.runner = runner
+        self.results = results
+        self.pairs = list(pairs)
+        self.traces = []
+
+        self.setGeometry(0, 0, 800, 480)  # Full screen size
+        self.setObjectName("SweepOverlay")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setStyleSheet("""
+            QWidget#SweepOverlay {
+                background-color: #002454;
+                border: 2px solid #FAC01A;
+            }
+            QLabel {
+                color: #FFFFFF;
+                font: 600 12px 'Roboto';
+                background-color: transparent;
+                border: none;
+            }
+            QLabel#SweepTitle {
+                color: #FAC01A;
+                font: 600 18px 'Roboto';
+            }
+            QPushButton {
+                font: 600 14px 'Roboto';
+                color: #FFFFFF;
+                background-color: rgba(255,255,255,0.05);
+                border: 2px solid #FAC01A;
+                border-radius: 6px;
+                padding: 6px 16px;
+            }
+            QPushButton:hover {
+                background-color: rgba(255,255,255,0.10);
+            }
+            QTableWidget {
+                color: #FFFFFF;
+                font: 11px 'Roboto';
+                background-color: #002454;
+                gridline-color: rgba(250,192,26,0.4);
+                border: 1px solid #FAC01A;
+            }
+            QHeaderView::section {
+                color: #FAC01A;
+                font: 600 11px 'Roboto';
+                background-color: #002454;
+                border: none;
+                padding: 2px;
+            }
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(5)
+
+        header = QHBoxLayout()
+        title = QLabel("Gain Sweep")
+        title.setObjectName("SweepTitle")
+        self.status_label = QLabel()
+        self.start_button = QPushButton("Start")
+        self.start_button.clicked.connect(self.toggle_sweep)
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear_results)
+        header.addWidget(title)
+        header.addWidget(self.status_label, 1)
+        header.addWidget(self.start_button)
+        header.addWidget(clear_button)
+        layout.addLayout(header)
+
+        body = QHBoxLayout()
+        self.graph = pg.PlotWidget()
+        self.graph.setBackground('#002454')
+        self.graph.showGrid(x=True, y=True, alpha=0.3)
+        self.graph.setMouseEnabled(x=False, y=False)
+        self.graph.hideButtons()
+        self.graph.setLabel("bottom", "Time (s)", color="#FFFFFF")
+        self.graph.setLabel("left", "Position (°)", color="#FFFFFF")
+        for axis in ("left", "bottom"):
+            self.graph.getAxis(axis).setPen("w")
+            self.graph.getAxis(axis).setTextPen("w")
+        self.live_curve = self.graph.plot(pen=pg.mkPen("#FAC01A", width=3))
+        body.addWidget(self.graph, 1)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([c[0] for c in self.COLUMNS])
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.table.setFixedWidth(380)
+        body.addWidget(self.table)
+        layout.addLayout(body, 1)
+
+        back_button = QPushButton("Back")
+        back_button.clicked.connect(self.close_sweep)
+        layout.addWidget(back_button, alignment=Qt.AlignmentFlag.AlignCenter)
+
+        runner.run_started.connect(self._on_run_started)
+        runner.rows_received.connect(self._on_rows)
+        runner.run_finished.connect(self._on_run_finished)
+        runner.sweep_finished.connect(self._on_sweep_finished)
+
+        self._show_idle_status()
+        self._fill_table()
+        self.hide()
+
+    def show_sweep(self):
+        self.show()
+        self.raise_()
+
+    def toggle_sweep(self):
+        if self.runner.is_running():
+            self.runner.stop()
+            return
+        for curve in self.traces:
+            self.graph.removeItem(curve)
+        self.traces = []
+        self.live_curve.setData([], [])
+        self.start_button.setText("Stop")
+        self.runner.start(self.pairs)
+
+    def clear_results(self):
+        if self.runner.is_running():
+            return
+        self.results.clear()
+        self._fill_table()
+
+    def _show_idle_status(self):
+        K = sorted({K for K, _ in self.pairs})
+        D = sorted({D for _, D in self.pairs})
+        self.status_label.setText(f"{len(self.pairs)} runs: K {', '.join(f'{k:g}' for k in K)} × "
+                                  f"D {', '.join(f'{d:g}' for d in D)}")
+
+    def _on_run_started(self, index, K, D):
+        self.status_label.setText(f"Run {index + 1}/{len(self.pairs)}: K {K:.1f}, D {D:.0f}")
+        self.live_curve.setData([], [])
+
+    def _on_rows(self):
+        data = self.runner.collector
+        self.live_curve.setData(data.times, data.positions)
+
+    def _on_run_finished(self, index, result):
+        self.results.add(result)
+        data = result["data"]
+        if len(data):
+            color = self.TRACE_COLORS[index % len(self.TRACE_COLORS)]
+            self.traces.append(self.graph.plot(data[:, 0], data[:, 1], pen=pg.mkPen(color, width=1)))
+        self.live_curve.setData([], [])
+        self._fill_table()
+
+    def _on_sweep_finished(self, completed):
+        self.start_button.setText("Start")
+        best = self.results.best()
+        done = "Sweep complete" if completed else "Sweep stopped"
+        if best is None:
+            self.status_label.setText(done)
+        else:
+            self.status_label.setText(f"{done} - best: K {best['K']:.1f}, D {best['D']:.0f} "
+                                      f"({best['settling_time_2']:.1f} s, {best['overshoot_pct']:.1f}%)")
+
+    def _fill_table(self):
+        """One row per (K, D), latest run first; the best row is highlighted"""
+        rows = self.results.latest()[::-1]
+        best = self.results.best()
+        self.table.setRowCount(len(rows))
+        for r, row in enumerate(rows):
+            for c, (_, key, spec) in enumerate(self.COLUMNS):
+                value = row[key]
+                item = QTableWidgetItem("--" if value is None else spec.format(value))
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                if row is best:
+                    item.setBackground(QColor(250, 192, 26, 90))
+                self.table.setItem(r, c, item)
+
+    def close_sweep(self):
+        if self.runner.is_running():
+            self.runner.stop()
+        self.hide()
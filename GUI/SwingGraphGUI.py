@@ -0,0 +1,381 @@
+import numpy as np
+import pyqtgraph as pg
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtCore import Qt, pyqtSignal
+from Data.SwingAnalysis import STEP_DEG
+
+
+class SwingGraphOverlay(QWidget):
+    """
+    Full-screen step response graph for the Spring Dampener page.
+
+    Built once and reused: every widget, curve and reference line is created
+    in the constructor, and show_swing() only pushes new data into them with
+    setData / setValue, so re-opening the graph after a new swing is instant.
+    Earlier runs from the swing history can be overlaid as faint curves (a
+    fixed pool of HISTORY_CURVES), and ◀ / ▶ browse through the history.
+    """
+
+    closed = pyqtSignal()
+    apply_requested = pyqtSignal(float, float)  # Recommended K, D
+    target_changed = pyqtSignal(float)          # Settling time target (s)
+    browse_requested = pyqtSignal(int)          # -1 = previous run, +1 = next run
+
+    TARGET_STEP_S = 0.5
+    HISTORY_CURVES = 3
+    HISTORY_COLORS = ["#A29BFE", "#55EFC4", "#FD79A8"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setGeometry(0, 0, 800, 480)  # Full screen size
+        self.setObjectName("SwingGraphOverlay")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setStyleSheet("""
+            QWidget#SwingGraphOverlay {
+                background-color: #002454;
+                border: 2px solid #FAC01A;
+            }
+            QLabel#TuningLabel {
+                color: white;
+                font: 600 11px 'Roboto';
+                background-color: transparent;
+                border: none;
+            }
+            QPushButton#TuningBtn {
+                font: 600 14px 'Roboto';
+                color: #FFFFFF;
+                background-color: rgba(255,255,255,0.05);
+                border: 2px solid #FAC01A;
+                border-radius: 6px;
+                padding: 6px 10px;
+            }
+            QPushButton#TuningBtn:hover {
+                background-color: rgba(255,255,255,0.10);
+            }
+            QPushButton#TuningBtn:disabled {
+                color: #7F8FA6;
+                border-color: #7F8FA6;
+            }
+        """)
+
+        overlay_layout = QVBoxLayout(self)
+        overlay_layout.setContentsMargins(8, 8, 8, 8)
+        overlay_layout.setSpacing(5)
+
+        # Title and metrics
+        title_metrics_layout = QHBoxLayout()
+
+        self.prev_button = self._tuning_button("◀", lambda: self.browse_requested.emit(-1))
+        self.next_button = self._tuning_button("▶", lambda: self.browse_requested.emit(+1))
+
+        title_label = self.title_label = QLabel("Swing Analysis")
+        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title_label.setStyleSheet("""
+            QLabel {
+                color: #FAC01A;
+                font: 600 16px 'Roboto';
+                background-color: transparent;
+                border: none;
+            }
+        """)
+
+        self.metrics_label = QLabel("Key Metrics:\nOvershoot: --\nSettling Time: --")
+        self.metrics_label.setStyleSheet("""
+            QLabel {
+                color: white;
+                font: 600 10px 'Roboto';
+                background-color: #002454;
+                border: 2px solid #FAC01A;
+                border-radius: 6px;
+                padding: 4px;
+                min-width: 150px;
+                max-width: 150px;
+            }
+        """)
+        self.metrics_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+
+        title_metrics_layout.addWidget(self.prev_button, 0)
+        title_metrics_layout.addWidget(title_label, 1)
+        title_metrics_layout.addWidget(self.next_button, 0)
+        title_metrics_layout.addWidget(self.metrics_label, 0)
+        overlay_layout.addLayout(title_metrics_layout)
+
+        # Plot
+        self.graph = pg.GraphicsLayoutWidget()
+        self.graph.setBackground('#002454')
+        overlay_layout.addWidget(self.graph, stretch=1)
+
+        self.plot = self.graph.addPlot()
+        self.plot.showGrid(x=True, y=True, alpha=0.3)
+        self.plot.setMouseEnabled(x=False, y=False)
+        self.plot.hideButtons()
+        label_style = {"color": "#FFFFFF", "font-size": "12pt", "font-weight": "bold"}
+        self.plot.setLabel("bottom", "Time (seconds)", **label_style)
+        self.plot.setLabel("left", "Position (degrees)", **label_style)
+        for axis in ("left", "bottom"):
+            self.plot.getAxis(axis).setPen("w")
+            self.plot.getAxis(axis).setTextPen("w")
+
+        legend = self.plot.addLegend(offset=(-10, 10), labelTextColor="w",
+                                     brush=pg.mkBrush("#002454"), pen=pg.mkPen("#FAC01A", width=1.5))
+        legend.setLabelTextSize("7pt")
+
+        # Curves and reference lines (created once, updated per swing)
+        self.history_curves = [self.plot.plot(pen=pg.mkPen(color, width=1.5)) for color in self.HISTORY_COLORS]
+        self.response_curve = self.plot.plot(pen=pg.mkPen("#FAC01A", width=3), name="System Response")
+        self.response_markers = self.plot.plot(pen=None, symbol="o", symbolSize=6,
+                                               symbolBrush="#FAC01A", symbolPen=None)
+
+        self.target_line = self._add_line(0, "#FF6B6B", Qt.PenStyle.DashLine, 2, "Target")
+        self.start_line = self._add_line(0, "#4ECDC4", Qt.PenStyle.DashLine, 2, "Start")
+        self.overshoot_line = self._add_line(0, "#FFE66D", Qt.PenStyle.DotLine, 1, "Overshoot")
+
+        self.swing_start_line = self._add_marker("Swing Start", "#FF6B6B", 0.80)
+        self.swing_end_line = self._add_marker("Swing End", "#4ECDC4", 0.65)
+
+        # Auto-tuning row: fitted plant, target settling time, recommended gains
+        bottom_row = QHBoxLayout()
+        self.tuning_label = QLabel("")
+        self.tuning_label.setObjectName("TuningLabel")
+        self.tuning_label.setWordWrap(True)
+        bottom_row.addWidget(self.tuning_label, 1)
+
+        self.target = 2.0
+        minus_btn = self._tuning_button("−", lambda: self._change_target(-self.TARGET_STEP_S))
+        self.target_label = QLabel()
+        self.target_label.setObjectName("TuningLabel")
+        plus_btn = self._tuning_button("+", lambda: self._change_target(+self.TARGET_STEP_S))
+        self.apply_button = self._tuning_button("Apply", self._apply)
+        self.apply_button.setEnabled(False)
+        self.recommended = None
+        for widget in (minus_btn, self.target_label, plus_btn, self.apply_button):
+            bottom_row.addWidget(widget)
+
+        # Back button
+        back_button = QPushButton("Back")
+        back_button.setObjectName("GraphBackBtn")
+        back_button.setStyleSheet("""
+            QPushButton#GraphBackBtn {
+                font: 600 16px 'Roboto';
+                color: #FFFFFF;
+                background-color: rgba(255,255,255,0.05);
+                border: 2px solid #FAC01A;
+                border-radius: 6px;
+                padding: 8px 20px;
+                min-width: 50px;
+                max-width: 50px;
+            }
+            QPushButton#GraphBackBtn:hover {
+                background-color: rgba(255,255,255,0.10);
+            }
+        """)
+        back_button.clicked.connect(self.close_graph)
+        bottom_row.addWidget(back_button)
+        overlay_layout.addLayout(bottom_row)
+        self._show_target()
+
+        self.hide()
+
+    def _tuning_button(self, text, slot):
+        button = QPushButton(text)
+        button.setObjectName("TuningBtn")
+        button.clicked.connect(slot)
+        return button
+
+    def _add_line(self, y, color, style, width, name):
+        """Horizontal reference line that also shows up in the legend"""
+        pen = pg.mkPen(color, width=width, style=style)
+        line = pg.InfiniteLine(pos=y, angle=0, pen=pen)
+        self.plot.addItem(line)
+        # InfiniteLines do not get legend entries, so add an empty curve with the same pen
+        self.plot.legend.addItem(pg.PlotDataItem(pen=pen), name)
+        return line
+
+    def _add_marker(self, text, color, label_pos):
+        """Vertical event marker with a boxed label"""
+        line = pg.InfiniteLine(angle=90, pen=pg.mkPen(color, width=2),
+                               label=text, labelOpts={"position": label_pos, "color": color,
+                                                      "fill": "#002454", "rotateAxis": (1, 0)})
+        self.plot.addItem(line)
+        return line
+
+    def show_swing(self, times, positions, metrics, metrics_text, history=()):
+        """
+        Push a new swing into the existing plot items and show the overlay.
+        history: up to HISTORY_CURVES (label, times, positions) of earlier runs to overlay.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        positions = np.asarray(positions, dtype=np.float64)
+
+        history = list(history)[-self.HISTORY_CURVES:]
+        for i, curve in enumerate(self.history_curves):
+            self.plot.legend.removeItem(curve)
+            if i < len(history):
+                label, t, y = history[i]
+                curve.setData(t, y)
+                curve.show()
+                self.plot.legend.addItem(curve, label)
+            else:
+                curve.setData([], [])
+                curve.hide()
+
+        self.response_curve.setData(times, positions)
+        self.response_markers.setData(times[::5], positions[::5])
+
+        self.target_line.setValue(metrics["setpoint"])
+        self.start_line.setValue(metrics["initial"])
+        self.overshoot_line.setValue(metrics["peak"])
+        self.overshoot_line.setVisible(metrics["overshoot_pct"] > 0)
+        self.swing_start_line.setValue(metrics["swing_start"])
+        self.swing_end_line.setValue(metrics["stable_time"])
+
+        self.metrics_label.setText(metrics_text)
+
+        # Clean axis limits (include the setpoint so the target line is visible)
+        max_pos = max([positions.max(), metrics["setpoint"]] + [y.max() for _, _, y in history])
+        min_pos = min([positions.min(), metrics["setpoint"]] + [y.min() for _, _, y in history])
+        time_range = times[-1] - times[0]
+        pos_range = max_pos - min_pos
+        self.plot.setXRange(times[0] - time_range * 0.02, times[-1] + time_range * 0.02, padding=0)
+        self.plot.setYRange(min_pos - pos_range * 0.05, max_pos + pos_range * 0.05, padding=0)
+
+        self.show()
+        self.raise_()
+
+    def set_run(self, text, has_previous, has_next):
+        """Which history run is on screen, and whether ◀ / ▶ lead anywhere"""
+        self.title_label.setText(f"Swing Analysis\n{text}")
+        self.prev_button.setEnabled(has_previous)
+        self.next_button.setEnabled(has_next)
+
+    def set_target(self, seconds):
+        self.target = seconds
+        self._show_target()
+
+    def _show_target(self):
+        self.target_label.setText(f"Settle in\n{self.target:.1f} s")
+
+    def _change_target(self, delta):
+        target = max(self.TARGET_STEP_S, self.target + delta)
+        if target != self.target:
+            self.set_target(target)
+            self.target_changed.emit(target)
+
+    def set_tuning(self, text, recommended):
+        """Fit / recommendation text, and the (K, D) Apply would send (None disables it)"""
+        self.tuning_label.setText(text)
+        self.recommended = recommended
+        self.apply_button.setEnabled(recommended is not None)
+
+    def _apply(self):
+        if self.recommended is not None:
+            self.apply_requested.emit(*self.recommended)
+
+    def close_graph(self):
+        self.hide()
+        self.closed.emit()
+
+
+class LiveSwingPlot(pg.PlotWidget):
+    """
+    Small plot that draws a swing while its rows are still arriving.
+
+    Fed from the page's SwingCollector after every batch, so nothing is
+    re-read from disk. The setpoint line is placed from the first row
+    (start + STEP_DEG) and the overshoot readout keeps a running peak, so
+    each update only looks at the rows that are new since the last one.
+    A dashed model prediction (set_prediction) is drawn underneath, relative
+    to wherever the arm starts.
+    """
+
+    WINDOW_S = 30.0  # The firmware stops logging 30 s after Q
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(260, 140)
+        self.setBackground('#002454')
+        self.showGrid(x=True, y=True, alpha=0.3)
+        self.setMouseEnabled(x=False, y=False)
+        self.hideButtons()
+        self.setMenuEnabled(False)
+        for axis in ("left", "bottom"):
+            self.getAxis(axis).setPen("w")
+            self.getAxis(axis).setTextPen("w")
+        self.getAxis("left").setWidth(32)
+
+        self.prediction_curve = self.plot(pen=pg.mkPen("#4ECDC4", width=1, style=Qt.PenStyle.DashLine))
+        self.prediction = None
+        self.curve = self.plot(pen=pg.mkPen("#FAC01A", width=2))
+        self.setpoint_line = pg.InfiniteLine(angle=0, pen=pg.mkPen("#FF6B6B", width=1, style=Qt.PenStyle.DashLine))
+        self.addItem(self.setpoint_line)
+
+        self.overshoot_text = pg.TextItem(color="w", anchor=(0, 0))
+        self.overshoot_text.setParentItem(self.getPlotItem().vb)
+        self.overshoot_text.setPos(4, 2)
+
+        self.reset()
+
+    def reset(self):
+        """Clear the plot for a new swing"""
+        self.n_drawn = 0
+        self.t0 = None
+        self.initial = None
+        self.peak = None
+        self.curve.setData([], [])
+        self.setpoint_line.hide()
+        self.overshoot_text.setText("Waiting for swing...")
+        self.setXRange(0, self.WINDOW_S, padding=0)
+        self._draw_prediction()
+        self._fit_y_range()
+
+    def set_prediction(self, times, positions):
+        """Predicted swing (times from 0, positions relative to the start) - drawn dashed"""
+        self.prediction = (np.asarray(times), np.asarray(positions))
+        self._draw_prediction()
+        self._fit_y_range()
+
+    def _draw_prediction(self):
+        if self.prediction is None:
+            return
+        times, positions = self.prediction
+        self.prediction_curve.setData(times, positions + (self.initial or 0.0))
+
+    def _fit_y_range(self):
+        """Show the start, the setpoint, the swing so far and the prediction"""
+        initial = self.initial or 0.0
+        top, bottom = initial + STEP_DEG, initial
+        if self.peak is not None:
+            top, bottom = max(top, self.peak), min(bottom, self.low)
+        if self.prediction is not None:
+            top = max(top, initial + float(self.prediction[1].max()))
+            bottom = min(bottom, initial + float(self.prediction[1].min()))
+        self.setYRange(bottom, top, padding=0.05)
+
+    def update_swing(self, times, positions):
+        """Redraw with the rows collected so far (times, positions are the collector's columns)"""
+        n = len(times)
+        if n == 0 or n == self.n_drawn:
+            return
+        if self.t0 is None:
+            # First rows of the swing: fix the start and the target
+            self.t0 = float(times[0])
+            self.initial = float(positions[0])
+            self.peak = self.initial
+            self.low = self.initial
+            self.setpoint_line.setValue(self.initial + STEP_DEG)
+            self.setpoint_line.show()
+            self._draw_prediction()
+
+        # Running extremes only need the new rows
+        new = positions[self.n_drawn:]
+        self.peak = max(self.peak, float(new.max()))
+        self.low = min(self.low, float(new.min()))
+        self.n_drawn = n
+
+        self.curve.setData(times - self.t0, positions)
+
+        overshoot = max(0.0, (self.peak - self.initial) / STEP_DEG * 100.0 - 100.0)
+        self.overshoot_text.setText(f"Overshoot: {overshoot:.1f}%")
+        self._fit_y_range()
+        if times[-1] - self.t0 > self.WINDOW_S:
+            self.setXRange(0, float(times[-1] - self.t0), padding=0)
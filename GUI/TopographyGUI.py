@@ -1,20 +1,22 @@
-import os
 import numpy as np
 import pyqtgraph as pg
 import matplotlib.cm as cm
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+import Config
 
-TRIAL_FILE = "trials.txt"
-MAX_VALUES_PER_TRIAL = 300
-MAX_TRIALS = 10
+MAX_VALUES_PER_TRIAL = Config.AFM_TRIAL_SAMPLES
+MAX_TRIALS = Config.AFM_MAX_TRIALS
 
 
 class TopographyPageWidget(QWidget):
     back_requested = pyqtSignal()
 
-    def __init__(self, parent=None):
+    def __init__(self, trials, parent=None):
         super().__init__(parent)
+
+        # Shared TrialMatrixModel - the AFM page records into it
+        self.trials = trials
         
         # Animation state tracking
         self.animation_in_progress = False
@@ -54,8 +56,21 @@ class TopographyPageWidget(QWidget):
         cmap = cm.get_cmap("Greens")
         self.green_lut = (cmap(np.linspace(0, 1, 256)) * 255).astype(np.ubyte)
 
+        self.img_item.setLookupTable(self.green_lut)
+
+        # Normalised image (one column per trial), updated a column at a time
+        self.image = np.full((MAX_VALUES_PER_TRIAL, MAX_TRIALS), np.nan, dtype=np.float32)
+        self.render_pending = False
+
         self._set_trial_ticks()
         self.load_data()
+
+        # Only the affected trial is re-normalised when the model changes,
+        # including the trial currently being recorded
+        self.trials.trial_added.connect(self._update_column)
+        self.trials.trial_updated.connect(self._update_column)
+        self.trials.trial_removed.connect(self._on_trial_removed)
+        self.trials.trials_cleared.connect(self._on_trials_cleared)
     
     def disable_all_buttons(self):
         """Disable all buttons during animations"""
@@ -70,46 +85,49 @@ class TopographyPageWidget(QWidget):
             button.setEnabled(True)
 
     def load_data(self):
-        try:
-            if not os.path.exists(TRIAL_FILE):
-                raise FileNotFoundError("trials.txt not found")
-
-            arr = np.genfromtxt(TRIAL_FILE, delimiter=",", dtype=float,
-                                filling_values=np.nan)
-
-            if arr.size == 0 or np.isnan(arr).all():
-                raise ValueError("No valid numbers in trials.txt")
-
-            if arr.ndim == 1:
-                arr = arr.reshape(1, -1)
-
-            # Crop/pad to fixed frame
-            arr = arr[:MAX_TRIALS, :MAX_VALUES_PER_TRIAL]
-            if arr.shape[1] < MAX_VALUES_PER_TRIAL:
-                pad = MAX_VALUES_PER_TRIAL - arr.shape[1]
-                arr = np.hstack([arr, np.full((arr.shape[0], pad), np.nan)])
-            if arr.shape[0] < MAX_TRIALS:
-                pad = MAX_TRIALS - arr.shape[0]
-                arr = np.vstack([arr, np.full((pad, arr.shape[1]), np.nan)])
-
-            # Normalize data
-            row_max = arr.max(axis=1, keepdims=True)
-            row_max[row_max == 0] = 1.0
-            norm = arr / row_max
-
-            # rotate so trials run along X
-            img = norm.T                         # shape (100, 4)
-            self.img_item.setLookupTable(self.green_lut)
-            self.img_item.setImage(img, autoLevels=False, levels=(0, 1))
-
-            # Display image
-            self.img_item.setLookupTable(self.green_lut)
-            self.img_item.setImage(img, autoLevels=True)
-
-        except Exception:
-            # Clear the image when file is empty or invalid
-            empty_img = np.full((MAX_VALUES_PER_TRIAL, MAX_TRIALS), np.nan)
-            self.img_item.setImage(empty_img, autoLevels=True)
+        """Rebuild the whole image from the trial model (incremental updates use _update_column)"""
+        self.image[:] = np.nan
+        for row in range(min(len(self.trials), MAX_TRIALS)):
+            self._update_column(row, render=False)
+        if self.trials.pending and len(self.trials) < MAX_TRIALS:
+            self._update_column(len(self.trials), render=False)
+        self._schedule_render()
+
+    def _update_column(self, row, render=True):
+        """Re-normalise a single trial into its image column"""
+        if row >= MAX_TRIALS:
+            return
+        values = self.trials.row(row)[:MAX_VALUES_PER_TRIAL]
+        column = self.image[:, row]
+        column[:] = np.nan
+        if not np.isnan(values).all():
+            # Normalise each trial by its own peak
+            row_max = np.nanmax(values)
+            if row_max == 0:
+                row_max = 1.0
+            column[:len(values)] = values / row_max
+        if render:
+            self._schedule_render()
+
+    def _on_trial_removed(self, row):
+        if row < MAX_TRIALS:
+            self.image[:, row] = np.nan
+            self._schedule_render()
+
+    def _on_trials_cleared(self):
+        self.image[:] = np.nan
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """Coalesce any number of column updates into one setImage"""
+        if not self.render_pending:
+            self.render_pending = True
+            QTimer.singleShot(0, self._render)
+
+    def _render(self):
+        self.render_pending = False
+        # Trials run along X; levels are fixed since every column is normalised to 0..1
+        self.img_item.setImage(self.image, autoLevels=False, levels=(0, 1))
 
     def _set_trial_ticks(self):
         """
@@ -122,5 +140,5 @@ class TopographyPageWidget(QWidget):
         axis.setTicks(ticks)
         axis.setTickSpacing(1, 1)
 
-    def refresh(self):
+    def refresh(self, *args):
         self.load_data()
@@ -27,8 +27,14 @@ from GUI.referencePageGUI import ReferencePageWidget
 from Animation.StartupAnimation import StartupAnimation
 from Animation.GraphingLineAnimation import GraphingLineAnimation
 from Animation.PowerPongTransitionAnimation import PowerPongTransitionAnimation
+from Animation.PaddleSpriteCache import PaddleSpriteCache
+from Animation.CircleTransition import CircleTransition
 from Animation.SpringDampenerAnimation import SpringDampenerAnimation
 from Animation.HapticFeedbackAnimation import HapticFeedbackAnimation
+from Comms.SerialDispatcher import SerialDispatcher
+from Data.TrialStore import TrialStore
+from Data.TrialModel import TrialMatrixModel
+from Data.SwingHistory import SwingHistory
 
 
 class MainWindow(QMainWindow):
@@ -54,6 +60,14 @@ class MainWindow(QMainWindow):
         else:
             self.ser = serial.Serial(self.PORT, self.BAUD, timeout=1)
 
+        # Single reader for the shared port - pages subscribe to its signals
+        # instead of polling the port themselves
+        self.serial = SerialDispatcher(self.ser, self)
+        self.serial.start()
+
+        # Pre-render the Power Pong paddle frames in the background while the startup animation plays
+        PaddleSpriteCache.preload()
+
         self.setWindowTitle("Interactive Demo Kit")
 
         # Window configuration
@@ -63,6 +77,9 @@ class MainWindow(QMainWindow):
 
         # Page container
         self.stack = QStackedWidget(self)
+
+        # Circle wipe shared by every page (a child of the window, so it outlives setCentralWidget)
+        self.circle_transition = CircleTransition(self)
         
         # Main window styling
         self.setStyleSheet("""
@@ -74,6 +91,14 @@ class MainWindow(QMainWindow):
         # Animation state tracking
         self.animation_in_progress = False
         
+        # AFM trials shared by the AFM and Topography pages (saved to disk in the background)
+        self.trials = TrialMatrixModel(TrialStore(Config.AFM_TRIAL_FILE, Config.AFM_TRIAL_SAMPLES),
+                                       Config.AFM_MAX_TRIALS, self)
+
+        # Spring Dampener swings of this session (kept across visits to the page, started fresh on launch)
+        self.swing_history = SwingHistory(Config.SPRING_HISTORY_FILE)
+        self.swing_history.clear()
+
         # Clear data files on startup
         self.clear_data_files()
         
@@ -116,6 +141,14 @@ class MainWindow(QMainWindow):
         """Create all main menu pages and set up navigation"""
 
 
+        # page 0 - main menu
+        self.menu_page = MenuPage(self.serial, self, self.circle_transition)  # Pass self (MainWindow) as parent
+        self.stack.addWidget(self.menu_page)
+
+        # page 1 - AFM live-plot
+        self.afm_page = AfmPageWidget(self.serial, self.trials, self.circle_transition)
+        self.stack.addWidget(self.afm_page)
+
         # navigation wiring (connects the buttons to the transition functions)
         self.menu_page.afm_btn.clicked.connect(self.show_afm_transition)
         self.menu_page.pwrpng_btn.clicked.connect(self.show_power_pong_transition)
@@ -125,18 +158,9 @@ class MainWindow(QMainWindow):
             lambda: self.complete_afm_back_transition()
         )
 
-        # page 0 - main menu
-        self.menu_page = MenuPage(self.ser, self)  # Pass self (MainWindow) as parent
-        self.stack.addWidget(self.menu_page)
-
-        # page 1 - AFM live-plot
-        self.afm_page = AfmPageWidget(self.ser)
-        self.stack.addWidget(self.afm_page)
-
         # page 2 → Topography
-        self.topo_page = TopographyPageWidget()
+        self.topo_page = TopographyPageWidget(self.trials)
         self.stack.addWidget(self.topo_page)
-        self.afm_page.map_requested.connect(self.topo_page.refresh)
         self.afm_page.map_requested.connect(
             lambda: self.stack.setCurrentWidget(self.topo_page)
         )
@@ -155,17 +179,17 @@ class MainWindow(QMainWindow):
         )
 
         # page 4 → Power-Pong
-        self.power_pong_page = PowerPongPageWidget(self.ser)
+        self.power_pong_page = PowerPongPageWidget(self.serial, self.circle_transition)
         self.stack.addWidget(self.power_pong_page)
         self.power_pong_page.back_requested.connect(self.complete_power_pong_back_transition)
 
         # page 5 → Haptic Feedback
-        self.haptic_feedback_page = HapticFeedbackPageWidget(self.ser)
+        self.haptic_feedback_page = HapticFeedbackPageWidget(self.serial, self.circle_transition)
         self.stack.addWidget(self.haptic_feedback_page)
         self.haptic_feedback_page.back_requested.connect(self.haptic_feedback_back)
 
         # page 6 → Spring Dampener Tuning Page
-        self.spring_dampener_page = SpringDampenerPageWidget(self.ser)
+        self.spring_dampener_page = SpringDampenerPageWidget(self.serial, self.swing_history)
         self.stack.addWidget(self.spring_dampener_page)
         self.spring_dampener_page.back_requested.connect(self.spring_dampener_back)
     
@@ -186,19 +210,9 @@ class MainWindow(QMainWindow):
             self.menu_page.spgdmp_btn.setEnabled(True)
     
     def clear_data_files(self):
-        """Clear swingData.txt and trials.txt files once we go back to the main menu"""
-        data_files = ["swingData.txt", "trials.txt"]
-        for filename in data_files:
-            try:
-                if os.path.exists(filename):
-                    with open(filename, 'w') as f:
-                        f.write("")  # Clear the file content
-            except Exception:
-                pass  # Silently ignore any file operation errors
-        
-        # Refresh topography page to show empty state
-        if hasattr(self, 'topo_page') and self.topo_page:
-            self.topo_page.refresh()
+        """Clear the AFM trial store once we go back to the main menu (the swing history lasts the whole session)"""
+        # The topography page redraws itself from the cleared signal
+        self.trials.clear()
         
     def show_afm_transition(self):
         """Show AFM transition animation before switching to AFM page"""
@@ -207,10 +221,10 @@ class MainWindow(QMainWindow):
             
         self.animation_in_progress = True
         self.disable_all_buttons()
+        self.circle_transition.stop()  # The page transition takes over the screen
         
         # Send AFM command to Arduino immediately (A = AFM mode)
-        self.ser.write(b"A\n")
-        self.ser.flush()
+        self.serial.send(b"A\n")
         
         # Create graphing line animation
         self.afm_transition = GraphingLineAnimation()
@@ -243,11 +257,7 @@ class MainWindow(QMainWindow):
     def complete_afm_back_transition(self):
         """Called when coming back from AFM page to main menu"""
         # CRITICAL: Clear serial buffers to prevent conflicts
-        try:
-            self.ser.reset_input_buffer()
-            self.ser.reset_output_buffer()
-        except:
-            pass
+        self.serial.reset_input_buffer()
         
         # Clear data files when returning to main menu
         self.clear_data_files()
@@ -265,10 +275,11 @@ class MainWindow(QMainWindow):
             
         self.animation_in_progress = True
         self.disable_all_buttons()
+        self.circle_transition.stop()  # The page transition takes over the screen
         
         # Send Power Pong command to Arduino immediately (P = Power Pong mode)
-        self.ser.write(b"P\n")
-        self.ser.flush()
+        self.serial.send(b"P\n")
+        self.power_pong_page.expect_setup()
         
         # Create Power Pong transition animation
         self.power_pong_transition = PowerPongTransitionAnimation()
@@ -317,13 +328,13 @@ class MainWindow(QMainWindow):
             
         self.animation_in_progress = True
         self.disable_all_buttons()
+        self.circle_transition.stop()  # The page transition takes over the screen
         
         # Clear any leftover serial data from previous modes
-        self.ser.reset_input_buffer()
+        self.serial.reset_input_buffer()
         
         # Send Spring Dampener command to Arduino immediately (S = Spring Dampener mode)
-        self.ser.write(b"S\n")
-        self.ser.flush()
+        self.serial.send(b"S\n")
         
         # Create Spring Dampener transition animation
         self.spring_dampener_transition = SpringDampenerAnimation()
@@ -359,13 +370,13 @@ class MainWindow(QMainWindow):
             
         self.animation_in_progress = True
         self.disable_all_buttons()
+        self.circle_transition.stop()  # The page transition takes over the screen
         
         # Clear any leftover serial data from previous modes
-        self.ser.reset_input_buffer()
+        self.serial.reset_input_buffer()
         
         # Send Haptic Feedback command to Arduino immediately (H = Haptic Feedback mode)
-        self.ser.write(b"H\n")
-        self.ser.flush()
+        self.serial.send(b"H\n")
         
         # Create Haptic Feedback transition animation
         self.haptic_feedback_transition = HapticFeedbackAnimation()
@@ -422,6 +433,14 @@ class MainWindow(QMainWindow):
         # Switch back to main menu
         self.stack.setCurrentWidget(self.menu_page)
 
+    def closeEvent(self, event):
+        """Stop reading the port before the window goes away"""
+        self.serial.stop()
+        self.trials.shutdown()
+        if self.spring_dampener_page is not None:
+            self.spring_dampener_page.fit_thread.wait()  # A swing fit finishing in the background
+        super().closeEvent(event)
+
 
 def main():
     app = QApplication(sys.argv)